@@ -42,5 +42,6 @@ For the convenience, a local `.env` file can be used to configure the settings o
     IXMP4_CLIENT__RETRIES=3
     IXMP4_CLIENT__TIMEOUT=30
     IXMP4_CLIENT__SECRET_HS256=None
+    IXMP4_CLIENT__WIRE_FORMAT=arrow
 
 """
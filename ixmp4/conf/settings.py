@@ -5,7 +5,14 @@ import sys
 from pathlib import Path
 from typing import Any, Literal
 
-from pydantic import Field, HttpUrl, SecretStr, field_validator, model_validator
+from pydantic import (
+    Field,
+    HttpUrl,
+    ImportString,
+    SecretStr,
+    field_validator,
+    model_validator,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from toolkit.client.auth import ManagerAuth, SelfSignedAuth
 from toolkit.manager.client import ManagerClient
@@ -34,7 +41,8 @@ class ClientSettings(BaseSettings):
     ----------
 
     default_upload_chunk_size: int
-        Number of records uploaded per client chunk (currently unused).
+        Number of dataframe rows sent per request by chunked uploads
+        (e.g. when adding IAMC data to a run).
         Environment variable: ``IXMP4_CLIENT__DEFAULT_UPLOAD_CHUNK_SIZE``.
     concurrency: int
         Maximum number of concurrent client workers.
@@ -48,12 +56,22 @@ class ClientSettings(BaseSettings):
     secret_hs256: int
         Shared secret used for self-signed client authentication.
         Environment variable: ``IXMP4_CLIENT__SECRET_HS256``.
+    wire_format: Literal["arrow", "json"]
+        Preferred encoding for dataframes sent to and received from the server.
+        Falls back to JSON if ``pyarrow`` is not installed or the server
+        does not support Arrow IPC.
+        Environment variable: ``IXMP4_CLIENT__WIRE_FORMAT``.
+    response_cache_size: int
+        Maximum total size in bytes of the responses kept to revalidate
+        repeated reads with the server, ``0`` disables the cache.
+        Environment variable: ``IXMP4_CLIENT__RESPONSE_CACHE_SIZE``.
     """
 
     default_upload_chunk_size: int = Field(
         10_000,
         description=(
-            "Number of records uploaded per client chunk (currently unused). "
+            "Number of dataframe rows sent per request by chunked uploads "
+            "(e.g. when adding IAMC data to a run). "
             "Environment variable: IXMP4_CLIENT__DEFAULT_UPLOAD_CHUNK_SIZE."
         ),
     )
@@ -86,6 +104,231 @@ class ClientSettings(BaseSettings):
             "Environment variable: IXMP4_CLIENT__SECRET_HS256."
         ),
     )
+    wire_format: Literal["arrow", "json"] = Field(
+        "arrow",
+        description=(
+            "Preferred encoding for dataframes sent to and received from the server. "
+            "Falls back to JSON if `pyarrow` is not installed or the server "
+            "does not support Arrow IPC. "
+            "Environment variable: IXMP4_CLIENT__WIRE_FORMAT."
+        ),
+    )
+    response_cache_size: int = Field(
+        100_000_000,
+        ge=0,
+        description=(
+            "Maximum total size in bytes of the responses kept to revalidate "
+            "repeated reads with the server, `0` disables the cache. "
+            "Environment variable: IXMP4_CLIENT__RESPONSE_CACHE_SIZE."
+        ),
+    )
+
+
+class DatabasePoolSettings(BaseSettings):
+    """Connection pool settings for PostgreSQL databases.
+
+    Attributes
+    ----------
+
+    poolclass: Literal["null", "static", "queue"]
+        ``null`` opens a new connection for every session, ``static`` shares
+        a single connection between all sessions and ``queue`` keeps up to
+        ``size`` connections open for reuse.
+        Environment variable: ``IXMP4_[SERVER__]DATABASE_POOL__POOLCLASS``.
+    size: int
+        Number of connections kept open by a ``queue`` pool.
+        Environment variable: ``IXMP4_[SERVER__]DATABASE_POOL__SIZE``.
+    max_overflow: int
+        Number of connections a ``queue`` pool opens in addition to ``size``
+        under load, these are closed once returned to the pool.
+        Environment variable: ``IXMP4_[SERVER__]DATABASE_POOL__MAX_OVERFLOW``.
+    recycle: int
+        Number of seconds after which pooled connections are replaced,
+        ``-1`` keeps them open indefinitely.
+        Environment variable: ``IXMP4_[SERVER__]DATABASE_POOL__RECYCLE``.
+    pre_ping: bool
+        Whether to test pooled connections for liveness before using them.
+        Environment variable: ``IXMP4_[SERVER__]DATABASE_POOL__PRE_PING``.
+    timeout: int
+        Number of seconds to wait for a connection of an exhausted pool.
+        Environment variable: ``IXMP4_[SERVER__]DATABASE_POOL__TIMEOUT``.
+    """
+
+    poolclass: Literal["null", "static", "queue"] = Field(
+        "static",
+        description=(
+            "`null` opens a new connection for every session, `static` shares "
+            "a single connection between all sessions and `queue` keeps up to "
+            "`size` connections open for reuse. "
+            "Environment variable: IXMP4_[SERVER__]DATABASE_POOL__POOLCLASS."
+        ),
+    )
+    size: int = Field(
+        5,
+        ge=1,
+        description=(
+            "Number of connections kept open by a `queue` pool. "
+            "Environment variable: IXMP4_[SERVER__]DATABASE_POOL__SIZE."
+        ),
+    )
+    max_overflow: int = Field(
+        10,
+        ge=0,
+        description=(
+            "Number of connections a `queue` pool opens in addition to `size` "
+            "under load, these are closed once returned to the pool. "
+            "Environment variable: IXMP4_[SERVER__]DATABASE_POOL__MAX_OVERFLOW."
+        ),
+    )
+    recycle: int = Field(
+        1800,
+        ge=-1,
+        description=(
+            "Number of seconds after which pooled connections are replaced, "
+            "`-1` keeps them open indefinitely. "
+            "Environment variable: IXMP4_[SERVER__]DATABASE_POOL__RECYCLE."
+        ),
+    )
+    pre_ping: bool = Field(
+        True,
+        description=(
+            "Whether to test pooled connections for liveness before using them. "
+            "Environment variable: IXMP4_[SERVER__]DATABASE_POOL__PRE_PING."
+        ),
+    )
+    timeout: int = Field(
+        30,
+        ge=0,
+        description=(
+            "Number of seconds to wait for a connection of an exhausted pool. "
+            "Environment variable: IXMP4_[SERVER__]DATABASE_POOL__TIMEOUT."
+        ),
+    )
+
+
+class ServerDatabasePoolSettings(DatabasePoolSettings):
+    """Connection pool settings for the PostgreSQL databases of a server,
+    pools connections between requests by default."""
+
+    poolclass: Literal["null", "static", "queue"] = Field(
+        "queue",
+        description=(
+            "`null` opens a new connection for every session, `static` shares "
+            "a single connection between all sessions and `queue` keeps up to "
+            "`size` connections open for reuse. "
+            "Environment variable: IXMP4_SERVER__DATABASE_POOL__POOLCLASS."
+        ),
+    )
+
+
+class DatabaseVersioningSettings(BaseSettings):
+    """Versioning settings for PostgreSQL databases.
+
+    Attributes
+    ----------
+
+    group_transactions: bool
+        Whether the version triggers record all changes made within one
+        database transaction under a single transaction id instead of one
+        transaction id per statement.
+        Environment variable:
+        ``IXMP4_[SERVER__]DATABASE_VERSIONING__GROUP_TRANSACTIONS``.
+    """
+
+    group_transactions: bool = Field(
+        False,
+        description=(
+            "Whether the version triggers record all changes made within one "
+            "database transaction under a single transaction id instead of one "
+            "transaction id per statement. Environment variable: "
+            "IXMP4_[SERVER__]DATABASE_VERSIONING__GROUP_TRANSACTIONS."
+        ),
+    )
+
+
+class ResultCacheSettings(BaseSettings):
+    """Settings for the server-side cache of list and tabulate results.
+
+    Cached results are invalidated as soon as a new transaction is recorded or
+    a database transaction that was in progress when they were cached ends,
+    which is only tracked for PostgreSQL platforms. Results of sqlite
+    platforms are never cached.
+
+    Attributes
+    ----------
+
+    enabled: bool
+        Whether to cache results at all.
+        Environment variable: ``IXMP4_SERVER__RESULT_CACHE__ENABLED``.
+    backend: Literal["memory"] | ImportString
+        ``memory`` keeps results in a least-recently-used cache local to each
+        server process. To share results between processes, pass the import
+        path of a :class:`~ixmp4.data.services.procedure.cache.ResultCacheBackend`
+        subclass, e.g. ``package.module:RedisBackend``.
+        Environment variable: ``IXMP4_SERVER__RESULT_CACHE__BACKEND``.
+    url: str | None
+        Connection url passed to shared backends.
+        Environment variable: ``IXMP4_SERVER__RESULT_CACHE__URL``.
+    max_entries: int
+        Number of results kept by the ``memory`` backend.
+        Environment variable: ``IXMP4_SERVER__RESULT_CACHE__MAX_ENTRIES``.
+    max_entry_size: int
+        Size in bytes above which results are not cached.
+        Environment variable: ``IXMP4_SERVER__RESULT_CACHE__MAX_ENTRY_SIZE``.
+    ttl: int
+        Number of seconds after which results expire regardless of new
+        transactions, this bounds how long changed user permissions go unnoticed.
+        Environment variable: ``IXMP4_SERVER__RESULT_CACHE__TTL``.
+    """
+
+    enabled: bool = Field(
+        False,
+        description=(
+            "Whether to cache results at all. "
+            "Environment variable: IXMP4_SERVER__RESULT_CACHE__ENABLED."
+        ),
+    )
+    backend: Literal["memory"] | ImportString[Any] = Field(
+        "memory",
+        description=(
+            "`memory` keeps results in a least-recently-used cache local to each "
+            "server process. To share results between processes, pass the import "
+            "path of a `ResultCacheBackend` subclass. "
+            "Environment variable: IXMP4_SERVER__RESULT_CACHE__BACKEND."
+        ),
+    )
+    url: str | None = Field(
+        None,
+        description=(
+            "Connection url passed to shared backends. "
+            "Environment variable: IXMP4_SERVER__RESULT_CACHE__URL."
+        ),
+    )
+    max_entries: int = Field(
+        256,
+        ge=1,
+        description=(
+            "Number of results kept by the `memory` backend. "
+            "Environment variable: IXMP4_SERVER__RESULT_CACHE__MAX_ENTRIES."
+        ),
+    )
+    max_entry_size: int = Field(
+        16_000_000,
+        ge=0,
+        description=(
+            "Size in bytes above which results are not cached. "
+            "Environment variable: IXMP4_SERVER__RESULT_CACHE__MAX_ENTRY_SIZE."
+        ),
+    )
+    ttl: int = Field(
+        300,
+        ge=1,
+        description=(
+            "Number of seconds after which results expire regardless of new "
+            "transactions. "
+            "Environment variable: IXMP4_SERVER__RESULT_CACHE__TTL."
+        ),
+    )
 
 
 class ServerSettings(BaseSettings):
@@ -112,6 +355,22 @@ class ServerSettings(BaseSettings):
     log_exceptions: Literal["never", "always", "debug"]
         Whether to write exception tracebacks to the server log.
         Environment variable: ``IXMP4_SERVER__LOG_EXCEPTIONS``.
+    database_execution: Literal["sync", "async"]
+        ``sync`` runs every request in a worker thread, ``async`` runs requests
+        to PostgreSQL platforms against an async engine on the event loop so
+        waiting for the database does not occupy a thread. CPU-bound work of
+        the services, e.g. validating dataframes, still blocks the event loop.
+        Environment variable: ``IXMP4_SERVER__DATABASE_EXECUTION``.
+    database_pool: ServerDatabasePoolSettings
+        Connection pool used for the PostgreSQL databases of all platforms,
+        pools connections between requests by default.
+        Environment variables: ``IXMP4_SERVER__DATABASE_POOL__*``.
+    database_versioning: DatabaseVersioningSettings
+        Versioning of the PostgreSQL databases of all platforms.
+        Environment variables: ``IXMP4_SERVER__DATABASE_VERSIONING__*``.
+    result_cache: ResultCacheSettings
+        Cache for the results of list and tabulate requests, disabled by default.
+        Environment variables: ``IXMP4_SERVER__RESULT_CACHE__*``.
     """
 
     manager_url: HttpUrl | None = Field(
@@ -157,6 +416,38 @@ class ServerSettings(BaseSettings):
             "Environment variable: IXMP4_SERVER__LOG_EXCEPTIONS."
         ),
     )
+    database_execution: Literal["sync", "async"] = Field(
+        "sync",
+        description=(
+            "`sync` runs every request in a worker thread, `async` runs requests "
+            "to PostgreSQL platforms against an async engine on the event loop so "
+            "waiting for the database does not occupy a thread. CPU-bound work of "
+            "the services, e.g. validating dataframes, still blocks the event loop. "
+            "Environment variable: IXMP4_SERVER__DATABASE_EXECUTION."
+        ),
+    )
+    database_pool: ServerDatabasePoolSettings = Field(
+        default_factory=ServerDatabasePoolSettings,
+        description=(
+            "Connection pool used for the PostgreSQL databases of all platforms, "
+            "pools connections between requests by default. "
+            "Environment variables: IXMP4_SERVER__DATABASE_POOL__*."
+        ),
+    )
+    database_versioning: DatabaseVersioningSettings = Field(
+        default_factory=DatabaseVersioningSettings,
+        description=(
+            "Versioning of the PostgreSQL databases of all platforms. "
+            "Environment variables: IXMP4_SERVER__DATABASE_VERSIONING__*."
+        ),
+    )
+    result_cache: ResultCacheSettings = Field(
+        default_factory=ResultCacheSettings,
+        description=(
+            "Cache for the results of list and tabulate requests, disabled by "
+            "default. Environment variables: IXMP4_SERVER__RESULT_CACHE__*."
+        ),
+    )
 
     @model_validator(mode="after")
     def setup(self) -> "ServerSettings":
@@ -211,6 +502,12 @@ class Settings(BaseSettings):
         Environment variables: ``IXMP4_SERVER__*``.
     client: Nested client configuration namespace.
         Environment variables: ``IXMP4_CLIENT__*``.
+    database_pool: Connection pool used by direct connections to PostgreSQL
+        databases.
+        Environment variables: ``IXMP4_DATABASE_POOL__*``.
+    database_versioning: Versioning of PostgreSQL databases connected to
+        directly.
+        Environment variables: ``IXMP4_DATABASE_VERSIONING__*``.
     """
 
     mode: Literal["production"] | Literal["development"] | Literal["debug"] = Field(
@@ -257,6 +554,20 @@ class Settings(BaseSettings):
             "Environment variables: IXMP4_CLIENT__*."
         ),
     )
+    database_pool: DatabasePoolSettings = Field(
+        default_factory=DatabasePoolSettings,
+        description=(
+            "Connection pool used by direct connections to PostgreSQL databases. "
+            "Environment variables: IXMP4_DATABASE_POOL__*."
+        ),
+    )
+    database_versioning: DatabaseVersioningSettings = Field(
+        default_factory=DatabaseVersioningSettings,
+        description=(
+            "Versioning of PostgreSQL databases connected to directly. "
+            "Environment variables: IXMP4_DATABASE_VERSIONING__*."
+        ),
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="ixmp4_",
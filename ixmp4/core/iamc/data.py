@@ -1,4 +1,7 @@
-from typing import TYPE_CHECKING, TypeVar
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Iterator, cast
 
 import numpy as np
 import pandas as pd
@@ -6,12 +9,18 @@ import pandas as pd
 # TODO Import this from typing when dropping Python 3.11
 from typing_extensions import Unpack
 
+from ixmp4.base_exceptions import InvalidDataFrame
+from ixmp4.conf.settings import ClientSettings, Settings
 from ixmp4.data.backend import Backend
 from ixmp4.data.iamc.datapoint.filter import (
     FacadeDataPointFilter,
     facade_to_data_filter,
 )
 from ixmp4.data.iamc.datapoint.type import Type
+from ixmp4.data.iamc.measurand.exceptions import MeasurandNotFound
+from ixmp4.data.region.exceptions import RegionNotFound
+from ixmp4.data.run.dto import Run as RunDto
+from ixmp4.transport import DirectTransport, HttpxTransport
 
 from ..base import BaseBackendFacade
 from .variable import VariableServiceFacade
@@ -19,14 +28,10 @@ from .variable import VariableServiceFacade
 if TYPE_CHECKING:
     from ixmp4.core import run
 
+logger = logging.getLogger(__name__)
 
-class IamcDataFacade(object):
-    _MAP_STEP_COLUMN = {
-        "ANNUAL": "step_year",
-        "CATEGORICAL": "step_year",
-        "DATETIME": "step_datetime",
-    }
 
+class IamcDataFacade(object):
     @staticmethod
     def _rename_arg_cols(df: pd.DataFrame) -> pd.DataFrame:
         return df.rename(
@@ -39,19 +44,41 @@ class IamcDataFacade(object):
         )
 
     @staticmethod
-    def _split_time_col(df: pd.DataFrame) -> pd.DataFrame:
+    def _get_year_mask(time: "pd.Series[Any]") -> "pd.Series[bool]":
+        if pd.api.types.is_integer_dtype(time.dtype):
+            return time.notna()
+        if pd.api.types.is_datetime64_any_dtype(time.dtype) or isinstance(
+            time.dtype, pd.StringDtype
+        ):
+            return pd.Series(False, index=time.index)
+
+        # check the type of each value once per distinct type instead of
+        # calling `isinstance` for every row
+        value_types = time.astype("object").map(type)
+        year_types = [
+            t for t in value_types.unique() if issubclass(t, (int, np.integer))
+        ]
+        return value_types.isin(year_types)
+
+    @classmethod
+    def _split_time_col(cls, df: pd.DataFrame) -> pd.DataFrame:
         time = df["time"]
-        is_year = time.apply(lambda x: isinstance(x, (int, np.integer)))
+        is_year = cls._get_year_mask(time)
 
         if is_year.any():
-            df["year"] = pd.Series(np.nan, index=df.index, dtype="object")
-            df.loc[is_year, "year"] = time.loc[is_year]
+            df["year"] = time if is_year.all() else time.astype("object").where(is_year)
 
         if not is_year.all():
             df["datetime"] = pd.to_datetime(time.where(~is_year), errors="coerce")
 
         return df.drop(columns=["time"])
 
+    @staticmethod
+    def _get_step_values(df: pd.DataFrame, column: str) -> "np.ndarray[Any, Any]":
+        if column not in df.columns:
+            return np.full(len(df), None, dtype=object)
+        return df[column].to_numpy(dtype=object)
+
     @classmethod
     def _convert_to_std_format(
         cls, df: pd.DataFrame, join_runs: bool, join_run_id: bool
@@ -62,13 +89,13 @@ class IamcDataFacade(object):
             df.rename(columns={"step_year": "year"}, inplace=True)
             time_col = "year"
         else:
-            T = TypeVar("T", bool, float, int, str)
-
-            def map_step_column(df: "pd.Series[T]") -> "pd.Series[T]":
-                df["time"] = df[cls._MAP_STEP_COLUMN[str(df.type)]]
-                return df
-
-            df = df.apply(map_step_column, axis=1)
+            # pick the step column of each row's type for the whole column
+            is_datetime = (df["type"] == Type.DATETIME).to_numpy()
+            df["time"] = np.where(
+                is_datetime,
+                cls._get_step_values(df, "step_datetime"),
+                cls._get_step_values(df, "step_year"),
+            )
             time_col = "time"
 
         columns = []
@@ -83,6 +110,36 @@ class IamcDataFacade(object):
             columns += ["subannual"]
         return df[columns + ["value"]]
 
+    @staticmethod
+    def _get_batch_columns(join_runs: bool, join_run_id: bool) -> list[str]:
+        columns = ["run__id"] if join_run_id else []
+        if join_runs:
+            columns += ["model", "scenario", "version"]
+        return columns + [
+            "region",
+            "variable",
+            "unit",
+            "year",
+            "subannual",
+            "datetime",
+            "value",
+        ]
+
+    @staticmethod
+    def _convert_to_batch_format(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+        # every batch gets the same columns and dtypes, whatever the types
+        # of its datapoints, so batches can be written one after the other
+        df = df.rename(
+            columns={
+                "step_year": "year",
+                "step_category": "subannual",
+                "step_datetime": "datetime",
+            }
+        ).reindex(columns=columns)
+        return df.astype(
+            {"year": "Int64", "subannual": "object", "datetime": "datetime64[ns]"}
+        )
+
 
 class RunIamcData(BaseBackendFacade, IamcDataFacade):
     """IAMC data linked to a :class:`ixmp4.core.run.Run`.
@@ -107,21 +164,6 @@ class RunIamcData(BaseBackendFacade, IamcDataFacade):
         super().__init__(backend)
         self._run = run
 
-    def _get_or_create_ts(self, df: pd.DataFrame) -> pd.DataFrame:
-        id_cols = ["region", "variable", "unit", "run__id"]
-        # upsert set of unqiue timeseries
-        ts_df = df[id_cols].drop_duplicates()
-        self._backend.iamc.timeseries.bulk_upsert(ts_df)
-
-        # retrieve them again to get database ids
-        ts_df = self._backend.iamc.timeseries.tabulate_by_df(ts_df)
-        ts_df = ts_df.rename(columns={"id": "time_series__id"})
-
-        # merge on the identity columns
-        return pd.merge(df, ts_df, how="left", on=id_cols, suffixes=(None, "_y")).drop(
-            columns=id_cols
-        )  # tada, df with 'time_series__id' added from the database.
-
     def add(self, df: pd.DataFrame, type: Type | str | None = None) -> None:
         """Adds IAMC data from a data frame to a run.
 
@@ -184,14 +226,35 @@ class RunIamcData(BaseBackendFacade, IamcDataFacade):
             df = self._split_time_col(df)
         df = self._rename_arg_cols(df)
         df["run__id"] = self._run.id
-        df = self._get_or_create_ts(df)
 
         if type is not None:
             if isinstance(type, str):
                 type = Type[type.upper()]
             df["type"] = type
 
-        self._backend.iamc.datapoints.bulk_upsert(df)
+        dimension_ids = self._backend.iamc.dimension_ids
+        name_columns = dimension_ids.name_columns
+        if (
+            df.empty
+            or not set(name_columns).issubset(df.columns)
+            or df[name_columns].isna().any(axis=None)
+        ):
+            # leave reporting invalid data frames to the server
+            self._backend.iamc.datapoints.ingest(df)
+            return
+
+        # regions and measurands are referenced by cached ids where possible,
+        # the server resolves the remaining names and creates the timeseries
+        resolved, unresolved = dimension_ids.merge_ids(df)
+        if not unresolved.empty:
+            self._backend.iamc.datapoints.ingest(unresolved)
+        if not resolved.empty:
+            try:
+                self._backend.iamc.datapoints.ingest(resolved)
+            except (RegionNotFound, MeasurandNotFound):
+                # a cached id was deleted in the meantime
+                dimension_ids.invalidate()
+                self._backend.iamc.datapoints.ingest(df)
 
     def remove(self, df: pd.DataFrame, type: Type | str | None = None) -> None:
         """Removes IAMC data matching a data frame from a run.
@@ -245,14 +308,13 @@ class RunIamcData(BaseBackendFacade, IamcDataFacade):
             df = self._split_time_col(df)
         df = self._rename_arg_cols(df)
         df["run__id"] = self._run.id
-        # NOTE: This creates ts and deletes them right after
-        df = self._get_or_create_ts(df)
         if type is not None:
             if isinstance(type, str):
                 type = Type[type.upper()]
             df["type"] = type
 
-        self._backend.iamc.datapoints.bulk_delete(df)
+        # timeseries are resolved by the server without creating any
+        self._backend.iamc.datapoints.bulk_remove(df)
 
     def tabulate(
         self,
@@ -293,15 +355,70 @@ class RunIamcData(BaseBackendFacade, IamcDataFacade):
         )
         return self._convert_to_std_format(df, join_runs=False, join_run_id=False)
 
+    def iter_tabulate(
+        self,
+        *,
+        batch_size: int = 5000,
+        **kwargs: Unpack[FacadeDataPointFilter],
+    ) -> Iterator[pd.DataFrame]:
+        r"""Tabulates datapoints by specified criteria in batches.
+
+        Unlike :meth:`tabulate`, the datapoints are never held in memory
+        all at once.
+
+        .. code:: python
+
+            for i, df in enumerate(run.iamc.iter_tabulate(batch_size=10_000)):
+                df.to_csv("export.csv", mode="a", header=i == 0, index=False)
+
+        Parameters
+        ----------
+        batch_size: int, optional
+            Maximum number of rows per data frame. Default: ``5000``
+        \*\*kwargs: any
+            Filter parameters as specified in :class:`FacadeDataPointFilter`.
+
+        Yields
+        ------
+        :class:`pandas.DataFrame`:
+            Data frames with the same columns, whatever the types of their
+            datapoints:
+                - region
+                - variable
+                - unit
+                - year
+                - subannual
+                - datetime
+                - value
+
+            Columns which do not apply to the type of a datapoint are empty.
+        """
+
+        kwargs["run"] = {"id": self._run.id, "default_only": False}
+        columns = self._get_batch_columns(join_runs=False, join_run_id=False)
+        for df in self._backend.iamc.datapoints.iter_tabulate(
+            batch_size,
+            join_parameters=True,
+            join_runs=False,
+            **facade_to_data_filter(kwargs),
+        ):
+            yield self._convert_to_batch_format(df, columns)
+
 
 class PlatformIamcData(BaseBackendFacade, IamcDataFacade):
     """IAMC data on a platform."""
 
     variables: VariableServiceFacade
+    settings: ClientSettings
 
-    def __init__(self, backend: Backend) -> None:
+    def __init__(
+        self, backend: Backend, settings: ClientSettings | None = None
+    ) -> None:
         super().__init__(backend)
         self.variables = VariableServiceFacade(backend)
+        if settings is None:
+            settings = Settings().client
+        self.settings = settings
 
     def tabulate(
         self,
@@ -350,3 +467,278 @@ class PlatformIamcData(BaseBackendFacade, IamcDataFacade):
         return self._convert_to_std_format(
             df, join_runs=join_runs, join_run_id=join_run_id
         )
+
+    def iter_tabulate(
+        self,
+        *,
+        batch_size: int = 5000,
+        join_runs: bool = True,
+        join_run_id: bool = False,
+        **kwargs: Unpack[FacadeDataPointFilter],
+    ) -> Iterator[pd.DataFrame]:
+        r"""Tabulates datapoints by specified criteria in batches.
+
+        Unlike :meth:`tabulate`, the datapoints are never held in memory
+        all at once, which allows exporting the data of entire platforms.
+
+        .. code:: python
+
+            for i, df in enumerate(platform.iamc.iter_tabulate(batch_size=10_000)):
+                df.to_csv("export.csv", mode="a", header=i == 0, index=False)
+
+        Parameters
+        ----------
+        batch_size: int, optional
+            Maximum number of rows per data frame. Default: ``5000``
+        \*\*kwargs: any
+            Filter parameters as specified in :class:`FacadeDataPointFilter`.
+
+        Yields
+        ------
+        :class:`pandas.DataFrame`:
+            Data frames with the same columns, whatever the types of their
+            datapoints:
+                - run__id (if ``join_run_id``)
+                - model, scenario, version (if ``join_runs``)
+                - region
+                - variable
+                - unit
+                - year
+                - subannual
+                - datetime
+                - value
+
+            Columns which do not apply to the type of a datapoint are empty.
+        """
+
+        columns = self._get_batch_columns(join_runs=join_runs, join_run_id=join_run_id)
+        for df in self._backend.iamc.datapoints.iter_tabulate(
+            batch_size,
+            join_parameters=True,
+            join_runs=join_runs,
+            join_run_id=join_run_id,
+            **facade_to_data_filter(kwargs),
+        ):
+            yield self._convert_to_batch_format(df, columns)
+
+    def add(
+        self,
+        df: pd.DataFrame,
+        type: Type | str | None = None,
+        message: str = "Add IAMC data",
+        max_workers: int | None = None,
+    ) -> dict[tuple[Any, ...], Exception]:
+        """Adds IAMC data of multiple runs from a data frame.
+
+        The rows are grouped into runs by their ``model``, ``scenario`` and, if
+        the column is present, ``version``. Without a ``version`` column a new
+        run is created for every model and scenario. The data of each run is
+        added in its own ``run.transact(message)``, so every run is locked and
+        gets a checkpoint.
+
+        Runs are loaded concurrently by up to `max_workers` threads when
+        connected to an ixmp4 server or to a PostgreSQL database with a
+        ``queue`` or ``null`` connection pool, otherwise one after the other.
+        Runs adding new variables or measurands are loaded first so they are
+        not created concurrently.
+
+        A run that fails does not abort the others, its exception is returned.
+
+        .. code:: python
+
+            import pandas as pd
+
+            input_df = pd.DataFrame({
+                "model": ["Model 1", "Model 2"],
+                "scenario": ["Scenario", "Scenario"],
+                "version": [1, 1],
+                "region": ["World", "World"],
+                "variable": ["Emissions|CO2", "Emissions|CO2"],
+                "unit": ["MtCO2/yr", "MtCO2/yr"],
+                "year": [2020, 2020],
+                "value": [36.5, 37.1],
+            })
+
+            failures = platform.iamc.add(input_df, type="ANNUAL")
+            #> {}
+
+        Parameters
+        ----------
+        df : :class:`pandas.DataFrame`
+            A data frame with the columns described in
+            :meth:`ixmp4.core.iamc.data.RunIamcData.add` and:
+                - model
+                - scenario
+                - version (optional)
+        type: :class:`ixmp4.data.iamc.datapoint.type.Type` or str, optional
+            Will be set as the type for all provided data points.
+        message: str, optional
+            The message of the checkpoint created for every run.
+        max_workers: int, optional
+            Maximum number of runs loaded concurrently. Defaults to the client
+            concurrency setting of the platform (``IXMP4_CLIENT__CONCURRENCY``).
+
+        Returns
+        -------
+        dict
+            The exception raised for every run that could not be loaded, keyed
+            by its ``(model, scenario[, version])``. Empty if all runs were
+            loaded.
+
+        Raises
+        ------
+        :class:`ixmp4.core.exceptions.InvalidDataFrame`
+            If the ``model`` or ``scenario`` column is missing or the
+            ``model``, ``scenario`` or ``version`` of any row is missing.
+        """
+        # imported here to avoid a circular import
+        from ixmp4.core.run import Run
+
+        run_columns = self._get_run_columns(df)
+        groups = {
+            key: rows.drop(columns=run_columns)
+            for key, rows in df.groupby(run_columns, sort=False, dropna=False)
+        }
+        failures: dict[tuple[Any, ...], Exception] = {}
+
+        # runs are created one after the other,
+        # new models and scenarios would be created concurrently otherwise
+        run_dtos: dict[tuple[Any, ...], RunDto] = {}
+        for key in groups:
+            try:
+                if "version" in run_columns:
+                    run_dtos[key] = self._get_run(key)
+                else:
+                    run_dtos[key] = self._create_run(key)
+            except Exception as e:
+                failures[key] = e
+
+        backends = self._get_worker_backends(max_workers)
+        pool: queue.Queue[Backend] = queue.Queue()
+        for backend in backends:
+            pool.put(backend)
+
+        def add_run_data(key: tuple[Any, ...]) -> None:
+            backend = pool.get()
+            try:
+                run = Run(backend, run_dtos[key])
+                with run.transact(message):
+                    run.iamc.add(groups[key], type=type)
+            finally:
+                pool.put(backend)
+
+        keys = list(run_dtos.keys())
+        serial_keys = keys
+        if len(backends) > 1:
+            serial_keys = self._get_creating_run_keys(df, run_columns, keys)
+        parallel_keys = [k for k in keys if k not in serial_keys]
+
+        try:
+            failures.update(
+                self._call_workers(add_run_data, serial_keys, parallel_keys, backends)
+            )
+        finally:
+            self._close_worker_backends(backends)
+
+        for key, exc in failures.items():
+            logger.warning(f"Could not add IAMC data to run {key}: {exc!r}")
+        return failures
+
+    @staticmethod
+    def _call_workers(
+        func: Callable[[tuple[Any, ...]], None],
+        serial_keys: list[tuple[Any, ...]],
+        parallel_keys: list[tuple[Any, ...]],
+        backends: list[Backend],
+    ) -> dict[tuple[Any, ...], Exception]:
+        """Calls `func` for each of the `serial_keys` one after the other, then
+        for the `parallel_keys` concurrently with one thread per backend.
+        Returns the exceptions raised per key."""
+        failures: dict[tuple[Any, ...], Exception] = {}
+        for key in serial_keys:
+            try:
+                func(key)
+            except Exception as e:
+                failures[key] = e
+
+        if parallel_keys:
+            # not `transport.executor`, which the chunks of each run are
+            # uploaded with, the workers would wait for themselves
+            with ThreadPoolExecutor(max_workers=len(backends)) as executor:
+                futures = {executor.submit(func, key): key for key in parallel_keys}
+                for future in as_completed(futures):
+                    if (exc := future.exception()) is not None:
+                        failures[futures[future]] = cast(Exception, exc)
+        return failures
+
+    @staticmethod
+    def _get_run_columns(df: pd.DataFrame) -> list[str]:
+        run_columns = ["model", "scenario"]
+        if missing_columns := set(run_columns) - set(df.columns):
+            raise InvalidDataFrame(
+                "Missing required column(s): " + ", ".join(sorted(missing_columns))
+            )
+        if "version" in df.columns:
+            run_columns.append("version")
+
+        has_missing_keys = df[run_columns].isna().any()
+        if has_missing_keys.any():
+            raise InvalidDataFrame(
+                "Missing value(s) in column(s): "
+                + ", ".join(has_missing_keys[has_missing_keys].index)
+            )
+        return run_columns
+
+    def _get_run(self, key: tuple[Any, ...]) -> RunDto:
+        model, scenario, version = key
+        return self._backend.runs.get(str(model), str(scenario), int(version))
+
+    def _create_run(self, key: tuple[Any, ...]) -> RunDto:
+        model, scenario = key
+        return self._backend.runs.create(str(model), str(scenario))
+
+    def _get_worker_backends(self, max_workers: int | None) -> list[Backend]:
+        """Returns one backend per worker which may be used concurrently."""
+        transport = self._backend.transport
+        if isinstance(transport, HttpxTransport):
+            # the http client is thread-safe
+            return [self._backend] * (max_workers or transport.settings.concurrency)
+
+        backends: list[Backend] = []
+        if isinstance(transport, DirectTransport):
+            for _ in range(max_workers or self.settings.concurrency):
+                fork = transport.fork()
+                if fork is None:
+                    break
+                backends.append(Backend(fork))
+        return backends or [self._backend]
+
+    def _close_worker_backends(self, backends: list[Backend]) -> None:
+        for backend in backends:
+            if backend is not self._backend:
+                assert isinstance(backend.transport, DirectTransport)
+                backend.transport.session.close()
+
+    def _get_creating_run_keys(
+        self, df: pd.DataFrame, run_columns: list[str], keys: list[tuple[Any, ...]]
+    ) -> list[tuple[Any, ...]]:
+        """Returns the keys of the runs which are the first to reference a
+        variable and unit combination that does not exist yet. Falls back to
+        all `keys` if the names cannot be resolved."""
+        dimension_ids = self._backend.iamc.dimension_ids
+        try:
+            ids = dimension_ids.resolve(df)
+        except Exception:
+            # leave reporting the error to the runs
+            return keys
+
+        new_measurands = ids.loc[ids["measurand__id"].isna(), ["variable", "unit"]]
+        if new_measurands.empty:
+            return []
+        first_rows = (
+            df[[*run_columns, "variable", "unit"]]
+            .merge(new_measurands, on=["variable", "unit"])
+            .drop_duplicates(["variable", "unit"])
+        )
+        creating_keys = set(first_rows[run_columns].itertuples(index=False, name=None))
+        return [key for key in keys if key in creating_keys]
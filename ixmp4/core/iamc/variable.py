@@ -50,6 +50,7 @@ class Variable(BaseFacadeObject[VariableService, VariableDto]):
     def delete(self) -> None:
         """Deletes the variable from the database."""
         self._service.delete_by_id(self._dto.id)
+        self._backend.iamc.dimension_ids.invalidate()
 
     def _get_service(self, backend: Backend) -> VariableService:
         return backend.iamc.variables
@@ -124,6 +125,7 @@ class VariableServiceFacade(
 
         id = self._get_item_id(ref)
         self._service.delete_by_id(id)
+        self._backend.iamc.dimension_ids.invalidate()
 
     def get_by_name(self, name: str) -> Variable:
         """Retrieves a variable by its name.
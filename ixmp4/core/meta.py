@@ -67,9 +67,15 @@ class PlatformRunMetaFacade(BaseServiceFacade[RunMetaEntryService]):
 class RunMetaDictFacade(
     BaseServiceFacade[RunMetaEntryService], UserDict[str, MetaValueType | None]
 ):
-    """Behaves like a dictionary with the meta indicator data for a specific run."""
+    """Behaves like a dictionary with the meta indicator data for a specific run.
+
+    Changes are buffered locally and written with one bulk delete and one bulk
+    upsert when the enclosing ``run.transact()`` exits or :meth:`flush` is
+    called. Reads include pending changes."""
 
     run: "Run"
+    pending: dict[str, MetaValueType | None]
+    """Changes not yet written, deleted keys map to `None`."""
 
     def _get_service(self, backend: "Backend") -> RunMetaEntryService:
         return backend.meta
@@ -77,6 +83,7 @@ class RunMetaDictFacade(
     def __init__(self, backend: "Backend", run: "Run") -> None:
         super().__init__(backend)
         self.run = run
+        self.pending = {}
         self._refresh()
 
     def _refresh(self) -> None:
@@ -109,16 +116,13 @@ class RunMetaDictFacade(
         """
         self.run.require_lock()
 
-        try:
-            del self[key]
-        except KeyError:
-            pass
-
         py_value = numpy_to_pytype(value)
         check_meta_type(py_value)
-        if py_value is not None:
-            self._service.create(self.run.id, key, py_value)
-        self.df, self.data = self._get()
+        if py_value is None:
+            self.data.pop(key, None)
+        else:
+            self.data[key] = py_value
+        self.pending[key] = py_value
 
     def __delitem__(self, key: str) -> None:
         """Delete a metadata entry for this run.
@@ -140,9 +144,52 @@ class RunMetaDictFacade(
             If no run lock is held.
         """
         self.run.require_lock()
-        id = dict(zip(self.df["key"], self.df["id"]))[key]
-        self._service.delete_by_id(id)
-        self.df, self.data = self._get()
+        del self.data[key]
+        self.pending[key] = None
+
+    def flush(self) -> None:
+        """Writes all pending changes of this run's meta indicators.
+
+        Called automatically when ``run.transact()`` exits.
+
+        .. code:: python
+
+            with run.transact("set meta"):
+                for i in range(200):
+                    run.meta[f"key {i}"] = i
+                run.meta.flush()
+
+        Raises
+        ------
+        :class:`ixmp4.data.run.exceptions.RunLockRequired`
+            If no run lock is held.
+        """
+        self.run.require_lock()
+        if not self.pending:
+            return
+
+        pending, self.pending = self.pending, {}
+        existing_keys = set(self.df["key"]) if not self.df.empty else set()
+        deleted_keys = [
+            k for k, v in pending.items() if v is None and k in existing_keys
+        ]
+        upserts = {k: v for k, v in pending.items() if v is not None}
+
+        if deleted_keys:
+            self._service.bulk_delete(
+                pd.DataFrame({"run__id": self.run.id, "key": deleted_keys})
+            )
+        if upserts:
+            self._service.bulk_upsert(
+                pd.DataFrame(
+                    {
+                        "run__id": self.run.id,
+                        "key": list(upserts.keys()),
+                        "value": pd.Series(list(upserts.values()), dtype=object),
+                    }
+                )
+            )
+        self._refresh()
 
     def __dict__(self) -> dict[str, MetaValueType | None]:
         return dict(self.data)
@@ -194,6 +241,8 @@ class RunMetaDescriptor(object):
             If no run lock is held.
         """
         obj.require_lock()
+        # pending changes are replaced as well
+        obj._meta = None
         self._delete_existing(obj)
 
         df = pd.DataFrame(
@@ -213,9 +262,16 @@ class RunMetaDescriptor(object):
             run.meta
             #> {"key": "value"}
 
+        While the run is locked, the same object is returned so changes are
+        buffered until the lock is released.
+
         Returns
         =======
         :class:`ixmp4.core.meta.RunMetaDictFacade`
             A special object that behaves like a dictionary.
         """
-        return RunMetaDictFacade(obj._backend, obj)
+        if not obj.owns_lock:
+            return RunMetaDictFacade(obj._backend, obj)
+        if obj._meta is None:
+            obj._meta = RunMetaDictFacade(obj._backend, obj)
+        return obj._meta
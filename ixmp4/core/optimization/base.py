@@ -18,10 +18,22 @@ if TYPE_CHECKING:
 class BaseOptimizationFacadeObject(BaseFacadeObject[GetByIdServiceT, DtoT]):
     _run: "ixmp4.core.run.Run"
 
+    _stale: bool = False
+    "Whether the item was changed since its DTO was read."
+
     def __init__(self, backend: Backend, dto: DtoT, run: "ixmp4.core.run.Run"):
         super().__init__(backend, dto)
         self._run = run
 
+    @property
+    def _current_dto(self) -> DtoT:
+        """The DTO, read again only on the first access after a change, so
+        consecutive changes don't each read the complete item."""
+        if self._stale:
+            self._refresh()
+            self._stale = False
+        return self._dto
+
 
 class BaseOptimizationServiceFacade(BaseDocsServiceFacade[KeyT, ItemT, DocsServiceT]):
     _run: "ixmp4.core.run.Run"
@@ -45,6 +45,7 @@ class RunOptimizationData(BaseBackendFacade):
 
     def __init__(self, backend: Backend, run: "Run") -> None:
         super().__init__(backend)
+        self._run = run
         self.equations = EquationServiceFacade(backend, run)
         self.indexsets = IndexSetServiceFacade(backend, run)
         self.parameters = ParameterServiceFacade(backend, run)
@@ -52,20 +53,24 @@ class RunOptimizationData(BaseBackendFacade):
         self.tables = TableServiceFacade(backend, run)
         self.variables = VariableServiceFacade(backend, run)
 
-    # TODO Improve performance by writing dedicated queries
     def remove_solution(self) -> None:
         """Remove solution data from all equations and variables on this run.
 
+        Requires an active run lock — use ``with run.transact("message"):``
+        before calling this method.
+
         .. code:: python
 
             run.optimization.remove_solution()
             #> None (solution data removed)
 
+        Raises
+        ------
+        :class:`ixmp4.data.run.exceptions.RunLockRequired`
+            If no run lock is held.
         """
-        for equation in self.equations.list():
-            equation.remove_data()
-        for variable in self.variables.list():
-            variable.remove_data()
+        self._run.require_lock()
+        self._backend.runs.remove_solution(self._run.id)
 
     def has_solution(self) -> bool:
         """Check whether this Run contains a solution.
@@ -76,12 +81,4 @@ class RunOptimizationData(BaseBackendFacade):
             #> True
 
         """
-        for variable in self.variables.list():
-            if variable.levels:
-                return True
-        for equation in self.equations.list():
-            if equation.levels:
-                return True
-
-        # If neither variables nor equations contain data, it doesn't
-        return False
+        return self._backend.runs.has_solution(self._run.id)
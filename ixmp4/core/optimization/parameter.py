@@ -47,17 +47,17 @@ class Parameter(BaseOptimizationFacadeObject[ParameterService, ParameterDto]):
     @property
     def data(self) -> dict[str, list[float] | list[int] | list[str]]:
         """Raw data dictionary for this parameter."""
-        return self._dto.data
+        return self._current_dto.data
 
     @property
     def values(self) -> list[float]:
         """List of numeric values for this parameter."""
-        return cast(list[float], self._dto.data.get("values", []))
+        return cast(list[float], self._current_dto.data.get("values", []))
 
     @property
     def units(self) -> list[str]:
         """List of units associated with the parameter values."""
-        return cast(list[str], self._dto.data.get("units", []))
+        return cast(list[str], self._current_dto.data.get("units", []))
 
     @property
     def indexset_names(self) -> list[str]:
@@ -90,7 +90,7 @@ class Parameter(BaseOptimizationFacadeObject[ParameterService, ParameterDto]):
         """
         self._run.require_lock()
         self._service.add_data(id=self._dto.id, data=data)
-        self._dto = self._service.get(run_id=self._dto.run__id, name=self._dto.name)
+        self._stale = True
 
     def remove_data(self, data: dict[str, Any] | pd.DataFrame | None = None) -> None:
         """Removes data from the Parameter.
@@ -108,7 +108,20 @@ class Parameter(BaseOptimizationFacadeObject[ParameterService, ParameterDto]):
         """
         self._run.require_lock()
         self._service.remove_data(id=self._dto.id, data=data)
-        self._dto = self._service.get(run_id=self._dto.run__id, name=self._dto.name)
+        self._stale = True
+
+    def validate(self) -> None:
+        """Validates all data of the Parameter against its IndexSets.
+
+        Adding data only validates the added rows, use this to check the complete
+        data, e.g. after IndexSet data has been removed.
+
+        Raises
+        ------
+        :class:`ixmp4.core.exceptions.OptimizationDataValidationError`
+            If the data is not valid.
+        """
+        self._service.validate(id=self._dto.id)
 
     def delete(self) -> None:
         """Delete this Parameter from the run.
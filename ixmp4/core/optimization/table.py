@@ -47,7 +47,7 @@ class Table(BaseOptimizationFacadeObject[TableService, TableDto]):
     @property
     def data(self) -> dict[str, list[float] | list[int] | list[str]]:
         """Raw data dictionary for this table."""
-        return self._dto.data
+        return self._current_dto.data
 
     @property
     def indexset_names(self) -> list[str]:
@@ -80,7 +80,7 @@ class Table(BaseOptimizationFacadeObject[TableService, TableDto]):
         """
         self._run.require_lock()
         self._service.add_data(id=self._dto.id, data=data)
-        self._refresh()
+        self._stale = True
 
     def remove_data(self, data: dict[str, Any] | pd.DataFrame | None = None) -> None:
         """Removes data from the Table.
@@ -98,7 +98,20 @@ class Table(BaseOptimizationFacadeObject[TableService, TableDto]):
         """
         self._run.require_lock()
         self._service.remove_data(id=self._dto.id, data=data)
-        self._refresh()
+        self._stale = True
+
+    def validate(self) -> None:
+        """Validates all data of the Table against its IndexSets.
+
+        Adding data only validates the added rows, use this to check the complete
+        data, e.g. after IndexSet data has been removed.
+
+        Raises
+        ------
+        :class:`ixmp4.core.exceptions.OptimizationDataValidationError`
+            If the data is not valid.
+        """
+        self._service.validate(id=self._dto.id)
 
     def delete(self) -> None:
         """Delete this Table.
@@ -47,17 +47,17 @@ class Variable(BaseOptimizationFacadeObject[VariableService, VariableDto]):
     @property
     def data(self) -> dict[str, list[float] | list[int] | list[str]]:
         """Raw data dictionary for this variable."""
-        return self._dto.data
+        return self._current_dto.data
 
     @property
     def levels(self) -> list[float]:
         """Level values associated with this variable."""
-        return cast(list[float], self._dto.data.get("levels", []))
+        return cast(list[float], self._current_dto.data.get("levels", []))
 
     @property
     def marginals(self) -> list[float]:
         """Marginal values for this variable."""
-        return cast(list[float], self._dto.data.get("marginals", []))
+        return cast(list[float], self._current_dto.data.get("marginals", []))
 
     @property
     def indexset_names(self) -> list[str] | None:
@@ -90,7 +90,7 @@ class Variable(BaseOptimizationFacadeObject[VariableService, VariableDto]):
         """
         self._run.require_lock()
         self._service.add_data(id=self._dto.id, data=data)
-        self._refresh()
+        self._stale = True
 
     def remove_data(self, data: dict[str, Any] | pd.DataFrame | None = None) -> None:
         """Removes data from the Variable.
@@ -108,7 +108,20 @@ class Variable(BaseOptimizationFacadeObject[VariableService, VariableDto]):
         """
         self._run.require_lock()
         self._service.remove_data(id=self._dto.id, data=data)
-        self._refresh()
+        self._stale = True
+
+    def validate(self) -> None:
+        """Validates all data of the Variable against its IndexSets.
+
+        Adding data only validates the added rows, use this to check the complete
+        data, e.g. after IndexSet data has been removed.
+
+        Raises
+        ------
+        :class:`ixmp4.core.exceptions.OptimizationDataValidationError`
+            If the data is not valid.
+        """
+        self._service.validate(id=self._dto.id)
 
     def delete(self) -> None:
         """Delete this Variable from the run.
@@ -184,7 +184,7 @@ class Platform(object):
         logger.debug(f"Initializing facade objects for {self.backend}.")
 
         self.runs = RunServiceFacade(self.backend)
-        self.iamc = PlatformIamcData(self.backend)
+        self.iamc = PlatformIamcData(self.backend, settings=self.settings.client)
         self.models = ModelServiceFacade(self.backend)
         self.regions = RegionServiceFacade(self.backend)
         self.scenarios = ScenarioServiceFacade(self.backend)
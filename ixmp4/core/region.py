@@ -56,6 +56,7 @@ class Region(BaseFacadeObject[RegionService, RegionDto]):
     def delete(self) -> None:
         """Deletes this region."""
         self._service.delete_by_id(self._dto.id)
+        self._backend.iamc.dimension_ids.invalidate()
 
     def _get_service(self, backend: Backend) -> RegionService:
         return backend.regions
@@ -172,6 +173,7 @@ class RegionServiceFacade(
 
         id = self._get_item_id(ref)
         self._service.delete_by_id(id)
+        self._backend.iamc.dimension_ids.invalidate()
 
     def list(self, **kwargs: Unpack[FacadeRegionFilter]) -> List[Region]:
         r"""Lists regions by specified criteria.
@@ -1,7 +1,7 @@
 import logging
 import time
 import warnings
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from datetime import datetime
 from typing import Generator, List
 
@@ -32,74 +32,12 @@ from ixmp4.data.scenario.dto import Scenario as ScenarioDto
 from .base import BaseFacadeObject, BaseServiceFacade
 from .checkpoint import RunCheckpoints
 from .iamc import RunIamcData
-from .meta import RunMetaDescriptor
+from .meta import RunMetaDescriptor, RunMetaDictFacade
 from .optimization.data import RunOptimizationData
 
 logger = logging.getLogger(__name__)
 
 
-class RunCloner:
-    def clone(self, src_run: "Run", dst_run: "Run", keep_solution: bool) -> None:
-        with dst_run.transact("Clone run " + str(src_run)):
-            self.clone_meta(src_run, dst_run)
-            self.clone_iamc(src_run, dst_run)
-            self.clone_optimization(src_run, dst_run, keep_solution)
-
-    def clone_meta(self, src_run: "Run", dst_run: "Run") -> None:
-        dst_run.meta = dict(src_run.meta)
-
-    def clone_iamc(self, src_run: "Run", dst_run: "Run") -> None:
-        df = src_run.iamc.tabulate()
-        if not df.empty:
-            dst_run.iamc.add(df)
-
-    def clone_optimization(
-        self, src_run: "Run", dst_run: "Run", keep_solution: bool
-    ) -> None:
-        for src_scalar in src_run.optimization.scalars.list():
-            dst_run.optimization.scalars.create(
-                src_scalar.name, src_scalar.value, src_scalar.unit.name
-            )
-
-        for src_idxset in src_run.optimization.indexsets.list():
-            dst_idxset = dst_run.optimization.indexsets.create(src_idxset.name)
-            dst_idxset.add_data(src_idxset.data)
-
-        for src_table in src_run.optimization.tables.list():
-            dst_table = dst_run.optimization.tables.create(
-                src_table.name,
-                constrained_to_indexsets=src_table.indexset_names,
-                column_names=src_table.column_names,
-            )
-            dst_table.add_data(src_table.data)
-
-        for src_parameter in src_run.optimization.parameters.list():
-            dst_parameter = dst_run.optimization.parameters.create(
-                src_parameter.name,
-                constrained_to_indexsets=src_parameter.indexset_names,
-                column_names=src_parameter.column_names,
-            )
-            dst_parameter.add_data(src_parameter.data)
-
-        for src_equation in src_run.optimization.equations.list():
-            dst_equation = dst_run.optimization.equations.create(
-                src_equation.name,
-                constrained_to_indexsets=src_equation.indexset_names,
-                column_names=src_equation.column_names,
-            )
-            if keep_solution:
-                dst_equation.add_data(src_equation.data)
-
-        for src_variable in src_run.optimization.variables.list():
-            dst_variable = dst_run.optimization.variables.create(
-                src_variable.name,
-                constrained_to_indexsets=src_variable.indexset_names,
-                column_names=src_variable.column_names,
-            )
-            if keep_solution:
-                dst_variable.add_data(src_variable.data)
-
-
 class Run(BaseFacadeObject[RunService, RunDto]):
     """As a central class to organize data on a platform
     the ``Run`` provides methods and access to ``Facade`` instances.
@@ -149,11 +87,11 @@ class Run(BaseFacadeObject[RunService, RunDto]):
 
     owns_lock: bool = False
     """Indicated whether this run object has acquired the run's lock."""
+    _meta: RunMetaDictFacade | None = None
+    """Meta indicators buffering changes while the lock is held."""
     minimum_lock_timeout: float = 0.1
     maximum_lock_timeout: float = 5
 
-    _cloner: RunCloner = RunCloner()
-
     def __init__(self, backend: Backend, dto: RunDto) -> None:
         super().__init__(backend, dto)
         self.iamc = RunIamcData(backend, run=self)
@@ -229,6 +167,7 @@ class Run(BaseFacadeObject[RunService, RunDto]):
     def _unlock(self) -> None:
         self._dto = self._service.unlock(self._dto.id)
         self.owns_lock = False
+        self._meta = None
         logger.debug(f"Released lock on {self}.")
 
     def _lock_with_timeout(self, timeout: float) -> None:
@@ -312,7 +251,12 @@ class Run(BaseFacadeObject[RunService, RunDto]):
 
         try:
             yield
+            self._flush_meta()
         except Exception as e:
+            # pending changes are written so they are reverted like all others
+            with suppress(Exception):
+                self._flush_meta()
+
             checkpoint_df = self.checkpoints.tabulate()
             if checkpoint_df.empty:
                 checkpoint_transaction = -1
@@ -339,13 +283,17 @@ class Run(BaseFacadeObject[RunService, RunDto]):
                     "is not supported by this platform: " + str(ons_exc.message)
                 )
 
-            self.meta._refresh()
             self._unlock()
             raise e
 
         self.checkpoints.create(message)
         self._unlock()
 
+    def _flush_meta(self) -> None:
+        meta, self._meta = self._meta, None
+        if meta is not None:
+            meta.flush()
+
     def delete(self) -> None:
         """Delete this run.
         Tries to acquire a lock in the background.
@@ -392,17 +340,18 @@ class Run(BaseFacadeObject[RunService, RunDto]):
         :class:`ixmp4.core.run.Run`:
             The cloned run.
         """
-        dst_run = Run(
+        if self.owns_lock:
+            self._flush_meta()
+        return Run(
             backend=self._backend,
-            dto=self._service.create(
-                model_name=model or self.model.name,
-                scenario_name=scenario or self.scenario.name,
+            dto=self._service.clone(
+                self._dto.id,
+                model_name=model,
+                scenario_name=scenario,
+                keep_solution=keep_solution,
             ),
         )
 
-        self._cloner.clone(self, dst_run, keep_solution)
-        return dst_run
-
     def _get_service(self, backend: Backend) -> RunService:
         return backend.runs
 
@@ -49,6 +49,7 @@ class Unit(BaseFacadeObject[UnitService, UnitDto]):
     def delete(self) -> None:
         """Deletes this unit."""
         self._service.delete_by_id(self._dto.id)
+        self._backend.iamc.dimension_ids.invalidate()
 
     def _get_service(self, backend: Backend) -> UnitService:
         return backend.units
@@ -132,6 +133,7 @@ class UnitServiceFacade(BaseDocsServiceFacade[Unit | int | str, Unit, UnitServic
         """
         id = self._get_item_id(ref)
         self._service.delete_by_id(id)
+        self._backend.iamc.dimension_ids.invalidate()
 
     def get_by_name(self, name: str) -> Unit:
         """Retrieves a unit by its name.
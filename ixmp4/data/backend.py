@@ -1,6 +1,8 @@
 import logging
+from functools import cached_property
 
 from ixmp4.data.checkpoint.service import CheckpointService
+from ixmp4.data.iamc.cache import DimensionIdCache
 from ixmp4.data.iamc.datapoint.service import DataPointService as IamcDataPointService
 from ixmp4.data.iamc.model.service import IamcModelService
 from ixmp4.data.iamc.region.service import IamcRegionService
@@ -37,27 +39,78 @@ logger = logging.getLogger(__name__)
 
 class IamcSubobject(object):
     """Namespace grouping all IAMC-related data services on a
-    :class:`Backend`."""
+    :class:`Backend`. Services are instantiated on first access."""
 
-    datapoints: IamcDataPointService
-    timeseries: IamcTimeSeriesService
-    variables: IamcVariableService
-    regions: IamcRegionService
-    units: IamcUnitService
-    models: IamcModelService
-    scenarios: IamcScenarioService
+    transport: Transport
+
+    def __init__(self, transport: Transport) -> None:
+        self.transport = transport
+
+    @cached_property
+    def datapoints(self) -> IamcDataPointService:
+        return IamcDataPointService(self.transport)
+
+    @cached_property
+    def timeseries(self) -> IamcTimeSeriesService:
+        return IamcTimeSeriesService(self.transport)
+
+    @cached_property
+    def variables(self) -> IamcVariableService:
+        return IamcVariableService(self.transport)
+
+    @cached_property
+    def regions(self) -> IamcRegionService:
+        return IamcRegionService(self.transport)
+
+    @cached_property
+    def units(self) -> IamcUnitService:
+        return IamcUnitService(self.transport)
+
+    @cached_property
+    def models(self) -> IamcModelService:
+        return IamcModelService(self.transport)
+
+    @cached_property
+    def scenarios(self) -> IamcScenarioService:
+        return IamcScenarioService(self.transport)
+
+    @cached_property
+    def dimension_ids(self) -> DimensionIdCache:
+        return DimensionIdCache(self.timeseries)
 
 
 class OptimizationSubobject(object):
     """Namespace grouping all optimization-related data services on a
-    :class:`Backend`."""
+    :class:`Backend`. Services are instantiated on first access."""
+
+    transport: Transport
+
+    def __init__(self, transport: Transport) -> None:
+        self.transport = transport
+
+    @cached_property
+    def equations(self) -> OptEquationService:
+        return OptEquationService(self.transport)
+
+    @cached_property
+    def indexsets(self) -> OptIndexSetService:
+        return OptIndexSetService(self.transport)
 
-    equations: OptEquationService
-    indexsets: OptIndexSetService
-    parameters: OptParameterService
-    scalars: OptScalarService
-    tables: OptTableService
-    variables: OptVariableService
+    @cached_property
+    def parameters(self) -> OptParameterService:
+        return OptParameterService(self.transport)
+
+    @cached_property
+    def scalars(self) -> OptScalarService:
+        return OptScalarService(self.transport)
+
+    @cached_property
+    def tables(self) -> OptTableService:
+        return OptTableService(self.transport)
+
+    @cached_property
+    def variables(self) -> OptVariableService:
+        return OptVariableService(self.transport)
 
 
 class Backend(object):
@@ -66,7 +119,8 @@ class Backend(object):
     A ``Backend`` is built around a single :class:`~ixmp4.transport.Transport`
     and exposes every data service as an attribute.  IAMC-related services
     are grouped under :attr:`iamc` and optimisation-related services under
-    :attr:`optimization`.
+    :attr:`optimization`. Services are instantiated on first access, so
+    creating a backend is cheap even if only a few of them are used.
     """
 
     transport: Transport
@@ -78,16 +132,8 @@ class Backend(object):
     optimization: OptimizationSubobject
     """Namespace for optimisation services (equations, indexsets, parameters, ...)."""
 
-    meta: RunMetaEntryService
-    models: ModelService
-    regions: RegionService
-    runs: RunService
-    scenarios: ScenarioService
-    units: UnitService
-    checkpoints: CheckpointService
-
     def __init__(self, transport: Transport) -> None:
-        """Initialise a Backend and instantiate all service classes.
+        """Initialise a Backend. Services are instantiated on first access.
 
         Parameters
         ----------
@@ -96,22 +142,33 @@ class Backend(object):
         """
         logger.info(f"Creating backend class with transport: {transport}")
         self.transport = transport
-        self.optimization = OptimizationSubobject()
-        self.iamc = IamcSubobject()
-
-        self.meta = RunMetaEntryService(transport)
-        self.models = ModelService(transport)
-        self.regions = RegionService(transport)
-        self.runs = RunService(transport)
-        self.scenarios = ScenarioService(transport)
-        self.units = UnitService(transport)
-        self.checkpoints = CheckpointService(transport)
-        self.iamc.datapoints = IamcDataPointService(transport)
-        self.iamc.timeseries = IamcTimeSeriesService(transport)
-        self.iamc.variables = IamcVariableService(transport)
-        self.optimization.equations = OptEquationService(transport)
-        self.optimization.indexsets = OptIndexSetService(transport)
-        self.optimization.parameters = OptParameterService(transport)
-        self.optimization.scalars = OptScalarService(transport)
-        self.optimization.tables = OptTableService(transport)
-        self.optimization.variables = OptVariableService(transport)
+        self.optimization = OptimizationSubobject(transport)
+        self.iamc = IamcSubobject(transport)
+
+    @cached_property
+    def meta(self) -> RunMetaEntryService:
+        return RunMetaEntryService(self.transport)
+
+    @cached_property
+    def models(self) -> ModelService:
+        return ModelService(self.transport)
+
+    @cached_property
+    def regions(self) -> RegionService:
+        return RegionService(self.transport)
+
+    @cached_property
+    def runs(self) -> RunService:
+        return RunService(self.transport)
+
+    @cached_property
+    def scenarios(self) -> ScenarioService:
+        return ScenarioService(self.transport)
+
+    @cached_property
+    def units(self) -> UnitService:
+        return UnitService(self.transport)
+
+    @cached_property
+    def checkpoints(self) -> CheckpointService:
+        return CheckpointService(self.transport)
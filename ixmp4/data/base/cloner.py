@@ -0,0 +1,87 @@
+from typing import Any, Mapping
+
+import sqlalchemy as sa
+from toolkit.db.executor import SessionExecutor
+from toolkit.db.repositories import BaseRepository
+from toolkit.db.target import ModelTarget
+
+from .db import BaseModel
+
+
+class ClonerRepository(BaseRepository[Any]):
+    """Copies the rows of `target` belonging to one run into another run
+    with a single ``INSERT ... SELECT`` statement."""
+
+    target: ModelTarget[BaseModel]
+    executor: SessionExecutor
+    creation_info: Mapping[str, Any]
+
+    def __init__(
+        self,
+        executor: SessionExecutor,
+        creation_info: Mapping[str, Any] | None = None,
+    ):
+        super().__init__(executor)
+        self.creation_info = creation_info or {}
+
+    def select_clones(
+        self, src_run__id: int, dst_run__id: int, keep_solution: bool
+    ) -> sa.Select[Any]:
+        """Returns a select statement yielding the cloned rows.
+        Its columns must be labelled like the columns of `target`."""
+        raise NotImplementedError
+
+    def clone_columns(
+        self, source: sa.FromClause, **replace: sa.ColumnElement[Any]
+    ) -> list[sa.ColumnElement[Any]]:
+        """Returns the columns of `source` which `target` also has (except for
+        the primary key). Columns in `replace` and creation info columns are
+        substituted."""
+        replace = {**self.creation_info_columns(), **replace}
+        columns: list[sa.ColumnElement[Any]] = []
+        for column in self.target.table.columns:
+            if column.key == "id":
+                continue
+            if column.key in replace:
+                columns.append(replace[column.key].label(column.key))
+            elif column.key in source.c:
+                columns.append(source.c[column.key])
+        return columns
+
+    def creation_info_columns(self) -> dict[str, sa.ColumnElement[Any]]:
+        return {
+            key: sa.literal(value, self.target.table.c[key].type)
+            for key, value in self.creation_info.items()
+            if key in self.target.table.c
+        }
+
+    def clone(self, src_run__id: int, dst_run__id: int, keep_solution: bool) -> None:
+        exc = self.select_clones(src_run__id, dst_run__id, keep_solution)
+        insert_exc = self.target.insert_statement().from_select(
+            exc.selected_columns.keys(), exc
+        )
+        self.executor.session.execute(insert_exc)
+
+
+class Cloner:
+    repo_classes: list[type[ClonerRepository]]
+
+    def __init__(self, targets: list[type[ClonerRepository]]) -> None:
+        def sorted_index(repo_class: type[ClonerRepository]) -> int:
+            return BaseModel.metadata.sorted_tables.index(repo_class.target.table)
+
+        self.repo_classes = list(sorted(targets, key=sorted_index))
+
+    def __call__(
+        self,
+        executor: SessionExecutor,
+        src_run__id: int,
+        dst_run__id: int,
+        keep_solution: bool = True,
+        creation_info: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Clones the rows of all targets, parents first.
+        Does not commit the session."""
+        for class_ in self.repo_classes:
+            repo = class_(executor, creation_info=creation_info)
+            repo.clone(src_run__id, dst_run__id, keep_solution)
@@ -143,7 +143,8 @@ class CheckpointService(GetByIdService):
     ) -> None:
         auth_ctx.has_view_permission(platform, raise_exc=Forbidden)
 
-    @procedure(Http(methods=("PATCH",)))
+    # checkpoints are not versioned, so changes do not record a transaction
+    @procedure(Http(methods=("PATCH",), cache_results=False))
     def list(self, **kwargs: Unpack[CheckpointFilter]) -> list[Checkpoint]:
         r"""Lists checkpoints by specified criteria.
 
@@ -188,7 +189,7 @@ class CheckpointService(GetByIdService):
             pagination=pagination,
         )
 
-    @procedure(Http(methods=("PATCH",)))
+    @procedure(Http(methods=("PATCH",), cache_results=False))
     def tabulate(self, **kwargs: Unpack[CheckpointFilter]) -> SerializableDataFrame:
         r"""Tabulates checkpoints by specified criteria.
 
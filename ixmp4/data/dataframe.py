@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from typing import Annotated, Any, TypeAlias
 
@@ -5,6 +6,15 @@ import pandas as pd
 import pydantic as pyd
 from pydantic import PlainSerializer, PlainValidator, WithJsonSchema
 
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.types
+
+    _pyarrow_is_installed = True
+except ImportError:
+    _pyarrow_is_installed = False
+
 
 def parse_ts(v: Any) -> pd.Timestamp:
     if isinstance(v, pd.Timestamp):
@@ -101,3 +111,72 @@ SerializableDataFrame: TypeAlias = Annotated[
         mode="serialization",
     ),
 ]
+
+
+JSON_MEDIA_TYPE = "application/json"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+ARROW_METADATA_KEY = b"ixmp4"
+
+
+def get_wire_formats() -> list[str]:
+    """Returns the media types this installation can exchange dataframes in,
+    ordered by preference. Arrow IPC is only available if `pyarrow` is installed."""
+
+    if not _pyarrow_is_installed:
+        return [JSON_MEDIA_TYPE]
+    return [ARROW_STREAM_MEDIA_TYPE, JSON_MEDIA_TYPE]
+
+
+def serialize_df_arrow(
+    df: pd.DataFrame, metadata: dict[str, Any] | None = None
+) -> bytes | None:
+    """Encodes a dataframe as an Arrow IPC stream.
+
+    Additional `metadata` is stored as JSON in the schema metadata.
+    Returns `None` if `pyarrow` is not installed or the dataframe contains
+    values arrow cannot represent faithfully (mixed types, dicts, lists),
+    callers are expected to fall back to JSON."""
+
+    if not _pyarrow_is_installed:
+        return None
+
+    try:
+        table = pyarrow.Table.from_pandas(df)
+    except (pyarrow.ArrowException, TypeError, ValueError):
+        return None
+
+    # nested values do not survive the round trip as python objects
+    if any(pyarrow.types.is_nested(field.type) for field in table.schema):
+        return None
+
+    if metadata is not None:
+        table = table.replace_schema_metadata(
+            {
+                **(table.schema.metadata or {}),
+                ARROW_METADATA_KEY: json.dumps(metadata).encode(),
+            }
+        )
+
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return bytes(sink.getvalue())
+
+
+def parse_df_arrow(content: bytes) -> tuple[pd.DataFrame, dict[str, Any] | None]:
+    """Decodes an Arrow IPC stream created by :func:`serialize_df_arrow`.
+
+    Returns the dataframe and the additional metadata, if any."""
+
+    if not _pyarrow_is_installed:
+        raise ValueError("Cannot parse arrow stream, `pyarrow` is not installed.")
+
+    try:
+        with pyarrow.ipc.open_stream(content) as reader:
+            table = reader.read_all()
+    except pyarrow.ArrowException as e:
+        raise ValueError(f"Not a valid arrow stream: {str(e)}")
+
+    raw_metadata = (table.schema.metadata or {}).get(ARROW_METADATA_KEY)
+    metadata = json.loads(raw_metadata) if raw_metadata is not None else None
+    return table.to_pandas(), metadata
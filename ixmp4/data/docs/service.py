@@ -128,7 +128,8 @@ class DocsService(GetByIdService, abc.ABC):
     ) -> None:
         auth_ctx.has_edit_permission(platform, raise_exc=Forbidden)
 
-    @procedure(Http(path="/docs/list/", methods=("PATCH",)))
+    # docs tables are not versioned, so changes do not record a transaction
+    @procedure(Http(path="/docs/list/", methods=("PATCH",), cache_results=False))
     def list_docs(self, **kwargs: Unpack[DocsFilter]) -> list[Docs]:
         r"""Lists docs entries by specified criteria.
 
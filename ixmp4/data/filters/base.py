@@ -3,6 +3,7 @@ from typing_extensions import TypedDict
 
 class IdFilter(TypedDict, total=False):
     id: int
+    id__gt: int
     id__in: list[int]
 
 
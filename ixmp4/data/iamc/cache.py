@@ -0,0 +1,152 @@
+import threading
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+import pandas as pd
+
+from ixmp4.data.iamc.timeseries.service import TimeSeriesService
+from ixmp4.data.region.exceptions import RegionNotFound
+from ixmp4.data.unit.exceptions import UnitNotFound
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+
+class IdMap(Generic[KeyT]):
+    """Maps keys to ids, keeping at most ``max_entries``
+    of the most recently used entries."""
+
+    entries: "OrderedDict[KeyT, int]"
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def get(self, key: KeyT) -> int | None:
+        id_ = self.entries.get(key)
+        if id_ is not None:
+            self.entries.move_to_end(key)
+        return id_
+
+    def set(self, key: KeyT, id_: int) -> None:
+        self.entries[key] = id_
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class DimensionIdCache(object):
+    """Client-side cache of the ids of the regions, units, variables and
+    measurands (variable and unit combinations) of a platform.
+
+    Used by IAMC writes to reference regions and measurands by id, so the
+    server does not have to resolve their names on every request. Names
+    missing from the cache are looked up with a single request and
+    variables or measurands that do not exist yet are left to the server
+    to create. The cache must be invalidated when one of the dimensions is
+    deleted or a write fails because a cached id no longer exists.
+    """
+
+    regions: IdMap[str]
+    units: IdMap[str]
+    variables: IdMap[str]
+    measurands: IdMap[tuple[str, str]]
+
+    name_columns = ["region", "variable", "unit"]
+    id_columns = ["region__id", "measurand__id"]
+
+    def __init__(self, timeseries: TimeSeriesService, max_entries: int = 100_000):
+        self.timeseries = timeseries
+        self.regions = IdMap(max_entries)
+        self.units = IdMap(max_entries)
+        self.variables = IdMap(max_entries)
+        self.measurands = IdMap(max_entries)
+        self.lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Forgets all cached ids."""
+        with self.lock:
+            for id_map in (self.regions, self.units, self.variables, self.measurands):
+                id_map.clear()
+
+    def lookup(self, names: pd.DataFrame) -> pd.DataFrame:
+        """Returns the cached `region__id` and `measurand__id` of the
+        distinct name combinations in `names`, ids which are not cached
+        are missing."""
+        names = names[self.name_columns].drop_duplicates().reset_index(drop=True)
+        with self.lock:
+            region_ids = [self.regions.get(r) for r in names["region"]]
+            measurand_ids = [
+                self.measurands.get((v, u))
+                for v, u in zip(names["variable"], names["unit"])
+            ]
+        return names.assign(
+            region__id=pd.array(region_ids, dtype="Int64"),
+            measurand__id=pd.array(measurand_ids, dtype="Int64"),
+        )
+
+    def store(self, ids: pd.DataFrame) -> None:
+        """Caches the ids returned by
+        :meth:`TimeSeriesService.tabulate_dimension_ids`."""
+        with self.lock:
+            for row in ids.to_dict("records"):
+                if not pd.isna(row["region__id"]):
+                    self.regions.set(row["region"], int(row["region__id"]))
+                if not pd.isna(row["unit__id"]):
+                    self.units.set(row["unit"], int(row["unit__id"]))
+                if not pd.isna(row["variable__id"]):
+                    self.variables.set(row["variable"], int(row["variable__id"]))
+                if not pd.isna(row["measurand__id"]):
+                    self.measurands.set(
+                        (row["variable"], row["unit"]), int(row["measurand__id"])
+                    )
+
+    def resolve(self, names: pd.DataFrame) -> pd.DataFrame:
+        """Returns the distinct name combinations in `names` with their
+        `region__id` and `measurand__id`, fetching the ids which are not
+        cached. The `measurand__id` of variables or measurands that do not
+        exist yet is missing.
+
+        Raises
+        ------
+        :class:`RegionNotFound`:
+            If one or more region names do not exist.
+        :class:`UnitNotFound`:
+            If one or more unit names do not exist.
+        """
+        ids = self.lookup(names)
+        is_missing = ids[self.id_columns].isna().any(axis=1)
+        if not is_missing.any():
+            return ids
+
+        fetched = self.timeseries.tabulate_dimension_ids(
+            ids.loc[is_missing, self.name_columns]
+        )
+        missing_regions = fetched.loc[fetched["region__id"].isna(), "region"]
+        if not missing_regions.empty:
+            raise RegionNotFound(", ".join(missing_regions.unique()))
+        missing_units = fetched.loc[fetched["unit__id"].isna(), "unit"]
+        if not missing_units.empty:
+            raise UnitNotFound(", ".join(missing_units.unique()))
+
+        self.store(fetched)
+        return self.lookup(names)
+
+    def merge_ids(self, df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Splits `df` into the rows whose region and measurand ids are known,
+        with `region__id` and `measurand__id` columns in place of the
+        `region`, `variable` and `unit` columns, and the remaining rows,
+        which mostly reference variables or measurands that do not exist yet."""
+        ids = self.resolve(df)
+        df = df.merge(ids, how="left", on=self.name_columns)
+        is_resolved = df[self.id_columns].notna().all(axis=1).to_numpy()
+
+        resolved = df[is_resolved].drop(columns=self.name_columns)
+        resolved = resolved.astype({c: int for c in self.id_columns})
+        unresolved = df[~is_resolved].drop(columns=self.id_columns)
+        return resolved, unresolved
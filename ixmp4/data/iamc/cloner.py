@@ -0,0 +1,56 @@
+from typing import Any
+
+import sqlalchemy as sa
+from toolkit.db.target import ModelTarget
+
+from ixmp4.data.base.cloner import Cloner, ClonerRepository
+from ixmp4.data.iamc.datapoint.db import DataPoint
+from ixmp4.data.iamc.timeseries.db import TimeSeries
+
+
+class TimeSeriesClonerRepository(ClonerRepository):
+    target = ModelTarget(TimeSeries)
+
+    def select_clones(
+        self, src_run__id: int, dst_run__id: int, keep_solution: bool
+    ) -> sa.Select[Any]:
+        table = self.target.table
+        return (
+            sa.select(*self.clone_columns(table, run__id=sa.literal(dst_run__id)))
+            .where(table.c.run__id == src_run__id)
+            .order_by(table.c.id)
+        )
+
+
+class DataPointClonerRepository(ClonerRepository):
+    target = ModelTarget(DataPoint)
+
+    def select_clones(
+        self, src_run__id: int, dst_run__id: int, keep_solution: bool
+    ) -> sa.Select[Any]:
+        table = self.target.table
+        src_ts = TimeSeries.__table__.alias("src_ts")
+        dst_ts = TimeSeries.__table__.alias("dst_ts")
+        return (
+            sa.select(*self.clone_columns(table, time_series__id=dst_ts.c.id))
+            .select_from(table)
+            .join(src_ts, src_ts.c.id == table.c.time_series__id)
+            .join(
+                dst_ts,
+                sa.and_(
+                    dst_ts.c.run__id == dst_run__id,
+                    dst_ts.c.region__id == src_ts.c.region__id,
+                    dst_ts.c.measurand__id == src_ts.c.measurand__id,
+                ),
+            )
+            .where(src_ts.c.run__id == src_run__id)
+            .order_by(table.c.id)
+        )
+
+
+run_cloner = Cloner(
+    targets=[
+        TimeSeriesClonerRepository,
+        DataPointClonerRepository,
+    ]
+)
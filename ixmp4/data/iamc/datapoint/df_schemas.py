@@ -8,8 +8,7 @@ from ixmp4.base_exceptions import InconsistentIamcType
 from .type import Type, TypeColumnsDict
 
 
-class BaseDataPointFrameSchema(pa.DataFrameModel):
-    time_series__id: pat.Series[pa.Int] = pa.Field(coerce=True)
+class StepFrameSchema(pa.DataFrameModel):
     type: pat.Series[pa.String] | None = pa.Field(
         isin=[str(t) for t in Type], coerce=True
     )
@@ -78,6 +77,10 @@ class BaseDataPointFrameSchema(pa.DataFrameModel):
         return df.drop(columns=["valid"])
 
 
+class BaseDataPointFrameSchema(StepFrameSchema):
+    time_series__id: pat.Series[pa.Int] = pa.Field(coerce=True)
+
+
 class DeleteDataPointFrameSchema(BaseDataPointFrameSchema):
     pass
 
@@ -90,3 +93,38 @@ class UpsertDataPointFrameSchema(BaseDataPointFrameSchema):
     def check_no_inf_vals(cls, df: pd.DataFrame) -> bool:
         """Check that no infinite values exist in the 'value' column."""
         return not bool(np.isinf(df["value"]).any())
+
+
+class RemoveDataPointFrameSchema(StepFrameSchema):
+    run__id: pat.Series[pa.Int] = pa.Field(coerce=True)
+    region: pat.Series[pa.String] = pa.Field(coerce=True)
+    variable: pat.Series[pa.String] = pa.Field(coerce=True)
+    unit: pat.Series[pa.String] = pa.Field(coerce=True)
+
+
+class IngestDataPointFrameSchema(StepFrameSchema):
+    run__id: pat.Series[pa.Int] = pa.Field(coerce=True)
+    region: pat.Series[pa.String] | None = pa.Field(coerce=True)
+    variable: pat.Series[pa.String] | None = pa.Field(coerce=True)
+    unit: pat.Series[pa.String] | None = pa.Field(coerce=True)
+    region__id: pat.Series[pa.Int] | None = pa.Field(coerce=True)
+    measurand__id: pat.Series[pa.Int] | None = pa.Field(coerce=True)
+    value: pat.Series[pa.Float] = pa.Field(coerce=True)
+
+    @pa.dataframe_check
+    @classmethod
+    def check_has_region(cls, df: pd.DataFrame) -> bool:
+        return "region" in df.columns or "region__id" in df.columns
+
+    @pa.dataframe_check
+    @classmethod
+    def check_has_measurand(cls, df: pd.DataFrame) -> bool:
+        return (
+            "variable" in df.columns and "unit" in df.columns
+        ) or "measurand__id" in df.columns
+
+    @pa.dataframe_check
+    @classmethod
+    def check_no_inf_vals(cls, df: pd.DataFrame) -> bool:
+        """Check that no infinite values exist in the 'value' column."""
+        return not bool(np.isinf(df["value"]).any())
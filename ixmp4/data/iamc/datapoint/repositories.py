@@ -1,7 +1,9 @@
-from typing import Any, Sequence
+from typing import Any, Collection, Iterator, Sequence, cast
 
 import pandas as pd
+import psycopg
 import sqlalchemy as sa
+from sqlalchemy.util import await_only
 from toolkit.auth.context import AuthorizationContext, PlatformProtocol
 from toolkit.db.filter import Filter
 from toolkit.db.repositories import PandasRepository as BasePandasRepository
@@ -73,8 +75,173 @@ class PandasRepository(DataPointAuthRepository, BasePandasRepository):
         offset: int | None = None,
     ) -> pd.DataFrame:
         df = super().tabulate(values, columns, limit, offset)
+        return self.drop_empty_step_columns(df)
 
-        # drop empty step columns
+    def iter_tabulate(
+        self,
+        values: Values | None = None,
+        columns: Sequence[str] | None = None,
+        *,
+        batch_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Runs the tabulation query once and yields dataframes of at most
+        `batch_size` rows while the rows are fetched from a server-side cursor.
+        Empty step columns are dropped per batch."""
+
+        exc = self.select_for_values(values=values, columns=columns)
+        exc = self.default_order_by(exc).execution_options(yield_per=batch_size)
+        column_names = [col.description for col in exc.selected_columns]
+
+        for df in pd.read_sql(
+            exc,
+            con=self.executor.session.connection(),
+            dtype=self.dtypes,
+            parse_dates=self.datettime_column_names,
+            coerce_float=False,
+            chunksize=batch_size,
+        ):
+            if df.empty:
+                df = pd.DataFrame([], columns=column_names)
+            yield self.drop_empty_step_columns(df)
+
+    def bulk_upsert(self, df: pd.DataFrame, key: Collection[str]) -> None:
+        """Inserts or updates the rows of `df` like :meth:`upsert`.
+        On PostgreSQL the rows are copied into a temporary staging table
+        with ``COPY`` and merged into the datapoint table with one ``UPDATE``
+        and one ``INSERT`` statement instead of tabulating the existing rows
+        first. Only rows with changed values are updated.
+        Other dialects fall back to :meth:`upsert`."""
+
+        if df.empty or self.executor.engine.dialect.name != "postgresql":
+            return self.upsert(df, key=key)
+
+        session = self.executor.session
+        with self.wrap_executor_exception():
+            try:
+                staging = self.create_staging_table(df.columns)
+                self.copy_to_staging_table(staging, df)
+                self.merge_staging_table(staging, df, key)
+                staging.drop(session.connection())
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                raise e
+
+    def create_staging_table(self, columns: Collection[str]) -> sa.Table:
+        table = cast(sa.Table, DataPoint.__table__)
+        staging = sa.Table(
+            "iamc_datapoint_staging",
+            sa.MetaData(),
+            *(sa.Column(col, table.c[col].type) for col in columns),
+            # preserves the order of the rows so ids are assigned like in `insert`
+            sa.Column("staging_ordinal", sa.BigInteger, sa.Identity()),
+            prefixes=["TEMPORARY"],
+            postgresql_on_commit="DROP",
+        )
+        staging.create(self.executor.session.connection())
+        return staging
+
+    def copy_to_staging_table(self, staging: sa.Table, df: pd.DataFrame) -> None:
+        connection = self.executor.session.connection()
+        quote = connection.dialect.identifier_preparer.quote
+        column_list = ", ".join(quote(col) for col in df.columns)
+        copy_sql = (
+            f"COPY {quote(staging.name)} ({column_list}) "
+            "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        )
+        dbapi_connection = connection.connection.driver_connection
+        assert dbapi_connection is not None
+
+        if isinstance(dbapi_connection, psycopg.AsyncConnection):
+            # sessions of async engines run this code in a greenlet,
+            # which can await the driver like sqlalchemy does internally
+            await_only(self.copy_async(dbapi_connection, copy_sql, df))
+            return
+
+        with dbapi_connection.cursor() as cursor:
+            with cursor.copy(copy_sql) as copy:
+                for csv in self.iter_copy_csv(df):
+                    copy.write(csv)
+
+    async def copy_async(
+        self,
+        dbapi_connection: psycopg.AsyncConnection[Any],
+        copy_sql: str,
+        df: pd.DataFrame,
+    ) -> None:
+        async with dbapi_connection.cursor() as cursor:
+            async with cursor.copy(copy_sql) as copy:
+                for csv in self.iter_copy_csv(df):
+                    await copy.write(csv)
+
+    def iter_copy_csv(self, df: pd.DataFrame) -> Iterator[str]:
+        for df_chunk in self.iter_copy_chunks(df):
+            yield df_chunk.to_csv(index=False, header=False, na_rep="\\N")
+
+    def iter_copy_chunks(
+        self, df: pd.DataFrame, chunk_size: int = 100_000
+    ) -> Iterator[pd.DataFrame]:
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start : start + chunk_size]
+
+    def match_key(
+        self, staging: sa.Table, df: pd.DataFrame, key: Collection[str]
+    ) -> sa.ColumnElement[bool]:
+        # key columns without nulls in `df` are compared with `=`
+        # so the database can use hash joins and indexes
+        table = cast(sa.Table, DataPoint.__table__)
+        conditions: list[sa.ColumnElement[bool]] = []
+        for col in key:
+            is_null = df[col].isna()
+            if is_null.all():
+                conditions.append(table.c[col].is_(None))
+            elif is_null.any():
+                conditions.append(table.c[col].is_not_distinct_from(staging.c[col]))
+            else:
+                conditions.append(table.c[col] == staging.c[col])
+        return sa.and_(*conditions)
+
+    def merge_staging_table(
+        self, staging: sa.Table, df: pd.DataFrame, key: Collection[str]
+    ) -> None:
+        table = cast(sa.Table, DataPoint.__table__)
+        session = self.executor.session
+        matches_key = self.match_key(staging, df, key)
+        staging_columns = [col for col in staging.c if col.name != "staging_ordinal"]
+        update_columns = [col.name for col in staging_columns if col.name not in key]
+        differs = sa.or_(
+            sa.false(),
+            *(table.c[col].is_distinct_from(staging.c[col]) for col in update_columns),
+        )
+
+        # the version triggers record a transaction per statement, even if
+        # no rows are affected, so only statements with work are executed
+        n_updates, n_inserts = session.execute(
+            sa.select(
+                sa.func.count().filter(table.c.id.is_not(None) & differs),
+                sa.func.count().filter(table.c.id.is_(None)),
+            ).select_from(staging.outerjoin(table, matches_key))
+        ).one()
+
+        if n_updates > 0:
+            update_exc = (
+                sa.update(table)
+                .where(matches_key)
+                .where(differs)
+                .values({col: staging.c[col] for col in update_columns})
+            )
+            session.execute(update_exc)
+
+        if n_inserts > 0:
+            insert_exc = sa.insert(table).from_select(
+                [col.name for col in staging_columns],
+                sa.select(*staging_columns)
+                .where(~sa.exists().where(matches_key).correlate(staging))
+                .order_by(staging.c.staging_ordinal),
+            )
+            session.execute(insert_exc)
+
+    def drop_empty_step_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         cols_to_check = ["step_year", "step_category", "step_datetime"]
         cols_to_drop = [
             col for col in cols_to_check if col in df.columns and df[col].isna().all()
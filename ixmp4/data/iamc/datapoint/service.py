@@ -1,18 +1,29 @@
+from typing import Iterator
+
+import pandas as pd
+import pydantic as pyd
 from toolkit.auth.context import AuthorizationContext, PlatformProtocol
 from toolkit.db.executor import SessionExecutor
 from typing_extensions import Unpack
 
-from ixmp4.base_exceptions import Forbidden
+from ixmp4.base_exceptions import Forbidden, InvalidArguments
 from ixmp4.data.compat_controller import EnumerationCompatibilityController
 from ixmp4.data.dataframe import SerializableDataFrame
 from ixmp4.data.iamc.timeseries.repositories import (
     PandasRepository as TimeSeriesPandasRepository,
 )
-from ixmp4.data.pagination import PaginatedResult, Pagination
+from ixmp4.data.iamc.timeseries.resolver import TimeSeriesResolver
+from ixmp4.data.pagination import PaginatedResult, Pagination, Streaming
+from ixmp4.data.run.repositories import ItemRepository as RunRepository
 from ixmp4.data.services import Http, Service, procedure
 from ixmp4.transport import DirectTransport
 
-from .df_schemas import DeleteDataPointFrameSchema, UpsertDataPointFrameSchema
+from .df_schemas import (
+    DeleteDataPointFrameSchema,
+    IngestDataPointFrameSchema,
+    RemoveDataPointFrameSchema,
+    UpsertDataPointFrameSchema,
+)
 from .filter import DataPointFilter
 from .repositories import PandasRepository, VersionRepository
 
@@ -24,7 +35,10 @@ class DataPointService(Service):
     http_controller = EnumerationCompatibilityController
     executor: SessionExecutor
     pandas: PandasRepository
+    timeseries: TimeSeriesPandasRepository
     versions: VersionRepository
+    resolver: TimeSeriesResolver
+    runs: RunRepository
 
     default_filter: DataPointFilter = {"run": {"default_only": True}}
 
@@ -52,6 +66,8 @@ class DataPointService(Service):
         self.pandas = PandasRepository(self.executor, **self.get_auth_kwargs(transport))
         self.timeseries = TimeSeriesPandasRepository(self.executor)
         self.versions = VersionRepository(self.executor)
+        self.resolver = TimeSeriesResolver(self.executor, self.timeseries)
+        self.runs = RunRepository(self.executor)
 
     def get_columns(
         self, *, join_parameters: bool, join_runs: bool, join_run_id: bool
@@ -153,7 +169,51 @@ class DataPointService(Service):
             pagination=pagination,
         )
 
-    @procedure(Http(methods=("POST",)))
+    @tabulate.streamed()
+    def streamed_tabulate(
+        self,
+        streaming: Streaming,
+        join_parameters: bool = False,
+        join_runs: bool = False,
+        join_run_id: bool = False,
+        **kwargs: Unpack[DataPointFilter],
+    ) -> Iterator[SerializableDataFrame]:
+        return self.pandas.iter_tabulate(
+            values=self.apply_filter_defaults(kwargs),
+            batch_size=streaming.batch_size,
+            columns=self.get_columns(
+                join_parameters=join_parameters,
+                join_runs=join_runs,
+                join_run_id=join_run_id,
+            ),
+        )
+
+    def iter_tabulate(
+        self,
+        batch_size: int,
+        join_parameters: bool = False,
+        join_runs: bool = False,
+        join_run_id: bool = False,
+        **kwargs: Unpack[DataPointFilter],
+    ) -> Iterator[pd.DataFrame]:
+        """Tabulates datapoints like :meth:`tabulate`, but yields data frames
+        of at most `batch_size` rows instead of a single data frame.
+        Empty step columns are dropped per batch."""
+
+        try:
+            streaming = Streaming(batch_size=batch_size)
+        except pyd.ValidationError as e:
+            raise InvalidArguments(validation_error=e)
+
+        iter_batches = DataPointService.tabulate.streamed.bind(self, streaming)
+        return iter_batches(
+            join_parameters=join_parameters,
+            join_runs=join_runs,
+            join_run_id=join_run_id,
+            **kwargs,
+        )
+
+    @procedure(Http(methods=("POST",), chunking="concurrent"))
     def bulk_upsert(self, df: SerializableDataFrame) -> None:
         """Bulk inserts or updates datapoints from a supplied dataframe.
 
@@ -180,7 +240,7 @@ class DataPointService(Service):
             If the dataframe does not conform to `UpsertDataPointFrameSchema`.
         """
         df = self.validate_df_or_raise(df, UpsertDataPointFrameSchema)
-        self.pandas.upsert(df, key=self.full_key & set(df.columns))
+        self.pandas.bulk_upsert(df, key=self.full_key & set(df.columns))
 
     @bulk_upsert.auth_check()
     def bulk_upsert_auth_check(
@@ -194,13 +254,71 @@ class DataPointService(Service):
         model_names = self.timeseries.list_model_names(timeseries_ids)
         auth_ctx.has_edit_permission(platform, models=model_names, raise_exc=Forbidden)
 
-    @procedure(Http(methods=("DELETE",)))
+    # chunks are sent sequentially since each one may create variables
+    @procedure(Http(methods=("POST",), chunking="sequential"))
+    def ingest(self, df: SerializableDataFrame) -> None:
+        """Bulk inserts or updates datapoints and the timeseries they belong to.
+
+        Unlike :meth:`bulk_upsert`, timeseries are referenced by run id and
+        the names of their region, variable and unit. Variables, measurands
+        and timeseries are created as needed and all rows are written in the
+        same transaction, so uploading the data of a run requires a single
+        request per chunk. Clients knowing the ids of the regions and
+        measurands may send those instead of the names to skip resolving them.
+
+        Parameters
+        ----------
+        df: :class:`pandas.DataFrame`
+            DataFrame containing rows of datapoint data to upsert.
+            Must conform to `IngestDataPointFrameSchema` structure.
+
+            Key columns include:
+              - run__id
+              - region or region__id
+              - variable and unit or measurand__id
+              - step_category and/or step_year or step_datetime
+              - type, optional
+              - value
+
+        Raises
+        ------
+        :class:`InvalidDataFrame`
+            If the dataframe does not conform to `IngestDataPointFrameSchema`.
+        :class:`RegionNotFound`:
+            If one or more regions in the dataframe do not exist.
+        :class:`UnitNotFound`:
+            If one or more unit names in the dataframe do not exist.
+        :class:`MeasurandNotFound`:
+            If one or more measurand ids in the dataframe do not exist.
+        """
+        df = self.validate_df_or_raise(df, IngestDataPointFrameSchema)
+        if df.empty:
+            return None
+
+        df = self.resolver.merge_timeseries(df, insert_values=self.get_creation_info())
+        self.pandas.bulk_upsert(df, key=self.full_key & set(df.columns))
+
+    @ingest.auth_check()
+    def ingest_auth_check(
+        self,
+        auth_ctx: AuthorizationContext,
+        platform: PlatformProtocol,
+        /,
+        df: SerializableDataFrame,
+    ) -> None:
+        run_ids = df["run__id"].unique().tolist()
+        model_names = self.runs.list_model_names(run_ids)
+        auth_ctx.has_edit_permission(platform, models=model_names, raise_exc=Forbidden)
+
+    # chunks are sent sequentially since each one deletes orphaned timeseries
+    @procedure(Http(methods=("DELETE",), chunking="sequential"))
     def bulk_delete(self, df: SerializableDataFrame) -> None:
         """Bulk deletes datapoints from a supplied dataframe.
 
         This method accepts a dataframe containing datapoint identifiers and
         deletes the matching records from the database. After deletion, orphaned
-        timeseries (those with no remaining datapoints) are also removed.
+        timeseries (those with no remaining datapoints) among the referenced
+        timeseries are also removed.
 
         Parameters
         ----------
@@ -220,7 +338,7 @@ class DataPointService(Service):
         """
         df = self.validate_df_or_raise(df, DeleteDataPointFrameSchema)
         self.pandas.delete(df, key=self.full_key & set(df.columns))
-        self.timeseries.delete_orphans()
+        self.timeseries.delete_orphans(df["time_series__id"].unique().tolist())
 
     @bulk_delete.auth_check()
     def bulk_delete_auth_check(
@@ -232,3 +350,53 @@ class DataPointService(Service):
         timeseries_ids = df["time_series__id"].unique().tolist()
         model_names = self.timeseries.list_model_names(timeseries_ids)
         auth_ctx.has_edit_permission(platform, models=model_names, raise_exc=Forbidden)
+
+    # chunks are sent sequentially since each one deletes orphaned timeseries
+    @procedure(Http(methods=("DELETE",), chunking="sequential"))
+    def bulk_remove(self, df: SerializableDataFrame) -> None:
+        """Bulk deletes datapoints referenced by run and dimension names.
+
+        Unlike :meth:`bulk_delete`, timeseries are referenced by run id and
+        the names of their region, variable and unit. The names are resolved
+        to existing timeseries without creating any rows, datapoints of
+        timeseries that do not exist are skipped. After deletion, orphaned
+        timeseries (those with no remaining datapoints) are also removed.
+
+        Parameters
+        ----------
+        df: :class:`pandas.DataFrame`
+            DataFrame containing rows of datapoint identifiers to delete.
+            Must conform to `RemoveDataPointFrameSchema` structure.
+
+            Key columns include:
+              - run__id
+              - region
+              - variable
+              - unit
+              - step_category and/or step_year or step_datetime
+              - type, optional
+
+        Raises
+        ------
+        :class:`InvalidDataFrame`
+            If the dataframe does not conform to `RemoveDataPointFrameSchema`.
+        """
+        df = self.validate_df_or_raise(df, RemoveDataPointFrameSchema)
+        df = self.resolver.merge_existing_timeseries(df)
+        if df.empty:
+            return None
+
+        self.pandas.delete(df, key=self.full_key & set(df.columns))
+        self.timeseries.delete_orphans(df["time_series__id"].unique().tolist())
+
+    @bulk_remove.auth_check()
+    def bulk_remove_auth_check(
+        self,
+        auth_ctx: AuthorizationContext,
+        platform: PlatformProtocol,
+        /,
+        df: SerializableDataFrame,
+    ) -> None:
+        run_ids = df["run__id"].unique().tolist()
+        model_names = self.runs.list_model_names(run_ids)
+        auth_ctx.has_edit_permission(platform, models=model_names, raise_exc=Forbidden)
@@ -45,3 +45,9 @@ class TabulateTimeSeriesFrameSchema(pa.DataFrameModel):
     region: pat.Series[pa.String] = pa.Field(coerce=True)
     unit: pat.Series[pa.String] = pa.Field(coerce=True)
     variable: pat.Series[pa.String] = pa.Field(coerce=True)
+
+
+class TabulateDimensionIdsFrameSchema(pa.DataFrameModel):
+    region: pat.Series[pa.String] = pa.Field(coerce=True)
+    unit: pat.Series[pa.String] = pa.Field(coerce=True)
+    variable: pat.Series[pa.String] = pa.Field(coerce=True)
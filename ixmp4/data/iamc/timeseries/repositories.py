@@ -71,12 +71,24 @@ class PandasRepository(TimeSeriesAuthRepository, BasePandasRepository):
         },
     )
 
-    def delete_orphans(self) -> int | None:
+    def delete_orphans(self, ts_ids: Sequence[int]) -> int | None:
+        """Deletes the timeseries in `ts_ids` which have no datapoints.
+        Only the given timeseries are checked, so the cost of the query
+        does not grow with the number of timeseries on the platform."""
+
         exc = self.target.delete_statement()
         exc = exc.where(~TimeSeries.datapoints.any())
 
-        with self.executor.delete(exc) as rowcount:
-            return rowcount
+        total: int | None = 0
+        for chunk in self.executor.iter_chunked(
+            ts_ids, self.executor.max_query_parameters
+        ):
+            with self.executor.delete(exc.where(TimeSeries.id.in_(chunk))) as rowcount:
+                if total is None or rowcount is None:
+                    total = None
+                else:
+                    total += rowcount
+        return total
 
 
 class VersionRepository(PandasRepository):
@@ -0,0 +1,233 @@
+import pandas as pd
+from toolkit.db.executor import SessionExecutor
+from toolkit.db.repositories.base import Values
+
+from ixmp4.data.iamc.measurand.exceptions import MeasurandNotFound
+from ixmp4.data.iamc.measurand.repositories import (
+    PandasRepository as MeasurandPandasRepository,
+)
+from ixmp4.data.iamc.variable.repositories import (
+    PandasRepository as VariablePandasRepository,
+)
+from ixmp4.data.region.exceptions import RegionNotFound
+from ixmp4.data.region.repositories import (
+    PandasRepository as RegionPandasRepository,
+)
+from ixmp4.data.unit.exceptions import UnitNotFound
+from ixmp4.data.unit.repositories import (
+    PandasRepository as UnitPandasRepository,
+)
+
+from .repositories import PandasRepository
+
+
+class TimeSeriesResolver(object):
+    """Resolves the region, variable and unit names of timeseries rows
+    to the ids of the related rows with one query per dimension.
+    Variables, measurands and timeseries are created as needed,
+    regions and units have to exist."""
+
+    key = ["run__id", "region__id", "measurand__id"]
+    name_columns = ["run__id", "region", "variable", "unit"]
+    reference_columns = [
+        "run__id",
+        "region",
+        "region__id",
+        "variable",
+        "unit",
+        "measurand__id",
+    ]
+
+    timeseries: PandasRepository
+    measurands: MeasurandPandasRepository
+    regions: RegionPandasRepository
+    units: UnitPandasRepository
+    variables: VariablePandasRepository
+
+    def __init__(self, executor: SessionExecutor, timeseries: PandasRepository):
+        self.timeseries = timeseries
+        self.measurands = MeasurandPandasRepository(executor)
+        self.regions = RegionPandasRepository(executor)
+        self.units = UnitPandasRepository(executor)
+        self.variables = VariablePandasRepository(executor)
+
+    def merge_regions(self, df: pd.DataFrame) -> pd.DataFrame:
+        region_names = (
+            df[["region"]].drop_duplicates().rename(columns={"region": "name"})
+        )
+        regions = self.regions.tabulate_by_df(region_names, columns=["id", "name"])
+        regions = regions.rename(columns={"name": "region", "id": "region__id"})
+        merged_df = df.merge(
+            regions,
+            how="left",
+            on=["region"],
+        )
+        missing_regions = merged_df[pd.isna(merged_df["region__id"])]
+        if not missing_regions.empty:
+            missing_region_names = missing_regions["region"].unique()
+            raise RegionNotFound(", ".join(missing_region_names))
+
+        return merged_df.drop(columns=["region"])
+
+    def merge_units(self, df: pd.DataFrame) -> pd.DataFrame:
+        unit_names = df[["unit"]].drop_duplicates().rename(columns={"unit": "name"})
+        units = self.units.tabulate_by_df(unit_names, columns=["id", "name"])
+        units = units.rename(columns={"name": "unit", "id": "unit__id"})
+        merged_df = df.merge(
+            units,
+            how="left",
+            on=["unit"],
+        )
+        missing_units = merged_df[pd.isna(merged_df["unit__id"])]
+        if not missing_units.empty:
+            missing_unit_names = missing_units["unit"].unique()
+            raise UnitNotFound(", ".join(missing_unit_names))
+
+        return merged_df.drop(columns=["unit"])
+
+    def merge_variables(
+        self, df: pd.DataFrame, insert_values: Values | None = None
+    ) -> pd.DataFrame:
+        variable_df = df[["variable"]].rename(columns={"variable": "name"})
+        variable_df = variable_df.drop_duplicates()
+        variable_names = variable_df["name"].to_list()
+        self.variables.upsert(variable_df, insert_values=insert_values)
+
+        variables = self.variables.tabulate(
+            values={"name__in": variable_names}, columns=["id", "name"]
+        )
+        variables = variables.rename(columns={"name": "variable", "id": "variable__id"})
+        merged_df = df.merge(
+            variables,
+            how="left",
+            on=["variable"],
+        )
+        return merged_df.drop(columns=["variable"])
+
+    def merge_measurands(
+        self, df: pd.DataFrame, insert_values: Values | None = None
+    ) -> pd.DataFrame:
+        measurand_df = df[["variable__id", "unit__id"]].drop_duplicates()
+        self.measurands.upsert(measurand_df, insert_values=insert_values)
+
+        measurand_df = self.measurands.tabulate_by_df(
+            measurand_df, columns=["id", "variable__id", "unit__id"]
+        )
+        measurand_df = measurand_df.rename(columns={"id": "measurand__id"})
+        merged_df = df.merge(
+            measurand_df,
+            how="left",
+            on=["variable__id", "unit__id"],
+        )
+        return merged_df.drop(columns=["variable__id", "unit__id"])
+
+    def upsert(
+        self, df: pd.DataFrame, insert_values: Values | None = None
+    ) -> pd.DataFrame:
+        """Upserts the timeseries in `df` after resolving the names of related
+        rows. Returns `df` with id columns in place of the name columns,
+        the order of the rows is preserved."""
+
+        if "region" in df.columns:
+            df = self.merge_regions(df)
+        else:
+            self.check_region_ids(df["region__id"])
+        if "unit" in df.columns:
+            df = self.merge_units(df)
+        if "variable" in df.columns:
+            df = self.merge_variables(df, insert_values=insert_values)
+        if "variable__id" in df.columns and "unit__id" in df.columns:
+            df = self.merge_measurands(df, insert_values=insert_values)
+        elif "measurand__id" in df.columns:
+            self.check_measurand_ids(df["measurand__id"])
+
+        self.timeseries.upsert(df)
+        return df
+
+    def merge_timeseries(
+        self, df: pd.DataFrame, insert_values: Values | None = None
+    ) -> pd.DataFrame:
+        """Upserts the timeseries referenced by the rows of `df` and returns `df`
+        with a `time_series__id` column in place of the `run__id`, `region`,
+        `variable` and `unit` columns. Regions and measurands may also be
+        referenced by id via `region__id` and `measurand__id` columns."""
+
+        columns = [c for c in self.reference_columns if c in df.columns]
+        ts_df = df[columns].drop_duplicates().reset_index(drop=True)
+        id_df = self.upsert(ts_df, insert_values=insert_values)
+
+        timeseries = self.timeseries.tabulate_by_df(
+            id_df, key=self.key, columns=["id", *self.key]
+        )
+        id_df = id_df.merge(timeseries, how="left", on=self.key)
+        ts_df["time_series__id"] = id_df["id"].to_numpy()
+
+        return df.merge(ts_df, how="left", on=columns).drop(columns=columns)
+
+    def check_region_ids(self, region_ids: "pd.Series[int]") -> None:
+        ids = region_ids.drop_duplicates()
+        regions = self.regions.tabulate_by_df(
+            ids.to_frame("id"), key=["id"], columns=["id"]
+        )
+        missing_ids = ids[~ids.isin(regions["id"])]
+        if not missing_ids.empty:
+            raise RegionNotFound(
+                "Regions with ids " + ", ".join(map(str, missing_ids.to_list()))
+            )
+
+    def check_measurand_ids(self, measurand_ids: "pd.Series[int]") -> None:
+        ids = measurand_ids.drop_duplicates()
+        measurands = self.measurands.tabulate_by_df(
+            ids.to_frame("id"), key=["id"], columns=["id"]
+        )
+        missing_ids = ids[~ids.isin(measurands["id"])]
+        if not missing_ids.empty:
+            raise MeasurandNotFound(
+                "Measurands with ids " + ", ".join(map(str, missing_ids.to_list()))
+            )
+
+    def tabulate_ids(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Returns the distinct `region`, `variable` and `unit` combinations of
+        `df` with the ids of the existing rows they reference in `region__id`,
+        `unit__id`, `variable__id` and `measurand__id` columns.
+        Ids of rows that do not exist are missing, nothing is created."""
+
+        df = df[["region", "variable", "unit"]].drop_duplicates()
+        for column, repo in [
+            ("region", self.regions),
+            ("unit", self.units),
+            ("variable", self.variables),
+        ]:
+            names = df[[column]].drop_duplicates().rename(columns={column: "name"})
+            ids = repo.tabulate_by_df(names, key=["name"], columns=["id", "name"])
+            ids = ids.rename(columns={"name": column, "id": column + "__id"})
+            df = df.merge(ids, how="left", on=[column])
+
+        measurand_df = (
+            df[["variable__id", "unit__id"]].dropna().drop_duplicates().astype(int)
+        )
+        measurands = self.measurands.tabulate_by_df(
+            measurand_df,
+            key=["variable__id", "unit__id"],
+            columns=["id", "variable__id", "unit__id"],
+        ).rename(columns={"id": "measurand__id"})
+        df = df.merge(measurands, how="left", on=["variable__id", "unit__id"])
+
+        id_columns = ["region__id", "unit__id", "variable__id", "measurand__id"]
+        return df.astype({c: "Int64" for c in id_columns}).reset_index(drop=True)
+
+    def merge_existing_timeseries(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Returns the rows of `df` referencing existing timeseries with a
+        `time_series__id` column in place of the `run__id`, `region`,
+        `variable` and `unit` columns. Nothing is created, rows referencing
+        missing timeseries are dropped."""
+
+        ts_df = df[self.name_columns].drop_duplicates()
+        timeseries = self.timeseries.tabulate_by_df(
+            ts_df, key=self.name_columns, columns=["id", *self.name_columns]
+        )
+        timeseries = timeseries.rename(columns={"id": "time_series__id"})
+
+        return df.merge(timeseries, how="inner", on=self.name_columns).drop(
+            columns=self.name_columns
+        )
@@ -1,4 +1,3 @@
-import pandas as pd
 from toolkit.auth.context import AuthorizationContext, PlatformProtocol
 from toolkit.db.executor import SessionExecutor
 from typing_extensions import Unpack
@@ -6,28 +5,19 @@ from typing_extensions import Unpack
 from ixmp4.base_exceptions import Forbidden
 from ixmp4.data.compat_controller import EnumerationCompatibilityController
 from ixmp4.data.dataframe import SerializableDataFrame
-from ixmp4.data.iamc.measurand.repositories import (
-    PandasRepository as MeasurandPandasRepository,
-)
-from ixmp4.data.iamc.variable.repositories import (
-    PandasRepository as VariablePandasRepository,
-)
 from ixmp4.data.pagination import PaginatedResult, Pagination
-from ixmp4.data.region.exceptions import RegionNotFound
-from ixmp4.data.region.repositories import (
-    PandasRepository as RegionPandasRepository,
-)
 from ixmp4.data.run.repositories import ItemRepository as RunRepository
 from ixmp4.data.services import Http, Service, procedure
-from ixmp4.data.unit.exceptions import UnitNotFound
-from ixmp4.data.unit.repositories import (
-    PandasRepository as UnitPandasRepository,
-)
 from ixmp4.transport import DirectTransport
 
-from .df_schemas import TabulateTimeSeriesFrameSchema, UpsertTimeSeriesFrameSchema
+from .df_schemas import (
+    TabulateDimensionIdsFrameSchema,
+    TabulateTimeSeriesFrameSchema,
+    UpsertTimeSeriesFrameSchema,
+)
 from .filter import TimeSeriesFilter
 from .repositories import PandasRepository, VersionRepository
+from .resolver import TimeSeriesResolver
 
 
 class TimeSeriesService(Service):
@@ -38,11 +28,7 @@ class TimeSeriesService(Service):
     executor: SessionExecutor
     pandas: PandasRepository
     versions: VersionRepository
-
-    measurands: MeasurandPandasRepository
-    regions: RegionPandasRepository
-    units: UnitPandasRepository
-    variables: VariablePandasRepository
+    resolver: TimeSeriesResolver
     runs: RunRepository
 
     default_filter: TimeSeriesFilter = {"run": {"default_only": True}}
@@ -51,11 +37,7 @@ class TimeSeriesService(Service):
         self.executor = SessionExecutor(transport.session)
         self.pandas = PandasRepository(self.executor, **self.get_auth_kwargs(transport))
         self.versions = VersionRepository(self.executor)
-
-        self.measurands = MeasurandPandasRepository(self.executor)
-        self.regions = RegionPandasRepository(self.executor)
-        self.units = UnitPandasRepository(self.executor)
-        self.variables = VariablePandasRepository(self.executor)
+        self.resolver = TimeSeriesResolver(self.executor, self.pandas)
         self.runs = RunRepository(self.executor)
 
     @procedure(Http(methods=("PATCH",)))
@@ -95,6 +77,44 @@ class TimeSeriesService(Service):
     ) -> None:
         auth_ctx.has_view_permission(platform, raise_exc=Forbidden)
 
+    @procedure(Http(methods=("PATCH",)))
+    def tabulate_dimension_ids(
+        self, df: SerializableDataFrame
+    ) -> SerializableDataFrame:
+        """Tabulates the ids of the regions, units, variables and measurands
+        referenced by the names in a supplied dataframe. Nothing is created.
+
+        Parameters
+        ----------
+        df: :class:`pandas.DataFrame`
+            DataFrame containing rows of names to resolve.
+                - region
+                - variable
+                - unit
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`:
+            A data frame with one row per distinct name combination and the
+            columns:
+                - region
+                - variable
+                - unit
+                - region__id
+                - unit__id
+                - variable__id
+                - measurand__id
+            Ids of rows that do not exist are missing (``pd.NA``).
+        """
+        df = self.validate_df_or_raise(df, TabulateDimensionIdsFrameSchema)
+        return self.resolver.tabulate_ids(df)
+
+    @tabulate_dimension_ids.auth_check()
+    def tabulate_dimension_ids_auth_check(
+        self, auth_ctx: AuthorizationContext, platform: PlatformProtocol
+    ) -> None:
+        auth_ctx.has_view_permission(platform, raise_exc=Forbidden)
+
     @procedure(Http(methods=("PATCH",)))
     def tabulate(
         self, join_parameters: bool = False, **kwargs: Unpack[TimeSeriesFilter]
@@ -160,73 +180,8 @@ class TimeSeriesService(Service):
             pagination=pagination,
         )
 
-    def merge_regions(self, df: pd.DataFrame) -> pd.DataFrame:
-        region_names = (
-            df[["region"]].drop_duplicates().rename(columns={"region": "name"})
-        )
-        regions = self.regions.tabulate_by_df(region_names, columns=["id", "name"])
-        regions = regions.rename(columns={"name": "region", "id": "region__id"})
-        merged_df = df.merge(
-            regions,
-            how="left",
-            on=["region"],
-        )
-        missing_regions = merged_df[pd.isna(merged_df["region__id"])]
-        if not missing_regions.empty:
-            missing_region_names = missing_regions["region"].unique()
-            raise RegionNotFound(", ".join(missing_region_names))
-
-        return merged_df.drop(columns=["region"])
-
-    def merge_units(self, df: pd.DataFrame) -> pd.DataFrame:
-        unit_names = df[["unit"]].drop_duplicates().rename(columns={"unit": "name"})
-        units = self.units.tabulate_by_df(unit_names, columns=["id", "name"])
-        units = units.rename(columns={"name": "unit", "id": "unit__id"})
-        merged_df = df.merge(
-            units,
-            how="left",
-            on=["unit"],
-        )
-        missing_units = merged_df[pd.isna(merged_df["unit__id"])]
-        if not missing_units.empty:
-            missing_unit_names = missing_units["unit"].unique()
-            raise UnitNotFound(", ".join(missing_unit_names))
-
-        return merged_df.drop(columns=["unit"])
-
-    def merge_variables(self, df: pd.DataFrame) -> pd.DataFrame:
-        variable_df = df[["variable"]].rename(columns={"variable": "name"})
-        variable_df = variable_df.drop_duplicates()
-        variable_names = variable_df["name"].to_list()
-        self.variables.upsert(variable_df, insert_values=self.get_creation_info())
-
-        variables = self.variables.tabulate(
-            values={"name__in": variable_names}, columns=["id", "name"]
-        )
-        variables = variables.rename(columns={"name": "variable", "id": "variable__id"})
-        merged_df = df.merge(
-            variables,
-            how="left",
-            on=["variable"],
-        )
-        return merged_df.drop(columns=["variable"])
-
-    def merge_measurands(self, df: pd.DataFrame) -> pd.DataFrame:
-        measurand_df = df[["variable__id", "unit__id"]].drop_duplicates()
-        self.measurands.upsert(measurand_df, insert_values=self.get_creation_info())
-
-        measurand_df = self.measurands.tabulate_by_df(
-            measurand_df, columns=["id", "variable__id", "unit__id"]
-        )
-        measurand_df = measurand_df.rename(columns={"id": "measurand__id"})
-        merged_df = df.merge(
-            measurand_df,
-            how="left",
-            on=["variable__id", "unit__id"],
-        )
-        return merged_df.drop(columns=["variable__id", "unit__id"])
-
-    @procedure(Http(methods=("POST",)))
+    # chunks are sent sequentially since each one may create variables
+    @procedure(Http(methods=("POST",), chunking="sequential"))
     def bulk_upsert(self, df: SerializableDataFrame) -> None:
         r"""Bulk inserts or updates timeseries from a supplied dataframe.
 
@@ -262,16 +217,7 @@ class TimeSeriesService(Service):
         if df.empty:
             return None
 
-        if "region" in df.columns:
-            df = self.merge_regions(df)
-        if "unit" in df.columns:
-            df = self.merge_units(df)
-        if "variable" in df.columns:
-            df = self.merge_variables(df)
-        if "variable__id" in df.columns and "unit__id" in df.columns:
-            df = self.merge_measurands(df)
-
-        self.pandas.upsert(df)
+        self.resolver.upsert(df, insert_values=self.get_creation_info())
 
     @bulk_upsert.auth_check()
     def bulk_upsert_auth_check(
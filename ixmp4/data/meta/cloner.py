@@ -0,0 +1,25 @@
+from typing import Any
+
+import sqlalchemy as sa
+from toolkit.db.target import ModelTarget
+
+from ixmp4.data.base.cloner import Cloner, ClonerRepository
+
+from .db import RunMetaEntry
+
+
+class MetaClonerRepository(ClonerRepository):
+    target = ModelTarget(RunMetaEntry)
+
+    def select_clones(
+        self, src_run__id: int, dst_run__id: int, keep_solution: bool
+    ) -> sa.Select[Any]:
+        table = self.target.table
+        return (
+            sa.select(*self.clone_columns(table, run__id=sa.literal(dst_run__id)))
+            .where(table.c.run__id == src_run__id)
+            .order_by(table.c.id)
+        )
+
+
+run_cloner = Cloner(targets=[MetaClonerRepository])
@@ -219,7 +219,8 @@ class RunMetaEntryService(Service):
 
         return columns
 
-    @procedure(Http(methods=("PATCH",)))
+    # rows are ordered by run and key, so the last id of a page is no cursor
+    @procedure(Http(methods=("PATCH",), keyset_pagination=False))
     def tabulate(
         self,
         include_run_index: bool = False,
@@ -1,8 +1,9 @@
-from typing import TYPE_CHECKING, Generic, TypeVar
+import json
+from typing import TYPE_CHECKING, Any, Generic, Sequence, TypeVar
 
 import sqlalchemy as sa
 from sqlalchemy import orm
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.orm.decl_api import declared_attr
 from toolkit.db.types import Integer, Mapped, String
@@ -42,6 +43,37 @@ class IndexsetAssociationVersionModel(BaseVersionModel):
     column_name: String = orm.mapped_column(sa.String(255), nullable=True)
 
 
+class IndexedDataModel(BaseModel):
+    """One row of an indexed item's data. `key` holds the JSON encoded values of
+    the item's index columns, `record` all other columns of the row."""
+
+    __abstract__ = True
+
+    key: String = orm.mapped_column(sa.Text, nullable=False)
+    record: Mapped[dict[str, Any]] = orm.mapped_column(
+        sa.JSON().with_variant(JSONB(), "postgresql"), nullable=False, default={}
+    )
+
+    @classmethod
+    def get_item_id_column(cls) -> sa.ColumnElement[int]:
+        raise NotImplementedError
+
+
+class IndexedDataVersionModel(BaseVersionModel):
+    __abstract__ = True
+
+    key: String = orm.mapped_column(sa.Text, nullable=False)
+    record: Mapped[dict[str, Any]] = orm.mapped_column(
+        sa.JSON().with_variant(JSONB(), "postgresql"), nullable=False, default={}
+    )
+
+
+def decode_json_list(values: str) -> list[Any]:
+    """Decodes comma separated JSON documents with a single call."""
+    decoded: list[Any] = json.loads("[" + values + "]")
+    return decoded
+
+
 AssocT = TypeVar("AssocT", bound=IndexsetAssociationModel)
 
 
@@ -61,14 +93,90 @@ class IndexedModel(BaseModel, Generic[AssocT]):
             "Run", foreign_keys=[cls.run__id], lazy="select", viewonly=True
         )
 
-    data: Mapped[dict[str, list[float] | list[int] | list[str]]] = orm.mapped_column(
-        sa.JSON().with_variant(JSONB(), "postgresql"), nullable=False, default={}
-    )
-
     indexset_associations: orm.Relationship[list["AssocT"]]
     indexsets: AssociationProxy[list["IndexSet"]] = association_proxy(
         "indexset_associations", "indexset"
     )
+    data_entries: orm.Relationship[list[Any]]
+
+    @property
+    def data(self) -> dict[str, list[float] | list[int] | list[str]]:
+        session = orm.object_session(self)
+        if session is None:
+            return self.build_data(
+                [json.loads(entry.key) for entry in self.data_entries],
+                [entry.record for entry in self.data_entries],
+            )
+
+        dialect_name = session.get_bind().dialect.name
+        exc = self.select_joined_data(dialect_name, [self.id])
+        row = session.execute(exc).one_or_none()
+        if row is None:
+            return {}
+        return self.build_data(
+            decode_json_list(row.data_keys), decode_json_list(row.data_records)
+        )
+
+    @classmethod
+    def get_data_model(cls) -> type[IndexedDataModel]:
+        data_model: type[IndexedDataModel] = (
+            sa.inspect(cls).relationships["data_entries"].mapper.class_
+        )
+        return data_model
+
+    @classmethod
+    def select_joined_data(
+        cls, dialect_name: str, ids: Sequence[int]
+    ) -> sa.Select[tuple[int, str, str]]:
+        """Selects the keys and the records of the data rows of each item as one
+        comma separated string each, in the order the rows were added, so no
+        object or result row is built per data row."""
+        data_model = cls.get_data_model()
+        item_id = data_model.get_item_id_column()
+        record = sa.cast(data_model.record, sa.Text)
+
+        if dialect_name == "postgresql":
+            separator: sa.ColumnElement[str] = sa.literal_column("','")
+            return (
+                sa.select(
+                    item_id.label("item_id"),
+                    sa.func.string_agg(
+                        data_model.key, aggregate_order_by(separator, data_model.id)
+                    ).label("data_keys"),
+                    sa.func.string_agg(
+                        record, aggregate_order_by(separator, data_model.id)
+                    ).label("data_records"),
+                )
+                .where(item_id.in_(ids))
+                .group_by(item_id)
+            )
+
+        # sqlite aggregates the rows of an ordered subquery in its order
+        rows = (
+            sa.select(item_id.label("item_id"), data_model.key, record.label("record"))
+            .where(item_id.in_(ids))
+            .order_by(item_id, data_model.id)
+            .subquery()
+        )
+        return sa.select(
+            rows.c.item_id,
+            sa.func.group_concat(rows.c.key, ",").label("data_keys"),
+            sa.func.group_concat(rows.c.record, ",").label("data_records"),
+        ).group_by(rows.c.item_id)
+
+    def build_data(
+        self, keys: list[list[Any]], records: list[dict[str, Any]]
+    ) -> dict[str, list[float] | list[int] | list[str]]:
+        """Assembles the item's data columns from the decoded keys and records of
+        its data rows."""
+        if len(keys) == 0:
+            return {}
+
+        columns = self.column_names or self.indexset_names or []
+        data = {column: list(values) for column, values in zip(columns, zip(*keys))}
+        for column in records[0]:
+            data[column] = [record[column] for record in records]
+        return data
 
     @property
     def indexset_names(self) -> list[str] | None:
@@ -86,7 +194,3 @@ class IndexedVersionModel(BaseVersionModel):
 
     name: String = orm.mapped_column(sa.String(255), nullable=False)
     run__id: Integer = orm.mapped_column(sa.Integer, nullable=False, index=True)
-
-    data: Mapped[dict[str, list[float] | list[int] | list[str]]] = orm.mapped_column(
-        sa.JSON().with_variant(JSONB(), "postgresql"), nullable=False, default={}
-    )
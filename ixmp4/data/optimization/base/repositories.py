@@ -1,11 +1,15 @@
 import abc
+import itertools
+import json
 import logging
-from typing import Any, ClassVar, Collection, Generic, TypeVar
+from typing import Any, ClassVar, Collection, Generic, Sequence, TypeVar
 
 import pandas as pd
 import sqlalchemy as sa
+from sqlalchemy import orm
+from sqlalchemy.dialects.postgresql import JSONB
 from toolkit.db.executor import SessionExecutor
-from toolkit.db.repositories import ItemRepository
+from toolkit.db.repositories import ItemRepository, PandasRepository
 from toolkit.db.target import ModelTarget
 
 from ixmp4.base_exceptions import (
@@ -13,8 +17,14 @@ from ixmp4.base_exceptions import (
     OptimizationItemUsageError,
 )
 from ixmp4.data.optimization.indexset.db import IndexSet
+from ixmp4.data.optimization.indexset.type import Type
 
-from .db import IndexedModel, IndexsetAssociationModel
+from .db import (
+    IndexedDataModel,
+    IndexedModel,
+    IndexsetAssociationModel,
+    decode_json_list,
+)
 
 logger = logging.getLogger(__name__)
 AssocT = TypeVar("AssocT", bound=IndexsetAssociationModel)
@@ -29,6 +39,7 @@ class IndexedRepository(
     executor: SessionExecutor
     target: ModelTarget[IndexedModelT]
     association_target: ModelTarget[AssocT]
+    data_target: ModelTarget[IndexedDataModel]
     idxset_target = ModelTarget(IndexSet)
     DataInvalid: ClassVar[type[OptimizationDataValidationError]]
     extra_data_columns: Collection[str] = {}
@@ -37,21 +48,34 @@ class IndexedRepository(
     def add_data(self, id: int, data: pd.DataFrame) -> None:
         indexed_item = self.get_by_pk({"id": id})
         index_list = indexed_item.column_names or indexed_item.indexset_names
-        existing_data = pd.DataFrame(indexed_item.data)
+
+        # Stored rows were validated when they were added, so only the incoming
+        # rows are checked; rows with keys that are already stored are replaced.
+        self.validate_data(
+            indexed_item, data, indexed_item.indexsets, indexed_item.column_names
+        )
 
         if index_list:
             data = data.set_index(index_list)
-            if not existing_data.empty:
-                existing_data.set_index(index_list, inplace=True)
 
-        data = data.combine_first(existing_data)
-        if index_list:
-            data = data.reset_index()
+        keys = self.get_data_keys(indexed_item, data.index)
+        records: list[dict[Any, Any]] = (
+            data.to_dict(orient="records")
+            if len(data.columns) > 0
+            else [{} for _ in keys]
+        )
+        self.upsert_data_rows(indexed_item, keys, records)
+
+    def validate(self, id: int) -> None:
+        """Validates all stored data of the item against its indexsets."""
+        indexed_item = self.get_by_pk({"id": id})
+        data = pd.DataFrame(indexed_item.data)
+        if data.empty:
+            return
 
         self.validate_data(
             indexed_item, data, indexed_item.indexsets, indexed_item.column_names
         )
-        self.update_by_pk({"id": id, "data": data.to_dict(orient="list")})
 
     def remove_data(self, id: int, data: pd.DataFrame) -> None:
         indexed_item = self.get_by_pk({"id": id})
@@ -64,10 +88,6 @@ class IndexedRepository(
             )
             return  # can't remove specific data from unindexed variable
 
-        existing_data = pd.DataFrame(indexed_item.data)
-        if not existing_data.empty:
-            existing_data.set_index(index_list, inplace=True)
-
         # This is the only kind of validation we do for removal data
         try:
             data = data.set_index(index_list)
@@ -82,14 +102,170 @@ class IndexedRepository(
                 "to remove associated levels and marginals!"
             ) from e
 
-        remaining_data = existing_data[~existing_data.index.isin(data.index)]
-        if not remaining_data.index.empty:
-            remaining_data.reset_index(inplace=True)
+        self.delete_data_rows(id, self.get_data_keys(indexed_item, data.index))
 
-        if remaining_data.empty:
-            self.update_by_pk({"id": id, "data": {}})
-        else:
-            self.update_by_pk({"id": id, "data": remaining_data.to_dict(orient="list")})
+    def get_data_keys(
+        self, item: IndexedModel[AssocT], index: "pd.Index[Any]"
+    ) -> list[str]:
+        """Encodes the values of `index` as keys of the item's data rows.
+        Unindexed items are keyed by row position."""
+        if not item.indexset_names:
+            return [json.dumps([int(position)]) for position in index]
+
+        pytypes = [
+            Type(indexset.data_type).to_pytype() if indexset.data_type else None
+            for indexset in item.indexsets
+        ]
+        keys: list[str] = []
+        for values in index:
+            if not isinstance(values, tuple):
+                values = (values,)
+            keys.append(
+                json.dumps(
+                    [
+                        self.normalize_key_value(value, pytype)
+                        for value, pytype in zip(values, pytypes)
+                    ]
+                )
+            )
+        return keys
+
+    def normalize_key_value(self, value: Any, pytype: type | None) -> Any:
+        if pytype is not None:
+            try:
+                return pytype(value)
+            except (TypeError, ValueError):
+                pass
+        # Values which are not valid for the indexset can't match a stored key
+        return value.item() if hasattr(value, "item") else value
+
+    def select_data_rows(self, id: int, keys: list[str]) -> dict[str, Any]:
+        model_class = self.data_target.model_class
+        selected_keys = self.select_json_rows([(key,) for key in keys])
+        exc = sa.select(model_class.id, model_class.key, model_class.record).where(
+            model_class.get_item_id_column() == id,
+            model_class.key.in_(sa.select(selected_keys.c.value)),
+        )
+        with self.executor.select(exc) as result:
+            return {row.key: row for row in result}
+
+    def upsert_data_rows(
+        self,
+        item: IndexedModel[AssocT],
+        keys: list[str],
+        records: list[dict[Any, Any]],
+    ) -> None:
+        existing_rows = self.select_data_rows(item.id, keys)
+
+        updates: list[tuple[int, dict[Any, Any]]] = []
+        inserts: list[tuple[str, dict[Any, Any]]] = []
+        for key, record in zip(keys, records):
+            row = existing_rows.get(key)
+            if row is None:
+                inserts.append((key, record))
+            elif row.record != record:
+                updates.append((row.id, record))
+
+        # Rows are written with one statement each for updates and inserts, so
+        # the statement-level version triggers fire once.
+        with self.wrap_executor_exception():
+            if updates:
+                with self.executor.update(self.update_data_rows_statement(updates)):
+                    pass
+            if inserts:
+                exc = self.insert_data_rows_statement(item.id, inserts)
+                with self.executor.insert_many(exc):
+                    pass
+
+    def select_json_rows(self, rows: Sequence[tuple[Any, ...]]) -> sa.Subquery:
+        """Selects pairs of a key or id and an optional record, passed as a single
+        JSON encoded parameter, as the columns `position`, `value` and `record`.
+        Compiling a statement with parameters for every row takes far longer than
+        running it."""
+        payload = sa.literal(rows, self.data_target.model_class.record.type)
+        if self.executor.engine.dialect.name == "postgresql":
+            elements = (
+                sa.func.jsonb_array_elements(payload)
+                .table_valued(sa.column("value", JSONB), with_ordinality="position")
+                .render_derived()
+            )
+            return sa.select(
+                elements.c.position,
+                elements.c.value[0].astext.label("value"),
+                elements.c.value[1].label("record"),
+            ).subquery()
+
+        elements = sa.func.json_each(payload).table_valued("key", "value")
+        return sa.select(
+            elements.c.key.label("position"),
+            sa.func.json_extract(elements.c.value, "$[0]").label("value"),
+            sa.func.json_extract(elements.c.value, "$[1]").label("record"),
+        ).subquery()
+
+    def insert_data_rows_statement(
+        self, item_id: int, inserts: Sequence[tuple[str, dict[Any, Any]]]
+    ) -> sa.Insert:
+        table = self.data_target.table
+        item_id_key = str(self.data_target.model_class.get_item_id_column().key)
+        rows = self.select_json_rows(inserts)
+        return sa.insert(table).from_select(
+            [item_id_key, "key", "record"],
+            sa.select(sa.literal(item_id), rows.c.value, rows.c.record).order_by(
+                rows.c.position
+            ),
+        )
+
+    def update_data_rows_statement(
+        self, updates: Sequence[tuple[int, dict[Any, Any]]]
+    ) -> sa.Update:
+        table = self.data_target.table
+        rows = self.select_json_rows(updates)
+        return (
+            sa.update(table)
+            .where(table.c.id == sa.cast(rows.c.value, sa.Integer))
+            .values(record=rows.c.record)
+        )
+
+    def delete_data_rows(self, id: int, keys: list[str]) -> None:
+        model_class = self.data_target.model_class
+        exc = sa.delete(model_class).where(model_class.get_item_id_column() == id)
+        chunk_size = self.executor.max_query_parameters - 1
+        with self.wrap_executor_exception():
+            for chunk in self.executor.iter_chunked(keys, chunk_size):
+                with self.executor.delete(exc.where(model_class.key.in_(chunk))):
+                    pass
+
+    def delete_data(self, id: int) -> int | None:
+        model_class = self.data_target.model_class
+        exc = sa.delete(model_class).where(model_class.get_item_id_column() == id)
+        with self.wrap_executor_exception():
+            with self.executor.delete(exc) as rowcount:
+                return rowcount
+
+    def select_run_item_ids(self, run__id: int) -> sa.Select[tuple[int]]:
+        model_class = self.target.model_class
+        return sa.select(model_class.id).where(model_class.run__id == run__id)
+
+    def delete_run_data(self, run__id: int) -> int | None:
+        """Deletes the data of all items of the run."""
+        model_class = self.data_target.model_class
+        exc = sa.delete(model_class).where(
+            model_class.get_item_id_column().in_(self.select_run_item_ids(run__id))
+        )
+        with self.wrap_executor_exception():
+            with self.executor.delete(exc) as rowcount:
+                return rowcount
+
+    def has_run_data(self, run__id: int) -> bool:
+        """Checks whether any item of the run has data."""
+        model_class = self.data_target.model_class
+        exc = sa.select(
+            sa.exists().where(
+                model_class.get_item_id_column().in_(self.select_run_item_ids(run__id))
+            )
+        )
+        with self.executor.select(exc) as result:
+            return bool(result.scalar_one())
 
     def get_linked_ids(self, id: int) -> list[int]:
         exc = sa.select(self.association_target.model_class.get_item_id_column()).where(
@@ -111,50 +287,69 @@ class IndexedRepository(
         indexset: IndexSet,
         data: list[int] | list[float] | list[str],
     ) -> None:
-        # get items
-        exc = self.target.select_statement().where(
-            self.target.model_class.indexsets.any(
-                self.idxset_target.model_class.id == indexset.id
-            )
+        """Deletes the data rows of all items linked to `indexset` that reference
+        any of `data` in a column constrained to it."""
+        if indexset.data_type is None:
+            return  # no data can reference an empty indexset
+
+        data_type = Type(indexset.data_type)
+        values = [
+            self.normalize_key_value(value, data_type.to_pytype()) for value in data
+        ]
+        model_class = self.data_target.model_class
+        item_id_column = model_class.get_item_id_column()
+
+        for position, item_ids in self.get_linked_positions(indexset.id).items():
+            exc = sa.delete(model_class).where(item_id_column.in_(item_ids))
+            key_value = self.get_key_value(position, data_type)
+            chunk_size = self.executor.max_query_parameters - len(item_ids)
+            with self.wrap_executor_exception():
+                for chunk in self.executor.iter_chunked(values, chunk_size):
+                    with self.executor.delete(exc.where(key_value.in_(chunk))):
+                        pass
+
+    def get_linked_positions(self, indexset_id: int) -> dict[int, list[int]]:
+        """Maps the positions at which linked items are constrained to the indexset
+        to the ids of these items."""
+        association = self.association_target.model_class
+        item_id_column = association.get_item_id_column()
+        linked_ids = sa.select(item_id_column).where(
+            association.indexset__id == indexset_id
+        )
+        exc = (
+            sa.select(item_id_column, association.indexset__id)
+            .where(item_id_column.in_(linked_ids))
+            .order_by(item_id_column, association.id)
         )
-        with self.executor.select(exc) as result:
-            items: list[IndexedModel[AssocT]] = list(result.scalars().all())
-
-        for item in items:
-            # Convert existing data for manipulation
-            df = pd.DataFrame(item.data)
-
-            if df.empty:
-                continue  # nothing to do
-
-            # Identify column/dimension names to target; item and name must be linked
-            columns = self.get_constrained_data_columns(item, indexset.name)
-
-            # Prepare data template to exclude
-            invalid_data = {columns[i]: data for i in range(len(columns))}
-
-            # Prepare stored data to remove
-            # NOTE if any linked column is not of type str, this may be incorrect
-            remove_data = df[df[columns].isin(invalid_data).any(axis=1)]
-
-            self.remove_data(item.id, remove_data)
 
-    def get_constrained_data_columns(
-        self, item: IndexedModel[AssocT], name: str
-    ) -> list[str]:
-        if not item.column_names:
-            # The item's indexset_names must be a unique list of names
-            return [name]
+        positions: dict[int, list[int]] = {}
+        with self.executor.select(exc) as result:
+            rows = result.all()
+
+        for item_id, item_rows in itertools.groupby(rows, key=lambda row: row[0]):
+            for position, row in enumerate(item_rows):
+                if row.indexset__id == indexset_id:
+                    positions.setdefault(position, []).append(item_id)
+        return positions
+
+    def get_key_value(self, position: int, data_type: Type) -> sa.ColumnElement[Any]:
+        """Returns an expression selecting the value at `position` of the keys of
+        data rows."""
+        key = self.data_target.table.c.key
+        if self.executor.engine.dialect.name == "postgresql":
+            element = sa.cast(key, sa.JSON)[position]
         else:
-            # If we have column_names, we must also have indexsets
-            assert item.indexset_names
-
-            # Handle possible duplicate values
-            return [
-                item.column_names[i]
-                for i in range(len(item.column_names))
-                if item.indexset_names[i] == name
-            ]
+            # sqlite would convert the text to a number when casting to JSON
+            element = sa.type_coerce(key, sa.JSON)[position]
+
+        value: sa.ColumnElement[Any]
+        if data_type == Type.INT:
+            value = element.as_integer()
+        elif data_type == Type.FLOAT:
+            value = element.as_float()
+        else:
+            value = element.as_string()
+        return value
 
     def validate_data(
         self,
@@ -193,23 +388,21 @@ class IndexedRepository(
                 "does not contain None or NaN, either!"
             )
 
-        limited_to_indexsets = {
-            columns[i]: indexsets[i].data for i in range(len(indexsets))
-        }
+        if not indexsets:
+            return  # unindexed data has no keys to check
 
         # We can make this more specific e.g. highlighting all duplicate rows via
         # pd.DataFrame.duplicated(keep="False")
-        if data[limited_to_indexsets.keys()].value_counts().max() > 1:
+        if data.duplicated(subset=columns).any():
             raise self.DataInvalid(
                 f"While handling {str(item)}: \nThe data contains duplicate rows!"
             )
 
         # Can we make this more specific? Iterating over columns; if any is False,
         # return its name or something?
-        if (
-            not data[limited_to_indexsets.keys()]
-            .isin(limited_to_indexsets)
-            .all(axis=None)
+        if not all(
+            data[column].isin(set(indexset.data)).all()
+            for column, indexset in zip(columns, indexsets)
         ):
             raise self.DataInvalid(
                 f"While handling {str(item)}: \n"
@@ -219,3 +412,52 @@ class IndexedRepository(
 
     def delete_associations(self, id: int) -> None:
         raise NotImplementedError
+
+
+class IndexedPandasRepository(PandasRepository):
+    """Adds the `data` of each item, assembled from its data rows, to tabulations."""
+
+    executor: SessionExecutor
+    target: ModelTarget[Any]
+
+    def tabulate(
+        self,
+        values: dict[str, Any] | None = None,
+        columns: Sequence[str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> pd.DataFrame:
+        df = super().tabulate(
+            values=values, columns=columns, limit=limit, offset=offset
+        )
+        if "id" in df.columns:
+            data = self.select_data(df["id"].to_list())
+            df["data"] = pd.Series(
+                [data[id] for id in df["id"]], index=df.index, dtype=object
+            )
+        return df
+
+    def select_data(self, ids: list[int]) -> dict[int, dict[str, Any]]:
+        model_class = self.target.model_class
+        exc = self.target.select_statement().options(
+            orm.selectinload(model_class.indexset_associations)
+        )
+        items: dict[int, IndexedModel[Any]] = {}
+        item: IndexedModel[Any]
+        for result in self.executor.select_in_chunks(model_class.id, ids, exc):
+            for item in result.scalars():
+                items[item.id] = item
+
+        data: dict[int, dict[str, Any]] = {id: {} for id in items}
+        dialect_name = self.executor.engine.dialect.name
+        for chunk in self.executor.iter_chunked(
+            list(items), self.executor.max_query_parameters
+        ):
+            data_exc = model_class.select_joined_data(dialect_name, chunk)
+            with self.executor.select(data_exc) as result:
+                for row in result:
+                    data[row.item_id] = items[row.item_id].build_data(
+                        decode_json_list(row.data_keys),
+                        decode_json_list(row.data_records),
+                    )
+        return data
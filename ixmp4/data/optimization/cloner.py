@@ -0,0 +1,254 @@
+from typing import Any, ClassVar
+
+import sqlalchemy as sa
+from toolkit.db.target import ModelTarget
+
+from ixmp4.data.base.cloner import Cloner, ClonerRepository
+from ixmp4.data.base.db import BaseModel
+from ixmp4.data.optimization.base.db import (
+    IndexedDataModel,
+    IndexedModel,
+    IndexsetAssociationModel,
+)
+from ixmp4.data.optimization.equation.db import (
+    Equation,
+    EquationData,
+    EquationIndexsetAssociation,
+)
+from ixmp4.data.optimization.indexset.db import IndexSet, IndexSetData
+from ixmp4.data.optimization.parameter.db import (
+    Parameter,
+    ParameterData,
+    ParameterIndexsetAssociation,
+)
+from ixmp4.data.optimization.scalar.db import Scalar
+from ixmp4.data.optimization.table.db import (
+    Table,
+    TableData,
+    TableIndexsetAssociation,
+)
+from ixmp4.data.optimization.variable.db import (
+    Variable,
+    VariableData,
+    VariableIndexsetAssociation,
+)
+
+
+class RunItemClonerRepository(ClonerRepository):
+    """Clones items with a `run__id` column.
+    Items of the destination run are matched to their source by name."""
+
+    def select_clones(
+        self, src_run__id: int, dst_run__id: int, keep_solution: bool
+    ) -> sa.Select[Any]:
+        table = self.target.table
+        return (
+            sa.select(*self.clone_columns(table, run__id=sa.literal(dst_run__id)))
+            .where(table.c.run__id == src_run__id)
+            .order_by(table.c.id)
+        )
+
+
+class IndexSetClonerRepository(RunItemClonerRepository):
+    target = ModelTarget(IndexSet)
+
+
+class IndexSetDataClonerRepository(ClonerRepository):
+    target = ModelTarget(IndexSetData)
+
+    def select_clones(
+        self, src_run__id: int, dst_run__id: int, keep_solution: bool
+    ) -> sa.Select[Any]:
+        table = self.target.table
+        src_idx = IndexSet.__table__.alias("src_idx")
+        dst_idx = IndexSet.__table__.alias("dst_idx")
+        return (
+            sa.select(*self.clone_columns(table, indexset__id=dst_idx.c.id))
+            .select_from(table)
+            .join(src_idx, src_idx.c.id == table.c.indexset__id)
+            .join(
+                dst_idx,
+                sa.and_(
+                    dst_idx.c.run__id == dst_run__id,
+                    dst_idx.c.name == src_idx.c.name,
+                ),
+            )
+            .where(src_idx.c.run__id == src_run__id)
+            .order_by(table.c.id)
+        )
+
+
+class ScalarClonerRepository(RunItemClonerRepository):
+    target = ModelTarget(Scalar)
+
+
+class TableClonerRepository(RunItemClonerRepository):
+    target = ModelTarget(Table)
+
+
+class ParameterClonerRepository(RunItemClonerRepository):
+    target = ModelTarget(Parameter)
+
+
+class EquationClonerRepository(RunItemClonerRepository):
+    target = ModelTarget(Equation)
+
+
+class VariableClonerRepository(RunItemClonerRepository):
+    target = ModelTarget(Variable)
+
+
+class IndexsetAssociationClonerRepository(ClonerRepository):
+    """Clones the indexset associations of items cloned by
+    :class:`RunItemClonerRepository`."""
+
+    target: ModelTarget[BaseModel]
+    item_model: ClassVar[type[IndexedModel[Any]]]
+    association_model: ClassVar[type[IndexsetAssociationModel]]
+
+    def select_clones(
+        self, src_run__id: int, dst_run__id: int, keep_solution: bool
+    ) -> sa.Select[Any]:
+        table = self.target.table
+        item_id_column = self.association_model.get_item_id_column()
+        src_item = self.item_model.__table__.alias("src_item")
+        dst_item = self.item_model.__table__.alias("dst_item")
+        src_idx = IndexSet.__table__.alias("src_idx")
+        dst_idx = IndexSet.__table__.alias("dst_idx")
+        return (
+            sa.select(
+                *self.clone_columns(
+                    table,
+                    **{str(item_id_column.key): dst_item.c.id},
+                    indexset__id=dst_idx.c.id,
+                )
+            )
+            .select_from(table)
+            .join(src_item, src_item.c.id == item_id_column)
+            .join(
+                dst_item,
+                sa.and_(
+                    dst_item.c.run__id == dst_run__id,
+                    dst_item.c.name == src_item.c.name,
+                ),
+            )
+            .join(src_idx, src_idx.c.id == table.c.indexset__id)
+            .join(
+                dst_idx,
+                sa.and_(
+                    dst_idx.c.run__id == dst_run__id,
+                    dst_idx.c.name == src_idx.c.name,
+                ),
+            )
+            .where(src_item.c.run__id == src_run__id)
+            .order_by(table.c.id)
+        )
+
+
+class TableIndexsetAssociationClonerRepository(IndexsetAssociationClonerRepository):
+    target = ModelTarget(TableIndexsetAssociation)
+    item_model = Table
+    association_model = TableIndexsetAssociation
+
+
+class ParameterIndexsetAssociationClonerRepository(IndexsetAssociationClonerRepository):
+    target = ModelTarget(ParameterIndexsetAssociation)
+    item_model = Parameter
+    association_model = ParameterIndexsetAssociation
+
+
+class EquationIndexsetAssociationClonerRepository(IndexsetAssociationClonerRepository):
+    target = ModelTarget(EquationIndexsetAssociation)
+    item_model = Equation
+    association_model = EquationIndexsetAssociation
+
+
+class VariableIndexsetAssociationClonerRepository(IndexsetAssociationClonerRepository):
+    target = ModelTarget(VariableIndexsetAssociation)
+    item_model = Variable
+    association_model = VariableIndexsetAssociation
+
+
+class ItemDataClonerRepository(ClonerRepository):
+    """Clones the data rows of items cloned by :class:`RunItemClonerRepository`.
+    The data of solution items is skipped unless `keep_solution` is set."""
+
+    target: ModelTarget[BaseModel]
+    item_model: ClassVar[type[IndexedModel[Any]]]
+    data_model: ClassVar[type[IndexedDataModel]]
+    is_solution: ClassVar[bool] = False
+
+    def select_clones(
+        self, src_run__id: int, dst_run__id: int, keep_solution: bool
+    ) -> sa.Select[Any]:
+        table = self.target.table
+        item_id_column = self.data_model.get_item_id_column()
+        src_item = self.item_model.__table__.alias("src_item")
+        dst_item = self.item_model.__table__.alias("dst_item")
+        return (
+            sa.select(
+                *self.clone_columns(table, **{str(item_id_column.key): dst_item.c.id})
+            )
+            .select_from(table)
+            .join(src_item, src_item.c.id == item_id_column)
+            .join(
+                dst_item,
+                sa.and_(
+                    dst_item.c.run__id == dst_run__id,
+                    dst_item.c.name == src_item.c.name,
+                ),
+            )
+            .where(src_item.c.run__id == src_run__id)
+            .order_by(table.c.id)
+        )
+
+    def clone(self, src_run__id: int, dst_run__id: int, keep_solution: bool) -> None:
+        if keep_solution or not self.is_solution:
+            super().clone(src_run__id, dst_run__id, keep_solution)
+
+
+class TableDataClonerRepository(ItemDataClonerRepository):
+    target = ModelTarget(TableData)
+    item_model = Table
+    data_model = TableData
+
+
+class ParameterDataClonerRepository(ItemDataClonerRepository):
+    target = ModelTarget(ParameterData)
+    item_model = Parameter
+    data_model = ParameterData
+
+
+class EquationDataClonerRepository(ItemDataClonerRepository):
+    target = ModelTarget(EquationData)
+    item_model = Equation
+    data_model = EquationData
+    is_solution = True
+
+
+class VariableDataClonerRepository(ItemDataClonerRepository):
+    target = ModelTarget(VariableData)
+    item_model = Variable
+    data_model = VariableData
+    is_solution = True
+
+
+run_cloner = Cloner(
+    targets=[
+        IndexSetClonerRepository,
+        IndexSetDataClonerRepository,
+        ScalarClonerRepository,
+        TableClonerRepository,
+        TableIndexsetAssociationClonerRepository,
+        TableDataClonerRepository,
+        ParameterClonerRepository,
+        ParameterIndexsetAssociationClonerRepository,
+        ParameterDataClonerRepository,
+        EquationClonerRepository,
+        EquationIndexsetAssociationClonerRepository,
+        EquationDataClonerRepository,
+        VariableClonerRepository,
+        VariableIndexsetAssociationClonerRepository,
+        VariableDataClonerRepository,
+    ]
+)
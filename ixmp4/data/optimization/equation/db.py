@@ -6,6 +6,8 @@ from ixmp4.data import versions
 from ixmp4.data.base.db import HasCreationInfo
 from ixmp4.data.docs.db import docs_model
 from ixmp4.data.optimization.base.db import (
+    IndexedDataModel,
+    IndexedDataVersionModel,
     IndexedModel,
     IndexedVersionModel,
     IndexsetAssociationModel,
@@ -25,6 +27,12 @@ class Equation(IndexedModel["EquationIndexsetAssociation"], HasCreationInfo):
             passive_deletes=True,
         )
     )
+    data_entries: orm.Mapped[list["EquationData"]] = orm.relationship(
+        back_populates="equation",
+        order_by="EquationData.id",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
 
 
 EquationDocs = docs_model(Equation)
@@ -47,6 +55,23 @@ class EquationIndexsetAssociation(IndexsetAssociationModel):
         return cls.__table__.c.equation__id
 
 
+class EquationData(IndexedDataModel):
+    __tablename__ = "opt_equ_data"
+    __table_args__ = (sa.UniqueConstraint("equation__id", "key"),)
+
+    equation__id: Integer = orm.mapped_column(
+        sa.Integer,
+        sa.ForeignKey("opt_equ.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    equation: orm.Mapped["Equation"] = orm.relationship(back_populates="data_entries")
+
+    @classmethod
+    def get_item_id_column(cls) -> sa.ColumnElement[int]:
+        return cls.__table__.c.equation__id
+
+
 class EquationVersion(IndexedVersionModel):
     __tablename__ = "opt_equ_version"
 
@@ -74,6 +99,26 @@ class EquationIndexsetAssociationVersion(IndexsetAssociationVersionModel):
     )
 
 
+class EquationDataVersion(IndexedDataVersionModel):
+    __tablename__ = "opt_equ_data_version"
+
+    equation__id: Integer = orm.mapped_column(nullable=False, index=True)
+
+    @staticmethod
+    def join_equation_versions() -> sa.ColumnElement[bool]:
+        return sa.and_(
+            EquationDataVersion.equation__id == EquationVersion.id,
+            EquationDataVersion.join_valid_versions(EquationVersion),
+        )
+
+    equation: orm.Relationship["EquationVersion"] = orm.relationship(
+        EquationVersion,
+        primaryjoin=join_equation_versions,
+        lazy="select",
+        viewonly=True,
+    )
+
+
 version_triggers = versions.PostgresVersionTriggers(
     Equation.__table__, EquationVersion.__table__
 )
@@ -82,3 +127,8 @@ version_triggers = versions.PostgresVersionTriggers(
 association_version_triggers = versions.PostgresVersionTriggers(
     EquationIndexsetAssociation.__table__, EquationIndexsetAssociationVersion.__table__
 )
+
+
+data_version_triggers = versions.PostgresVersionTriggers(
+    EquationData.__table__, EquationDataVersion.__table__
+)
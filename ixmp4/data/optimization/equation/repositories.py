@@ -8,9 +8,18 @@ from toolkit.db.repositories import PandasRepository as BasePandasRepository
 from toolkit.db.target import ModelTarget
 
 from ixmp4.data.base.repository import AuthRepository
-from ixmp4.data.optimization.base.repositories import IndexedRepository
+from ixmp4.data.optimization.base.repositories import (
+    IndexedPandasRepository,
+    IndexedRepository,
+)
 
-from .db import Equation, EquationIndexsetAssociation, EquationVersion
+from .db import (
+    Equation,
+    EquationData,
+    EquationDataVersion,
+    EquationIndexsetAssociation,
+    EquationVersion,
+)
 from .exceptions import EquationDataInvalid, EquationNotFound, EquationNotUnique
 from .filter import EquationFilter
 
@@ -39,6 +48,7 @@ class ItemRepository(
     DataInvalid = EquationDataInvalid
     target = ModelTarget(Equation)
     association_target = ModelTarget(EquationIndexsetAssociation)
+    data_target = ModelTarget(EquationData)
     filter = Filter(EquationFilter, Equation)
     extra_data_columns = {"levels", "marginals"}
 
@@ -55,7 +65,7 @@ class AssociationRepository(BaseItemRepository[EquationIndexsetAssociation]):
     target = ModelTarget(EquationIndexsetAssociation)
 
 
-class PandasRepository(EquationAuthRepository[Equation], BasePandasRepository):
+class PandasRepository(EquationAuthRepository[Equation], IndexedPandasRepository):
     NotFound = EquationNotFound
     NotUnique = EquationNotUnique
     target = ModelTarget(Equation)
@@ -67,3 +77,7 @@ class VersionRepository(EquationAuthRepository[EquationVersion], BasePandasRepos
     NotUnique = EquationNotUnique
     target = ModelTarget(EquationVersion)
     filter = Filter(EquationFilter, EquationVersion)
+
+
+class DataVersionRepository(BasePandasRepository):
+    target = ModelTarget(EquationDataVersion)
@@ -1,5 +1,5 @@
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import sqlalchemy as sa
 from sqlalchemy import orm
@@ -30,16 +30,32 @@ class IndexSet(BaseModel, HasCreationInfo):
 
     @property
     def data(self) -> list[str] | list[int] | list[float]:
+        values = self.select_values()
         if self.data_type is None:
-            if len(self.data_entries) != 0:
+            if len(values) != 0:
                 logger.error(
                     "Invalid state: data_type is None, but data entries"
                     "are associated with the IndexSet. "
                 )
             return []
-        else:
-            pytype = Type(self.data_type).to_pytype()
-        return [pytype(d.value) for d in self.data_entries]
+        return cast(
+            list[str] | list[int] | list[float],
+            Type(self.data_type).cast(values).tolist(),
+        )
+
+    def select_values(self) -> list[str]:
+        """Selects the stored values with a single query instead of loading one
+        object per entry through `data_entries`."""
+        session = orm.object_session(self)
+        if session is None:
+            return [entry.value for entry in self.data_entries]
+
+        exc = (
+            sa.select(IndexSetData.value)
+            .where(IndexSetData.indexset__id == self.id)
+            .order_by(IndexSetData.id)
+        )
+        return list(session.execute(exc).scalars())
 
     data_type: Mapped[str | None] = orm.mapped_column(sa.String(63), nullable=True)
 
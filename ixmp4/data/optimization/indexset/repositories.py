@@ -48,24 +48,13 @@ class ItemRepository(IndexSetAuthRepository, BaseItemRepository[IndexSet]):
     ) -> Type | None:
         item = self.get_by_pk({"id": id})
 
-        if item.data_type is None:
-            data_type = None
-        else:
-            data_type = Type(item.data_type)
-
-        for data_item in data:
-            item_type = type(data_item)
-            if data_type is None:
-                data_type = Type.from_pytype(item_type)
-                if data_type is None:
-                    raise IndexSetDataInvalid(
-                        f"Could not determine type for IndexSet data items: {data}"
-                    )
-
-            elif data_type != Type.from_pytype(item_type):
-                raise IndexSetDataInvalid(
-                    f"Could not determine type for IndexSet data items: {data}"
-                )
+        data_type = Type.from_values(data)
+        if data_type is None or (
+            item.data_type is not None and data_type != Type(item.data_type)
+        ):
+            raise IndexSetDataInvalid(
+                f"Could not determine type for IndexSet data items: {data}"
+            )
 
         return data_type
 
@@ -93,7 +82,7 @@ class IndexSetDataItemRepository(BaseItemRepository[IndexSetData]):
     target = ModelTarget(IndexSetData)
 
     def add(self, indexset_id: int, data: list[str]) -> None:
-        exc = sa.insert(IndexSetData).values(indexset__id=indexset_id)
+        exc = sa.insert(self.target.table).values(indexset__id=indexset_id)
         with self.wrap_executor_exception():
             with self.executor.insert_many(exc, [{"value": d} for d in data]):
                 return None
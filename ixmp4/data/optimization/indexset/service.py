@@ -224,7 +224,7 @@ class IndexSetService(DocsService, GetByIdService):
         )
 
     def data_to_str_list(self, data: List[float] | List[int] | List[str]) -> List[str]:
-        return [str(d) for d in data]
+        return list(map(str, data))
 
     def data_to_data_list(
         self, data: float | int | str | List[float] | List[int] | List[str]
@@ -1,4 +1,8 @@
 from enum import Enum
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+import numpy.typing as npt
 
 
 class Type(str, Enum):
@@ -10,9 +14,28 @@ class Type(str, Enum):
     def from_pytype(cls, type_: type) -> "Type | None":
         return _type_map.get(type_, None)
 
+    @classmethod
+    def from_values(cls, values: Iterable[Any]) -> "Type | None":
+        """Returns the type shared by all `values` or `None` if there is no such
+        type."""
+        types = set(map(type, values))
+        if len(types) != 1:
+            return None
+        return cls.from_pytype(types.pop())
+
     def to_pytype(self) -> type:
         return _reverse_type_map[self]
 
+    def cast(self, values: Sequence[str]) -> npt.NDArray[Any]:
+        """Casts values stored as strings to an array of this type."""
+        if self is Type.STR:
+            return np.array(values, dtype=np.object_)
+        try:
+            return np.asarray(values, dtype=np.str_).astype(_numpy_type_map[self])
+        except OverflowError:
+            # Python integers are unbounded
+            return np.array([int(value) for value in values], dtype=object)
+
     def __str__(self) -> str | None:
         return self.value
 
@@ -24,3 +47,8 @@ _type_map: dict[type, Type] = {
 }
 
 _reverse_type_map: dict[Type, type] = {et: pt for pt, et in _type_map.items()}
+
+_numpy_type_map: dict[Type, npt.DTypeLike] = {
+    Type.INT: np.int64,
+    Type.FLOAT: np.float64,
+}
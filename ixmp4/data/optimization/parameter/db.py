@@ -6,6 +6,8 @@ from ixmp4.data import versions
 from ixmp4.data.base.db import HasCreationInfo
 from ixmp4.data.docs.db import docs_model
 from ixmp4.data.optimization.base.db import (
+    IndexedDataModel,
+    IndexedDataVersionModel,
     IndexedModel,
     IndexedVersionModel,
     IndexsetAssociationModel,
@@ -25,6 +27,12 @@ class Parameter(IndexedModel["ParameterIndexsetAssociation"], HasCreationInfo):
             passive_deletes=True,
         )
     )
+    data_entries: orm.Mapped[list["ParameterData"]] = orm.relationship(
+        back_populates="parameter",
+        order_by="ParameterData.id",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
 
 
 ParameterDocs = docs_model(Parameter)
@@ -47,6 +55,23 @@ class ParameterIndexsetAssociation(IndexsetAssociationModel):
         return cls.__table__.c.parameter__id
 
 
+class ParameterData(IndexedDataModel):
+    __tablename__ = "opt_par_data"
+    __table_args__ = (sa.UniqueConstraint("parameter__id", "key"),)
+
+    parameter__id: Integer = orm.mapped_column(
+        sa.Integer,
+        sa.ForeignKey("opt_par.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    parameter: orm.Mapped["Parameter"] = orm.relationship(back_populates="data_entries")
+
+    @classmethod
+    def get_item_id_column(cls) -> sa.ColumnElement[int]:
+        return cls.__table__.c.parameter__id
+
+
 class ParameterVersion(IndexedVersionModel, HasCreationInfo):
     __tablename__ = "opt_par_version"
 
@@ -71,6 +96,26 @@ class ParameterIndexsetAssociationVersion(IndexsetAssociationVersionModel):
     )
 
 
+class ParameterDataVersion(IndexedDataVersionModel):
+    __tablename__ = "opt_par_data_version"
+
+    parameter__id: Integer = orm.mapped_column(nullable=False, index=True)
+
+    @staticmethod
+    def join_parameter_versions() -> sa.ColumnElement[bool]:
+        return sa.and_(
+            ParameterDataVersion.parameter__id == ParameterVersion.id,
+            ParameterDataVersion.join_valid_versions(ParameterVersion),
+        )
+
+    parameter: orm.Relationship["ParameterVersion"] = orm.relationship(
+        ParameterVersion,
+        primaryjoin=join_parameter_versions,
+        lazy="select",
+        viewonly=True,
+    )
+
+
 version_triggers = versions.PostgresVersionTriggers(
     Parameter.__table__, ParameterVersion.__table__
 )
@@ -80,3 +125,8 @@ association_version_triggers = versions.PostgresVersionTriggers(
     ParameterIndexsetAssociation.__table__,
     ParameterIndexsetAssociationVersion.__table__,
 )
+
+
+data_version_triggers = versions.PostgresVersionTriggers(
+    ParameterData.__table__, ParameterDataVersion.__table__
+)
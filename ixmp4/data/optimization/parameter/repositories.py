@@ -8,9 +8,18 @@ from toolkit.db.repositories import PandasRepository as BasePandasRepository
 from toolkit.db.target import ModelTarget
 
 from ixmp4.data.base.repository import AuthRepository
-from ixmp4.data.optimization.base.repositories import IndexedRepository
-
-from .db import Parameter, ParameterIndexsetAssociation, ParameterVersion
+from ixmp4.data.optimization.base.repositories import (
+    IndexedPandasRepository,
+    IndexedRepository,
+)
+
+from .db import (
+    Parameter,
+    ParameterData,
+    ParameterDataVersion,
+    ParameterIndexsetAssociation,
+    ParameterVersion,
+)
 from .exceptions import ParameterDataInvalid, ParameterNotFound, ParameterNotUnique
 from .filter import ParameterFilter
 
@@ -43,6 +52,7 @@ class ItemRepository(
 
     target = ModelTarget(Parameter)
     association_target = ModelTarget(ParameterIndexsetAssociation)
+    data_target = ModelTarget(ParameterData)
     filter = Filter(ParameterFilter, Parameter)
 
     extra_data_columns = {"values", "units"}
@@ -60,7 +70,7 @@ class AssociationRepository(BaseItemRepository[ParameterIndexsetAssociation]):
     target = ModelTarget(ParameterIndexsetAssociation)
 
 
-class PandasRepository(ParameterAuthRepository[Parameter], BasePandasRepository):
+class PandasRepository(ParameterAuthRepository[Parameter], IndexedPandasRepository):
     NotFound = ParameterNotFound
     NotUnique = ParameterNotUnique
     target = ModelTarget(Parameter)
@@ -75,3 +85,7 @@ class VersionRepository(
     NotUnique = ParameterNotUnique
     target = ModelTarget(ParameterVersion)
     filter = Filter(ParameterFilter, ParameterVersion)
+
+
+class DataVersionRepository(BasePandasRepository):
+    target = ModelTarget(ParameterDataVersion)
@@ -5,6 +5,8 @@ from toolkit.db.target import ModelTarget
 
 from ixmp4.data.optimization.equation.db import (
     Equation,
+    EquationData,
+    EquationDataVersion,
     EquationIndexsetAssociation,
     EquationIndexsetAssociationVersion,
     EquationVersion,
@@ -17,6 +19,8 @@ from ixmp4.data.optimization.indexset.db import (
 )
 from ixmp4.data.optimization.parameter.db import (
     Parameter,
+    ParameterData,
+    ParameterDataVersion,
     ParameterIndexsetAssociation,
     ParameterIndexsetAssociationVersion,
     ParameterVersion,
@@ -24,12 +28,16 @@ from ixmp4.data.optimization.parameter.db import (
 from ixmp4.data.optimization.scalar.db import Scalar, ScalarVersion
 from ixmp4.data.optimization.table.db import (
     Table,
+    TableData,
+    TableDataVersion,
     TableIndexsetAssociation,
     TableIndexsetAssociationVersion,
     TableVersion,
 )
 from ixmp4.data.optimization.variable.db import (
     Variable,
+    VariableData,
+    VariableDataVersion,
     VariableIndexsetAssociation,
     VariableIndexsetAssociationVersion,
     VariableVersion,
@@ -63,6 +71,16 @@ class EquationReverterRepository(ReverterRepository[[int]]):
         return sa.select(EquationVersion).where(EquationVersion.run__id == run__id)
 
 
+class EquationDataReverterRepository(ReverterRepository[[int]]):
+    target = ModelTarget(EquationData)
+    version_target = ModelTarget(EquationDataVersion)
+
+    def select_versions(self, run__id: int) -> sa.Select[Any]:
+        return sa.select(EquationDataVersion).where(
+            EquationDataVersion.equation.has(EquationVersion.run__id == run__id)
+        )
+
+
 class EquationIndexsetAssociationReverterRepository(ReverterRepository[[int]]):
     target = ModelTarget(EquationIndexsetAssociation)
     version_target = ModelTarget(EquationIndexsetAssociationVersion)
@@ -83,6 +101,16 @@ class ParameterReverterRepository(ReverterRepository[[int]]):
         return sa.select(ParameterVersion).where(ParameterVersion.run__id == run__id)
 
 
+class ParameterDataReverterRepository(ReverterRepository[[int]]):
+    target = ModelTarget(ParameterData)
+    version_target = ModelTarget(ParameterDataVersion)
+
+    def select_versions(self, run__id: int) -> sa.Select[Any]:
+        return sa.select(ParameterDataVersion).where(
+            ParameterDataVersion.parameter.has(ParameterVersion.run__id == run__id)
+        )
+
+
 class ParameterIndexsetAssociationReverterRepository(ReverterRepository[[int]]):
     target = ModelTarget(ParameterIndexsetAssociation)
     version_target = ModelTarget(ParameterIndexsetAssociationVersion)
@@ -103,6 +131,16 @@ class TableReverterRepository(ReverterRepository[[int]]):
         return sa.select(TableVersion).where(TableVersion.run__id == run__id)
 
 
+class TableDataReverterRepository(ReverterRepository[[int]]):
+    target = ModelTarget(TableData)
+    version_target = ModelTarget(TableDataVersion)
+
+    def select_versions(self, run__id: int) -> sa.Select[Any]:
+        return sa.select(TableDataVersion).where(
+            TableDataVersion.table.has(TableVersion.run__id == run__id)
+        )
+
+
 class TableIndexsetAssociationReverterRepository(ReverterRepository[[int]]):
     target = ModelTarget(TableIndexsetAssociation)
     version_target = ModelTarget(TableIndexsetAssociationVersion)
@@ -121,6 +159,16 @@ class VariableReverterRepository(ReverterRepository[[int]]):
         return sa.select(VariableVersion).where(VariableVersion.run__id == run__id)
 
 
+class VariableDataReverterRepository(ReverterRepository[[int]]):
+    target = ModelTarget(VariableData)
+    version_target = ModelTarget(VariableDataVersion)
+
+    def select_versions(self, run__id: int) -> sa.Select[Any]:
+        return sa.select(VariableDataVersion).where(
+            VariableDataVersion.variable.has(VariableVersion.run__id == run__id)
+        )
+
+
 class VariableIndexsetAssociationReverterRepository(ReverterRepository[[int]]):
     target = ModelTarget(VariableIndexsetAssociation)
     version_target = ModelTarget(VariableIndexsetAssociationVersion)
@@ -147,12 +195,16 @@ run_reverter = Reverter(
         IndexSetDataReverterRepository,
         EquationReverterRepository,
         EquationIndexsetAssociationReverterRepository,
+        EquationDataReverterRepository,
         ParameterReverterRepository,
         ParameterIndexsetAssociationReverterRepository,
+        ParameterDataReverterRepository,
         TableReverterRepository,
         TableIndexsetAssociationReverterRepository,
+        TableDataReverterRepository,
         VariableReverterRepository,
         VariableIndexsetAssociationReverterRepository,
+        VariableDataReverterRepository,
         ScalarReverterRepository,
     ]
 )
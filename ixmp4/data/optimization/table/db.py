@@ -6,6 +6,8 @@ from ixmp4.data import versions
 from ixmp4.data.base.db import HasCreationInfo
 from ixmp4.data.docs.db import docs_model
 from ixmp4.data.optimization.base.db import (
+    IndexedDataModel,
+    IndexedDataVersionModel,
     IndexedModel,
     IndexedVersionModel,
     IndexsetAssociationModel,
@@ -25,6 +27,12 @@ class Table(IndexedModel["TableIndexsetAssociation"], HasCreationInfo):
             passive_deletes=True,
         )
     )
+    data_entries: orm.Mapped[list["TableData"]] = orm.relationship(
+        back_populates="table",
+        order_by="TableData.id",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
 
 
 TableDocs = docs_model(Table)
@@ -47,6 +55,23 @@ class TableIndexsetAssociation(IndexsetAssociationModel):
         return cls.__table__.c.table__id
 
 
+class TableData(IndexedDataModel):
+    __tablename__ = "opt_tab_data"
+    __table_args__ = (sa.UniqueConstraint("table__id", "key"),)
+
+    table__id: Integer = orm.mapped_column(
+        sa.Integer,
+        sa.ForeignKey("opt_tab.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    table: orm.Mapped["Table"] = orm.relationship(back_populates="data_entries")
+
+    @classmethod
+    def get_item_id_column(cls) -> sa.ColumnElement[int]:
+        return cls.__table__.c.table__id
+
+
 class TableVersion(IndexedVersionModel, HasCreationInfo):
     __tablename__ = "opt_tab_version"
 
@@ -71,6 +96,26 @@ class TableIndexsetAssociationVersion(IndexsetAssociationVersionModel):
     )
 
 
+class TableDataVersion(IndexedDataVersionModel):
+    __tablename__ = "opt_tab_data_version"
+
+    table__id: Integer = orm.mapped_column(nullable=False, index=True)
+
+    @staticmethod
+    def join_table_versions() -> sa.ColumnElement[bool]:
+        return sa.and_(
+            TableDataVersion.table__id == TableVersion.id,
+            TableDataVersion.join_valid_versions(TableVersion),
+        )
+
+    table: orm.Relationship["TableVersion"] = orm.relationship(
+        TableVersion,
+        primaryjoin=join_table_versions,
+        lazy="select",
+        viewonly=True,
+    )
+
+
 version_triggers = versions.PostgresVersionTriggers(
     Table.__table__, TableVersion.__table__
 )
@@ -79,3 +124,8 @@ version_triggers = versions.PostgresVersionTriggers(
 association_version_triggers = versions.PostgresVersionTriggers(
     TableIndexsetAssociation.__table__, TableIndexsetAssociationVersion.__table__
 )
+
+
+data_version_triggers = versions.PostgresVersionTriggers(
+    TableData.__table__, TableDataVersion.__table__
+)
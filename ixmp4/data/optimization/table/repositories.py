@@ -8,9 +8,18 @@ from toolkit.db.repositories import PandasRepository as BasePandasRepository
 from toolkit.db.target import ModelTarget
 
 from ixmp4.data.base.repository import AuthRepository
-from ixmp4.data.optimization.base.repositories import IndexedRepository
+from ixmp4.data.optimization.base.repositories import (
+    IndexedPandasRepository,
+    IndexedRepository,
+)
 
-from .db import Table, TableIndexsetAssociation, TableVersion
+from .db import (
+    Table,
+    TableData,
+    TableDataVersion,
+    TableIndexsetAssociation,
+    TableVersion,
+)
 from .exceptions import (
     TableDataInvalid,
     TableNotFound,
@@ -42,6 +51,7 @@ class ItemRepository(
     DataInvalid = TableDataInvalid
     target = ModelTarget(Table)
     association_target = ModelTarget(TableIndexsetAssociation)
+    data_target = ModelTarget(TableData)
     filter = Filter(TableFilter, Table)
 
     def delete_associations(self, id: int) -> None | int:
@@ -57,7 +67,7 @@ class AssociationRepository(BaseItemRepository[TableIndexsetAssociation]):
     target = ModelTarget(TableIndexsetAssociation)
 
 
-class PandasRepository(TableAuthRepository[Table], BasePandasRepository):
+class PandasRepository(TableAuthRepository[Table], IndexedPandasRepository):
     NotFound = TableNotFound
     NotUnique = TableNotUnique
     target = ModelTarget(Table)
@@ -69,3 +79,7 @@ class VersionRepository(TableAuthRepository[TableVersion], BasePandasRepository)
     NotUnique = TableNotUnique
     target = ModelTarget(TableVersion)
     filter = Filter(TableFilter, TableVersion)
+
+
+class DataVersionRepository(BasePandasRepository):
+    target = ModelTarget(TableDataVersion)
@@ -24,6 +24,7 @@ from .exceptions import TableDataInvalid
 from .filter import TableFilter
 from .repositories import (
     AssociationRepository,
+    DataVersionRepository,
     ItemRepository,
     PandasRepository,
     VersionRepository,
@@ -40,6 +41,7 @@ class TableService(DocsService, IndexSetAssociatedService):
     items: ItemRepository
     pandas: PandasRepository
     versions: VersionRepository
+    data_versions: DataVersionRepository
 
     associations: AssociationRepository
     indexsets: IndexSetRepository
@@ -50,6 +52,7 @@ class TableService(DocsService, IndexSetAssociatedService):
         self.items = ItemRepository(self.executor, **self.get_auth_kwargs(transport))
         self.pandas = PandasRepository(self.executor, **self.get_auth_kwargs(transport))
         self.versions = VersionRepository(self.executor)
+        self.data_versions = DataVersionRepository(self.executor)
         self.associations = AssociationRepository(self.executor)
         self.indexsets = IndexSetRepository(self.executor)
         self.runs = RunRepository(self.executor)
@@ -235,6 +238,7 @@ class TableService(DocsService, IndexSetAssociatedService):
 
         """
 
+        self.items.delete_data(id)
         self.items.delete_associations(id)
         self.items.delete_by_pk({"id": id})
 
@@ -327,7 +331,7 @@ class TableService(DocsService, IndexSetAssociatedService):
         """
 
         if data is None:
-            self.items.update_by_pk({"id": id, "data": {}})
+            self.items.delete_data(id)
         else:
             if isinstance(data, dict):
                 data = pd.DataFrame.from_dict(data=data)
@@ -353,6 +357,44 @@ class TableService(DocsService, IndexSetAssociatedService):
             platform, models=[run.model.name], raise_exc=Forbidden
         )
 
+    @procedure(Http(path="/{id:int}/validate", methods=("POST",)))
+    def validate(self, id: int) -> None:
+        """Validates all data of a Table.
+
+        :meth:`add_data` only validates the rows it adds. This checks the complete
+        data, e.g. after the linked IndexSets have changed.
+
+        Parameters
+        ----------
+        id : int
+            The id of the :class:`ixmp4.data.abstract.optimization.Table`.
+
+        Raises
+        ------
+        :class:`ixmp4.core.exceptions.OptimizationDataValidationError`:
+            If the data is not valid as per the linked ``IndexSet`` s.
+
+        Returns
+        -------
+        None
+        """
+        self.items.validate(id)
+
+    @validate.auth_check()
+    def validate_auth_check(
+        self,
+        auth_ctx: AuthorizationContext,
+        platform: PlatformProtocol,
+        /,
+        id: int,
+    ) -> None:
+        auth_ctx.has_view_permission(platform, raise_exc=Forbidden)
+        item = self.items.get_by_pk({"id": id})
+        run = self.runs.get_by_pk({"id": item.run__id})
+        auth_ctx.has_view_permission(
+            platform, models=[run.model.name], raise_exc=Forbidden
+        )
+
     @procedure(Http(methods=("PATCH",)))
     def list(self, **kwargs: Unpack[TableFilter]) -> list[Table]:
         r"""Lists tables by specified criteria.
@@ -6,6 +6,8 @@ from ixmp4.data import versions
 from ixmp4.data.base.db import HasCreationInfo
 from ixmp4.data.docs.db import docs_model
 from ixmp4.data.optimization.base.db import (
+    IndexedDataModel,
+    IndexedDataVersionModel,
     IndexedModel,
     IndexedVersionModel,
     IndexsetAssociationModel,
@@ -25,6 +27,12 @@ class Variable(IndexedModel["VariableIndexsetAssociation"], HasCreationInfo):
             passive_deletes=True,
         )
     )
+    data_entries: orm.Mapped[list["VariableData"]] = orm.relationship(
+        back_populates="variable",
+        order_by="VariableData.id",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
 
 
 VariableDocs = docs_model(Variable)
@@ -47,6 +55,25 @@ class VariableIndexsetAssociation(IndexsetAssociationModel):
         return cls.__table__.c.variable__id
 
 
+class VariableData(IndexedDataModel):
+    __tablename__ = "opt_var_data"
+    __table_args__ = (sa.UniqueConstraint("variable__id", "key"),)
+
+    variable__id: Integer = orm.mapped_column(
+        sa.Integer,
+        sa.ForeignKey("opt_var.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    variable: orm.Mapped[Variable] = orm.relationship(
+        Variable, back_populates="data_entries"
+    )
+
+    @classmethod
+    def get_item_id_column(cls) -> sa.ColumnElement[int]:
+        return cls.__table__.c.variable__id
+
+
 class VariableVersion(IndexedVersionModel, HasCreationInfo):
     __tablename__ = "opt_var_version"
 
@@ -71,6 +98,26 @@ class VariableIndexsetAssociationVersion(IndexsetAssociationVersionModel):
     )
 
 
+class VariableDataVersion(IndexedDataVersionModel):
+    __tablename__ = "opt_var_data_version"
+
+    variable__id: Integer = orm.mapped_column(nullable=False, index=True)
+
+    @staticmethod
+    def join_variable_versions() -> sa.ColumnElement[bool]:
+        return sa.and_(
+            VariableDataVersion.variable__id == VariableVersion.id,
+            VariableDataVersion.join_valid_versions(VariableVersion),
+        )
+
+    variable: orm.Relationship["VariableVersion"] = orm.relationship(
+        VariableVersion,
+        primaryjoin=join_variable_versions,
+        lazy="select",
+        viewonly=True,
+    )
+
+
 version_triggers = versions.PostgresVersionTriggers(
     Variable.__table__, VariableVersion.__table__
 )
@@ -79,3 +126,8 @@ version_triggers = versions.PostgresVersionTriggers(
 association_version_triggers = versions.PostgresVersionTriggers(
     VariableIndexsetAssociation.__table__, VariableIndexsetAssociationVersion.__table__
 )
+
+
+data_version_triggers = versions.PostgresVersionTriggers(
+    VariableData.__table__, VariableDataVersion.__table__
+)
@@ -8,9 +8,18 @@ from toolkit.db.repositories import PandasRepository as BasePandasRepository
 from toolkit.db.target import ModelTarget
 
 from ixmp4.data.base.repository import AuthRepository
-from ixmp4.data.optimization.base.repositories import IndexedRepository
+from ixmp4.data.optimization.base.repositories import (
+    IndexedPandasRepository,
+    IndexedRepository,
+)
 
-from .db import Variable, VariableIndexsetAssociation, VariableVersion
+from .db import (
+    Variable,
+    VariableData,
+    VariableDataVersion,
+    VariableIndexsetAssociation,
+    VariableVersion,
+)
 from .exceptions import (
     VariableDataInvalid,
     VariableNotFound,
@@ -47,6 +56,7 @@ class ItemRepository(
 
     target = ModelTarget(Variable)
     association_target = ModelTarget(VariableIndexsetAssociation)
+    data_target = ModelTarget(VariableData)
     filter = Filter(VariableFilter, Variable)
 
     extra_data_columns = {"levels", "marginals"}
@@ -64,7 +74,7 @@ class AssociationRepository(BaseItemRepository[VariableIndexsetAssociation]):
     target = ModelTarget(VariableIndexsetAssociation)
 
 
-class PandasRepository(VariableAuthRepository[Variable], BasePandasRepository):
+class PandasRepository(VariableAuthRepository[Variable], IndexedPandasRepository):
     NotFound = VariableNotFound
     NotUnique = VariableNotUnique
     target = ModelTarget(Variable)
@@ -76,3 +86,7 @@ class VersionRepository(VariableAuthRepository[VariableVersion], BasePandasRepos
     NotUnique = VariableNotUnique
     target = ModelTarget(VariableVersion)
     filter = Filter(VariableFilter, VariableVersion)
+
+
+class DataVersionRepository(BasePandasRepository):
+    target = ModelTarget(VariableDataVersion)
@@ -23,6 +23,7 @@ from .exceptions import VariableDataInvalid
 from .filter import VariableFilter
 from .repositories import (
     AssociationRepository,
+    DataVersionRepository,
     ItemRepository,
     PandasRepository,
     VersionRepository,
@@ -37,6 +38,7 @@ class VariableService(DocsService, IndexSetAssociatedService):
     items: ItemRepository
     pandas: PandasRepository
     versions: VersionRepository
+    data_versions: DataVersionRepository
 
     associations: AssociationRepository
     indexsets: IndexSetRepository
@@ -47,6 +49,7 @@ class VariableService(DocsService, IndexSetAssociatedService):
         self.items = ItemRepository(self.executor, **self.get_auth_kwargs(transport))
         self.pandas = PandasRepository(self.executor, **self.get_auth_kwargs(transport))
         self.versions = VersionRepository(self.executor)
+        self.data_versions = DataVersionRepository(self.executor)
         self.associations = AssociationRepository(self.executor)
         self.indexsets = IndexSetRepository(self.executor)
         self.runs = RunRepository(self.executor)
@@ -215,6 +218,7 @@ class VariableService(DocsService, IndexSetAssociatedService):
             If the current user is not authorized to perform this action.
 
         """
+        self.items.delete_data(id)
         self.items.delete_associations(id)
         self.items.delete_by_pk({"id": id})
 
@@ -317,7 +321,7 @@ class VariableService(DocsService, IndexSetAssociatedService):
         if data is None:
             # Remove all data per default
             # TODO Is there a better way to reset .data?
-            self.items.update_by_pk({"id": id, "data": {}})
+            self.items.delete_data(id)
         else:
             if isinstance(data, dict):
                 data = pd.DataFrame.from_dict(data=data)
@@ -343,6 +347,44 @@ class VariableService(DocsService, IndexSetAssociatedService):
             platform, models=[run.model.name], raise_exc=Forbidden
         )
 
+    @procedure(Http(path="/{id:int}/validate", methods=("POST",)))
+    def validate(self, id: int) -> None:
+        """Validates all data of a Variable.
+
+        :meth:`add_data` only validates the rows it adds. This checks the complete
+        data, e.g. after the linked IndexSets have changed.
+
+        Parameters
+        ----------
+        id : int
+            The id of the :class:`ixmp4.data.abstract.optimization.Variable`.
+
+        Raises
+        ------
+        :class:`ixmp4.core.exceptions.OptimizationDataValidationError`:
+            If the data is not valid as per the linked ``IndexSet`` s.
+
+        Returns
+        -------
+        None
+        """
+        self.items.validate(id)
+
+    @validate.auth_check()
+    def validate_auth_check(
+        self,
+        auth_ctx: AuthorizationContext,
+        platform: PlatformProtocol,
+        /,
+        id: int,
+    ) -> None:
+        auth_ctx.has_view_permission(platform, raise_exc=Forbidden)
+        item = self.items.get_by_pk({"id": id})
+        run = self.runs.get_by_pk({"id": item.run__id})
+        auth_ctx.has_view_permission(
+            platform, models=[run.model.name], raise_exc=Forbidden
+        )
+
     @procedure(Http(methods=("PATCH",)))
     def list(self, **kwargs: Unpack[VariableFilter]) -> List[Variable]:
         r"""Lists variables by specified criteria.
@@ -18,11 +18,29 @@ class Pagination(pyd.BaseModel):
         le=default_settings.server.max_page_size,
     )
     offset: int = pyd.Field(default=0, ge=0)
+    # keyset pagination: only return rows with an id greater than `after`,
+    # the `total` of such a page counts the rows after the cursor
+    after: int | None = pyd.Field(default=None, ge=0)
+
+    @pyd.model_validator(mode="after")
+    def validate_cursor(self) -> "Pagination":
+        if self.after is not None and self.offset != 0:
+            raise ValueError("`offset` cannot be combined with `after`.")
+        return self
+
+
+class Streaming(pyd.BaseModel):
+    batch_size: int = pyd.Field(
+        default=default_settings.server.default_page_size,
+        ge=1,
+        le=default_settings.server.max_page_size,
+    )
 
 
 class PaginationResult(pyd.BaseModel):
     limit: int = pyd.Field(ge=0)
     offset: int = pyd.Field(default=0, ge=0)
+    after: int | None = pyd.Field(default=None, ge=0)
     model_config = pyd.ConfigDict(from_attributes=True)
 
 
@@ -1,13 +1,17 @@
 from contextlib import suppress
 from typing import List
 
+import sqlalchemy as sa
 from toolkit.auth.context import AuthorizationContext, PlatformProtocol
 from toolkit.db.executor import SessionExecutor
 from typing_extensions import Unpack
 
 from ixmp4.base_exceptions import Forbidden
+from ixmp4.data.checkpoint.db import Checkpoint
 from ixmp4.data.dataframe import SerializableDataFrame
+from ixmp4.data.iamc.cloner import run_cloner as iamc_cloner
 from ixmp4.data.iamc.reverter import run_reverter as iamc_reverter
+from ixmp4.data.meta.cloner import run_cloner as meta_cloner
 from ixmp4.data.meta.repositories import (
     PandasRepository as MetaRepository,
 )
@@ -17,7 +21,14 @@ from ixmp4.data.meta.repositories import (
 from ixmp4.data.meta.reverter import run_reverter as meta_reverter
 from ixmp4.data.model.exceptions import ModelNotUnique
 from ixmp4.data.model.repositories import ItemRepository as ModelRepository
+from ixmp4.data.optimization.cloner import run_cloner as opt_cloner
+from ixmp4.data.optimization.equation.repositories import (
+    ItemRepository as EquationRepository,
+)
 from ixmp4.data.optimization.reverter import run_reverter as opt_reverter
+from ixmp4.data.optimization.variable.repositories import (
+    ItemRepository as VariableRepository,
+)
 from ixmp4.data.pagination import PaginatedResult, Pagination
 from ixmp4.data.run.dto import Run
 from ixmp4.data.scenario.exceptions import ScenarioNotUnique
@@ -29,6 +40,7 @@ from ixmp4.data.versions.transaction import TransactionRepository
 from ixmp4.transport import DirectTransport
 
 from .compat_controller import RunCompatibilityController
+from .db import Run as RunModel
 from .exceptions import (
     NoDefaultRunVersion,
     RunIsLocked,
@@ -60,6 +72,10 @@ class RunService(GetByIdService):
     meta: MetaRepository
     meta_versions: MetaVersionRepository
 
+    # solution data
+    equations: EquationRepository
+    variables: VariableRepository
+
     default_filter: RunFilter = {"default_only": True}
 
     def __init_direct__(self, transport: DirectTransport) -> None:
@@ -75,6 +91,9 @@ class RunService(GetByIdService):
         self.meta = MetaRepository(self.executor)
         self.meta_versions = MetaVersionRepository(self.executor)
 
+        self.equations = EquationRepository(self.executor)
+        self.variables = VariableRepository(self.executor)
+
         self.versions = VersionRepository(self.executor)
 
     @procedure(Http(path="/", methods=("POST",)))
@@ -95,6 +114,10 @@ class RunService(GetByIdService):
         :class:`ixmp4.data.run.dto.Run`:
             The created run.
         """
+        id_ = self.create_run(model_name, scenario_name)
+        return Run.model_validate(self.items.get_by_pk({"id": id_}))
+
+    def create_run(self, model_name: str, scenario_name: str) -> int:
         creation_info = self.get_creation_info()
         with suppress(ModelNotUnique):
             self.models.create({"name": model_name, **creation_info})
@@ -104,8 +127,7 @@ class RunService(GetByIdService):
             self.scenarios.create({"name": scenario_name, **creation_info})
         scenario = self.scenarios.get({"name": scenario_name})
 
-        id_ = self.items.create(model.id, scenario.id, values=creation_info)
-        return Run.model_validate(self.items.get_by_pk({"id": id_}))
+        return self.items.create(model.id, scenario.id, values=creation_info)
 
     @create.auth_check()
     def create_auth_check(
@@ -517,6 +539,157 @@ class RunService(GetByIdService):
             platform, models=[run.model.name], raise_exc=Forbidden
         )
 
+    @procedure(Http(methods=("POST",)))
+    def clone(
+        self,
+        id: int,
+        model_name: str | None = None,
+        scenario_name: str | None = None,
+        keep_solution: bool = True,
+    ) -> Run:
+        """Creates a new run and copies the meta indicators, iamc and optimization
+        data of the run with `id` into it. The data is copied within the database
+        in a single transaction, which also creates a checkpoint with the message
+        "Clone run <source run>" for the new run.
+
+        Parameters
+        ----------
+        id : int
+            Unique integer id of the run to clone.
+        model_name : str | None
+            Optional model name for the cloned run.
+            Defaults to the model of the source run.
+        scenario_name : str | None
+            Optional scenario name for the cloned run.
+            Defaults to the scenario of the source run.
+        keep_solution : bool
+            Whether to copy the data of equations and variables, too.
+            Default ``True``.
+
+        Raises
+        ------
+        :class:`RunNotFound`:
+            If no run with the `id` exists.
+
+        Returns
+        -------
+        :class:`ixmp4.data.run.dto.Run`:
+            The cloned run.
+        """
+        src_run = self.items.get_by_pk({"id": id})
+        dst_run__id = self.create_run(
+            model_name or src_run.model.name,
+            scenario_name or src_run.scenario.name,
+        )
+
+        creation_info = self.get_creation_info()
+        try:
+            for cloner in (meta_cloner, iamc_cloner, opt_cloner):
+                cloner(
+                    self.executor,
+                    src_run.id,
+                    dst_run__id,
+                    keep_solution=keep_solution,
+                    creation_info=creation_info,
+                )
+            self.create_clone_checkpoint(src_run, dst_run__id)
+            self.executor.session.commit()
+        except Exception:
+            self.executor.session.rollback()
+            self.items.delete_by_pk({"id": dst_run__id})
+            raise
+
+        return Run.model_validate(self.items.get_by_pk({"id": dst_run__id}))
+
+    def create_clone_checkpoint(self, src_run: RunModel, dst_run__id: int) -> None:
+        transaction__id = None
+        if self.get_dialect().name == "postgresql":
+            transaction__id = self.transactions.latest().id
+
+        message = (
+            f"Clone run <Run model='{src_run.model.name}' "
+            f"scenario='{src_run.scenario.name}' version={src_run.version} "
+            f"id={src_run.id}>"
+        )
+        self.executor.session.execute(
+            sa.insert(Checkpoint).values(
+                run__id=dst_run__id, transaction__id=transaction__id, message=message
+            )
+        )
+
+    @clone.auth_check()
+    def clone_auth_check(
+        self,
+        auth_ctx: AuthorizationContext,
+        platform: PlatformProtocol,
+        id: int,
+        model_name: str | None = None,
+        scenario_name: str | None = None,
+        keep_solution: bool = True,
+    ) -> None:
+        run = self.items.get_by_pk({"id": id})
+        auth_ctx.has_edit_permission(
+            platform, models=[model_name or run.model.name], raise_exc=Forbidden
+        )
+
+    @procedure(Http(methods=("POST",)))
+    def remove_solution(self, id: int) -> None:
+        """Removes the data of all equations and variables of a run.
+
+        Parameters
+        ----------
+        id : int
+            Unique integer id.
+
+        Raises
+        ------
+        :class:`RunNotFound`:
+            If no run with the `id` exists.
+        """
+        self.items.get_by_pk({"id": id})
+        self.equations.delete_run_data(id)
+        self.variables.delete_run_data(id)
+
+    @remove_solution.auth_check()
+    def remove_solution_auth_check(
+        self, auth_ctx: AuthorizationContext, platform: PlatformProtocol, id: int
+    ) -> None:
+        run = self.items.get_by_pk({"id": id})
+        auth_ctx.has_edit_permission(
+            platform, models=[run.model.name], raise_exc=Forbidden
+        )
+
+    @procedure(Http(methods=("PATCH",)))
+    def has_solution(self, id: int) -> bool:
+        """Checks whether any equation or variable of a run has data.
+
+        Parameters
+        ----------
+        id : int
+            Unique integer id.
+
+        Raises
+        ------
+        :class:`RunNotFound`:
+            If no run with the `id` exists.
+
+        Returns
+        -------
+        bool:
+            Whether the run contains a solution.
+        """
+        self.items.get_by_pk({"id": id})
+        return self.variables.has_run_data(id) or self.equations.has_run_data(id)
+
+    @has_solution.auth_check()
+    def has_solution_auth_check(
+        self, auth_ctx: AuthorizationContext, platform: PlatformProtocol, id: int
+    ) -> None:
+        run = self.items.get_by_pk({"id": id})
+        auth_ctx.has_view_permission(
+            platform, models=[run.model.name], raise_exc=Forbidden
+        )
+
     @procedure(Http(methods=("POST",)))
     def lock(self, id: int) -> Run:
         """Locks a run at the current transaction (via `transaction__id`).
@@ -50,9 +50,10 @@ Procedure Internals
   by an :class:`ixmp4.transport.HttpxTransport`.
 
 * :class:`~ixmp4.data.services.procedure.auth.ProcedureAuthCheck` \
-/  :class:`~ixmp4.data.services.procedure.pagination.ProcedurePagination`:
-  optional wrappers to add authorization checks and pagination support
-  to procedures.
+/  :class:`~ixmp4.data.services.procedure.pagination.ProcedurePagination` \
+/  :class:`~ixmp4.data.services.procedure.streaming.ProcedureStreaming`:
+  optional wrappers to add authorization checks, pagination and
+  streaming support to procedures.
 
 
 """
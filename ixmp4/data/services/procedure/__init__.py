@@ -5,15 +5,18 @@ from typing import (
     Callable,
     Concatenate,
     Generic,
+    Iterator,
     ParamSpec,
     TypeVar,
     cast,
 )
 
+import pandas as pd
 import pydantic as pyd
 from litestar.handlers import HTTPRouteHandler
 
 from ixmp4.base_exceptions import InvalidArguments, ProgrammingError
+from ixmp4.data.pagination import Streaming
 from ixmp4.transport import AuthorizedTransport
 
 from ..base import Service
@@ -23,6 +26,7 @@ from .descriptor import ProcedureDescriptor
 from .endpoint import ProcedureHttpConfig as ProcedureHttpConfig
 from .endpoint import ProcedureRouteHandler, generate_arguments_model
 from .pagination import ProcedurePagination
+from .streaming import ProcedureStreaming
 
 ReturnT = TypeVar("ReturnT")
 Params = ParamSpec("Params")
@@ -37,13 +41,14 @@ class Procedure(Generic[ServiceT, Params, ReturnT]):
     A :class:`Procedure` wraps a service method, validates its signature,
     and provides adapters for direct invocation, http client calls, and
     registration of HTTP route handlers. It also manages authorization
-    checks and pagination metadata attached to the procedure.
+    checks, pagination and streaming metadata attached to the procedure.
     """
 
     func: ProcedureFunc[ServiceT, Params, ReturnT]
     signature: inspect.Signature
     auth_check: ProcedureAuthCheck[ServiceT, Params]
     pagination: ProcedurePagination[ServiceT, Params, ReturnT]
+    streaming: ProcedureStreaming[ServiceT, Params]
     handlers: dict[type[Service], ProcedureRouteHandler[ServiceT, Params, ReturnT]]
     http_config: ProcedureHttpConfig
     direct_payload_model: type[pyd.BaseModel]
@@ -57,6 +62,7 @@ class Procedure(Generic[ServiceT, Params, ReturnT]):
         self.signature = self.validate_signature(func)
         self.auth_check = ProcedureAuthCheck(self)
         self.pagination = ProcedurePagination(self)
+        self.streaming = ProcedureStreaming(self)
         self.http_config = http_config
         self.handlers = {}
         self.direct_payload_model = self.build_direct_payload_model()
@@ -202,6 +208,33 @@ class Procedure(Generic[ServiceT, Params, ReturnT]):
         handler = self.handlers[type(service)]
         return ProcedureClient(service, handler)
 
+    def get_direct_streamed_callable(
+        self, service: ServiceT, streaming: Streaming
+    ) -> Callable[Params, Iterator[pd.DataFrame]]:
+        bound_func = functools.partial(self.streaming.streamed_func, service, streaming)
+        auth_callable = self.get_authorized_callable(service, bound_func)
+
+        @functools.wraps(self.func)
+        def wrapper(
+            *args: Params.args, **kwargs: Params.kwargs
+        ) -> Iterator[pd.DataFrame]:
+            direct_args, direct_kwargs = self.validate_direct_call_args(
+                args=tuple(args), kwargs=dict(kwargs)
+            )
+            return cast(
+                Iterator[pd.DataFrame], auth_callable(*direct_args, **direct_kwargs)
+            )
+
+        return wrapper
+
+    def get_httpx_streamed_callable(
+        self, service: ServiceT, streaming: Streaming
+    ) -> Callable[Params, Iterator[pd.DataFrame]]:
+        handler = self.handlers[type(service)]
+        return functools.partial(
+            ProcedureClient(service, handler).iter_batches, streaming
+        )
+
     def get_descriptor(self) -> ProcedureDescriptor[ServiceT, Params, ReturnT]:
         return ProcedureDescriptor(self)
 
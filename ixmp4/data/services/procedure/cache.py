@@ -0,0 +1,146 @@
+import abc
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import pydantic as pyd
+
+from ixmp4.base_exceptions import ImproperlyConfigured
+from ixmp4.conf.settings import ResultCacheSettings
+
+
+def get_result_key(**parts: Any) -> str:
+    """Returns a key identifying the combination of `parts`,
+    which must be json serializable."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCacheMetrics(pyd.BaseModel):
+    """Hit and miss counts of a result cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class ResultCacheBackend(abc.ABC):
+    """Storage for serialized procedure results.
+
+    Subclasses are instantiated with the
+    :class:`~ixmp4.conf.settings.ResultCacheSettings` of the server and are
+    expected to expire entries after ``settings.ttl`` seconds.
+    Backends shared between server processes (e.g. one storing results in
+    redis at ``settings.url``) are configured via
+    ``IXMP4_SERVER__RESULT_CACHE__BACKEND=package.module:ClassName``.
+    """
+
+    settings: ResultCacheSettings
+
+    def __init__(self, settings: ResultCacheSettings):
+        self.settings = settings
+
+    @abc.abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Returns the value stored for `key` or `None` if there is none."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """Stores `value` under `key`."""
+        raise NotImplementedError
+
+
+class MemoryResultCacheBackend(ResultCacheBackend):
+    """Keeps the ``settings.max_entries`` most recently used results
+    in the memory of the server process."""
+
+    entries: "OrderedDict[str, tuple[float, bytes]]"
+
+    def __init__(self, settings: ResultCacheSettings):
+        super().__init__(settings)
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.settings.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.settings.max_entries:
+                self.entries.popitem(last=False)
+
+
+class ResultCache(object):
+    """Caches serialized responses of read procedures.
+
+    Keys are built from everything the response depends on, callers include
+    a version which changes whenever the underlying data does.
+    """
+
+    backend: ResultCacheBackend
+    settings: ResultCacheSettings
+
+    def __init__(self, backend: ResultCacheBackend, settings: ResultCacheSettings):
+        self.backend = backend
+        self.settings = settings
+        self.metrics = ResultCacheMetrics()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: ResultCacheSettings) -> "ResultCache":
+        backend_class = (
+            MemoryResultCacheBackend
+            if settings.backend == "memory"
+            else settings.backend
+        )
+        if not (
+            isinstance(backend_class, type)
+            and issubclass(backend_class, ResultCacheBackend)
+        ):
+            raise ImproperlyConfigured(
+                f"Result cache backend `{settings.backend}` is not a "
+                "`ResultCacheBackend` subclass."
+            )
+        return cls(backend_class(settings), settings)
+
+    def get_key(self, **parts: Any) -> str:
+        """Returns a key identifying the combination of `parts`,
+        which must be json serializable."""
+        return get_result_key(**parts)
+
+    def get(self, key: str) -> tuple[str, bytes] | None:
+        """Returns the media type and content of the cached response."""
+        value = self.backend.get(key)
+        with self.lock:
+            if value is None:
+                self.metrics.misses += 1
+                return None
+            self.metrics.hits += 1
+
+        media_type, _, content = value.partition(b"\n")
+        return media_type.decode(), content
+
+    def set(self, key: str, media_type: str, content: bytes) -> None:
+        if len(content) > self.settings.max_entry_size:
+            return
+        self.backend.set(key, media_type.encode() + b"\n" + content)
+
+    def get_metrics(self) -> ResultCacheMetrics:
+        with self.lock:
+            return self.metrics.model_copy()
@@ -1,5 +1,6 @@
+import json
 from concurrent import futures
-from typing import TYPE_CHECKING, Any, Generic, ParamSpec, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Generic, Iterator, ParamSpec, TypeVar, cast
 
 import httpx
 import pandas as pd
@@ -7,11 +8,26 @@ import pydantic as pyd
 from litestar.types.internal_types import PathParameterDefinition
 from litestar.utils.path import join_paths
 
-from ixmp4.base_exceptions import ProgrammingError
+from ixmp4.base_exceptions import ProgrammingError, ServerError
 from ixmp4.core.exceptions import InvalidArguments
+from ixmp4.data.dataframe import (
+    ARROW_STREAM_MEDIA_TYPE,
+    parse_df_arrow,
+    serialize_df_arrow,
+)
+from ixmp4.data.pagination import Streaming
 from ixmp4.transport import HttpxTransport
 
 from .endpoint import ProcedureRouteHandler
+from .streaming import (
+    ARROW_FRAME,
+    DATAFRAME_STREAM_MEDIA_TYPE,
+    END_FRAME,
+    ERROR_FRAME,
+    JSON_FRAME,
+    dataframe_adapter,
+    iter_frames,
+)
 
 if TYPE_CHECKING:
     from ..base import Service
@@ -28,7 +44,15 @@ class ProcedureClient(Generic[ServiceT, Params, ReturnT]):
     :class:`ixmp4.transport.HttpxTransport`, the descriptor returns an
     instance of :class:`ProcedureClient` which performs HTTP requests to
     the service endpoint, validates arguments, and handles paginated
-    responses by dispatching concurrent requests when needed.
+    responses by requesting the remaining pages when needed, following
+    the last id of each page if the procedure supports keyset pagination
+    and dispatching concurrent offset requests otherwise.
+    Large dataframe payloads of chunked procedures are split and uploaded
+    in multiple requests.
+    Dataframes are exchanged as Arrow IPC streams if both client and
+    server support it and as JSON otherwise.
+    Results of streamed procedures are received in batches over a single
+    response and concatenated as they arrive.
     """
 
     transport: HttpxTransport
@@ -51,27 +75,248 @@ class ProcedureClient(Generic[ServiceT, Params, ReturnT]):
         self.transport = service.transport
 
     def __call__(self, *args: Params.args, **kwargs: Params.kwargs) -> ReturnT:
-        path_params, payload = self.classify_arguments(*args, **kwargs)
-        path = self.reverse_path(path_params)
+        path_obj, payload_obj = self.validate_arguments(*args, **kwargs)
+        path = self.reverse_path(path_obj.model_dump(mode="json", exclude_unset=True))
+
+        payload_chunks = self.split_payload(payload_obj)
+        if payload_chunks is not None:
+            self.dispatch_chunked_requests(path, payload_chunks)
+            return cast(ReturnT, None)
+
+        if self.handler.procedure.streaming.has_streaming:
+            batches = list(self.iter_streamed(path, payload_obj))
+            return cast(ReturnT, pd.concat(batches, ignore_index=True))
+
+        return self.send_request(path, payload_obj)
+
+    def send_request(self, path: str, payload_obj: pyd.BaseModel) -> ReturnT:
+        headers = self.get_request_headers()
+        json, params, content = self.encode_payload(payload_obj, headers)
+
+        res = self.transport.request(
+            self.method,
+            path,
+            json=json,
+            params=params,
+            content=content,
+            headers=headers,
+        )
+        self.transport.raise_service_exception(res)
+        return self.handle_response(
+            res, path, params=params, json=json, content=content, headers=headers
+        )
+
+    def iter_batches(
+        self, streaming: Streaming, *args: Params.args, **kwargs: Params.kwargs
+    ) -> Iterator[pd.DataFrame]:
+        path_obj, payload_obj = self.validate_arguments(*args, **kwargs)
+        path = self.reverse_path(path_obj.model_dump(mode="json", exclude_unset=True))
+        return self.iter_streamed(path, payload_obj, batch_size=streaming.batch_size)
+
+    def iter_streamed(
+        self,
+        path: str,
+        payload_obj: pyd.BaseModel,
+        batch_size: int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Requests the results of a streamed procedure and yields the dataframe
+        batches as they are received. Servers without streaming support
+        respond with the complete result, which is yielded as a single batch,
+        or with its first page if `batch_size` is given, in which case the
+        following pages are requested one by one as they are consumed."""
+
+        headers = self.get_request_headers()
+        headers["Accept"] = ", ".join(
+            [DATAFRAME_STREAM_MEDIA_TYPE, *self.transport.wire_formats]
+        )
+        json, params, content = self.encode_payload(payload_obj, headers)
+        page_by_page = (
+            batch_size is not None and self.handler.procedure.pagination.has_pagination
+        )
+        if batch_size is not None:
+            params = {**(params or {}), "batch_size": batch_size}
+        if page_by_page:
+            params = {**(params or {}), "limit": batch_size}
+
+        with self.transport.stream(
+            self.method,
+            path,
+            json=json,
+            params=params,
+            content=content,
+            headers=headers,
+        ) as res:
+            if get_media_type(res) != DATAFRAME_STREAM_MEDIA_TYPE:
+                res.read()
+                self.transport.raise_service_exception(res)
+                if page_by_page:
+                    yield from self.iter_paginated_response(
+                        res,
+                        path,
+                        params=params,
+                        json=json,
+                        content=content,
+                        headers=headers,
+                    )
+                    return
+
+                result = self.handle_response(
+                    res,
+                    path,
+                    params=params,
+                    json=json,
+                    content=content,
+                    headers=headers,
+                )
+                yield cast(pd.DataFrame, result)
+                return
+
+            try:
+                for kind, frame in iter_frames(res.iter_bytes()):
+                    if kind == END_FRAME:
+                        return
+                    elif kind == ERROR_FRAME:
+                        self.raise_error_frame(frame, res)
+                    else:
+                        yield self.parse_dataframe_frame(kind, frame)
+            except ValueError as e:
+                raise ServerError(f"Received incomplete dataframe stream: {str(e)}")
+
+            raise ServerError("Dataframe stream ended unexpectedly.")
+
+    def raise_error_frame(self, frame: bytes, response: httpx.Response) -> None:
+        self.transport.raise_dict_or_unknown(json.loads(frame), response)
+
+    def parse_dataframe_frame(self, kind: bytes, frame: bytes) -> pd.DataFrame:
+        if kind == ARROW_FRAME:
+            try:
+                df, _ = parse_df_arrow(frame)
+            except ValueError as e:
+                raise ProgrammingError(f"Received invalid arrow response: {str(e)}")
+            return df
+        elif kind == JSON_FRAME:
+            return dataframe_adapter.validate_json(frame)
+        else:
+            raise ProgrammingError(f"Received dataframe stream frame of kind {kind!r}.")
+
+    def encode_payload(
+        self, payload_obj: pyd.BaseModel, headers: dict[str, str]
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None, bytes | None]:
+        """Returns the `json`, `params` and `content` request arguments
+        for the payload and sets the matching `Content-Type` header."""
 
         json = None
         params = None
+        content = None
 
         if self.handler.supports_body:
-            json = payload
-            params = None
+            content = self.serialize_arrow_payload(payload_obj)
+            if content is not None:
+                headers["Content-Type"] = ARROW_STREAM_MEDIA_TYPE
+            else:
+                json = payload_obj.model_dump(mode="json", exclude_unset=True)
         else:
-            json = None
-            params = payload
+            params = payload_obj.model_dump(mode="json", exclude_unset=True)
 
-        res = self.transport.request(self.method, path, json=json, params=params)
-        self.transport.raise_service_exception(res)
+        return json, params, content
+
+    def handle_response(
+        self,
+        response: httpx.Response,
+        path: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> ReturnT:
         if self.handler.procedure.pagination.has_pagination:
-            return self.handle_paginated_response(res, path, params=params, json=json)
+            return self.handle_paginated_response(
+                response,
+                path,
+                params=params,
+                json=json,
+                content=content,
+                headers=headers,
+            )
         else:
-            return cast(
-                ReturnT, self.handler.return_type_adapter.validate_json(res.text)
+            return cast(ReturnT, self.parse_response(response))
+
+    def split_payload(self, payload_obj: pyd.BaseModel) -> list[pyd.BaseModel] | None:
+        """Splits the dataframe payload of chunked procedures into chunks of
+        `default_upload_chunk_size` rows. Returns `None` if the payload
+        does not need to be split."""
+
+        field = self.handler.dataframe_payload_field
+        if (
+            self.handler.config.chunking is None
+            or field is None
+            or payload_obj.model_fields_set != {field}
+        ):
+            return None
+
+        df: pd.DataFrame = getattr(payload_obj, field)
+        chunk_size = self.transport.settings.default_upload_chunk_size
+        if len(df) <= chunk_size:
+            return None
+
+        return [
+            self.handler.payload_model.model_validate(
+                {field: df.iloc[start : start + chunk_size]}
             )
+            for start in range(0, len(df), chunk_size)
+        ]
+
+    def dispatch_chunked_requests(
+        self, path: str, payload_chunks: list[pyd.BaseModel]
+    ) -> None:
+        if self.handler.config.chunking == "sequential":
+            for chunk in payload_chunks:
+                self.send_request(path, chunk)
+            return
+
+        requests: list[futures.Future[ReturnT]] = [
+            self.transport.executor.submit(self.send_request, path, chunk)
+            for chunk in payload_chunks
+        ]
+        # wait for all chunks to settle before raising,
+        # so that a revert catches every chunk which was written
+        futures.wait(requests)
+        for future in requests:
+            future.result()
+
+    def get_request_headers(self) -> dict[str, str]:
+        return {"Accept": ", ".join(self.transport.wire_formats)}
+
+    def serialize_arrow_payload(self, payload_obj: pyd.BaseModel) -> bytes | None:
+        """Encodes the payload as an arrow stream if it consists of a single
+        dataframe and both client and server support arrow. Returns `None`
+        otherwise."""
+
+        field = self.handler.dataframe_payload_field
+        if (
+            field is None
+            or ARROW_STREAM_MEDIA_TYPE not in self.transport.wire_formats
+            or ARROW_STREAM_MEDIA_TYPE not in self.transport.server_wire_formats
+            or payload_obj.model_fields_set != {field}
+        ):
+            return None
+
+        return serialize_df_arrow(getattr(payload_obj, field))
+
+    def parse_response(self, response: httpx.Response) -> Any:
+        if get_media_type(response) != ARROW_STREAM_MEDIA_TYPE:
+            return self.handler.return_type_adapter.validate_json(response.text)
+
+        try:
+            df, metadata = parse_df_arrow(response.content)
+        except ValueError as e:
+            raise ProgrammingError(f"Received invalid arrow response: {str(e)}")
+
+        if self.handler.procedure.pagination.has_pagination:
+            return self.handler.return_type_adapter.validate_python(
+                {"results": df, **(metadata or {})}
+            )
+        return self.handler.return_type_adapter.validate_python(df)
 
     def reverse_path(self, path_parameters: dict[str, Any]) -> str:
         svc_router_prefix = self.handler.service_class.router_prefix
@@ -100,9 +345,9 @@ class ProcedureClient(Generic[ServiceT, Params, ReturnT]):
         arg_names = arg_names[: len(args)]
         return {name: val for name, val in zip(arg_names, args)}
 
-    def classify_arguments(
+    def validate_arguments(
         self, *args: Params.args, **kwargs: Params.kwargs
-    ) -> tuple[dict[str, Any], dict[str, Any]]:
+    ) -> tuple[pyd.BaseModel, pyd.BaseModel]:
         named_pos_args = self.pos_args_to_named(cast(tuple[Any], args))
         all_args = {**named_pos_args, **kwargs}
         path_args = {k: v for k, v in all_args.items() if k in self.handler.path_fields}
@@ -117,6 +362,12 @@ class ProcedureClient(Generic[ServiceT, Params, ReturnT]):
         except pyd.ValidationError as e:
             raise InvalidArguments(validation_error=e)
 
+        return path_obj, payload_obj
+
+    def classify_arguments(
+        self, *args: Params.args, **kwargs: Params.kwargs
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        path_obj, payload_obj = self.validate_arguments(*args, **kwargs)
         path_params = path_obj.model_dump(mode="json", exclude_unset=True)
         payload = payload_obj.model_dump(mode="json", exclude_unset=True)
         return path_params, payload
@@ -127,23 +378,127 @@ class ProcedureClient(Generic[ServiceT, Params, ReturnT]):
         path: str,
         params: dict[str, Any] | None,
         json: dict[str, Any] | None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
     ) -> ReturnT:
-        result = self.handler.return_type_adapter.validate_json(response.text)
+        result = self.parse_response(response)
         result_items = [result.results]
 
         if result.total >= (result.pagination.offset + result.pagination.limit):
-            # TODO: We could check if the `total` changed
-            # since we started the pagination...
-            result_items += self.dispatch_pagination_requests(
+            keyset_items = None
+            if self.handler.supports_keyset_pagination:
+                keyset_items = self.dispatch_keyset_requests(
+                    path,
+                    page=result.results,
+                    limit=result.pagination.limit,
+                    params=params,
+                    json=json,
+                    content=content,
+                    headers=headers,
+                )
+
+            if keyset_items is not None:
+                result_items += keyset_items
+            else:
+                # TODO: We could check if the `total` changed
+                # since we started the pagination...
+                result_items += self.dispatch_pagination_requests(
+                    path,
+                    total=result.total,
+                    start=result.pagination.limit,
+                    limit=result.pagination.limit,
+                    params=params,
+                    json=json,
+                    content=content,
+                    headers=headers,
+                )
+
+        return self.merge_results(result_items)
+
+    def iter_paginated_response(
+        self,
+        response: httpx.Response,
+        path: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Iterator[Any]:
+        """Yields the results of a paginated response page by page,
+        requesting each page only once the previous one was consumed."""
+
+        result = self.parse_response(response)
+        yield result.results
+
+        offset, limit = result.pagination.offset, result.pagination.limit
+        while limit > 0 and offset + limit < result.total:
+            offset += limit
+            req_params = params.copy() if params is not None else {}
+            req_params.update({"limit": limit, "offset": offset})
+            res = self.transport.request(
+                self.method,
                 path,
-                total=result.total,
-                start=result.pagination.limit,
-                limit=result.pagination.limit,
-                params=params,
+                params=req_params,
                 json=json,
+                content=content,
+                headers=headers,
             )
+            self.transport.raise_service_exception(res)
+            result = self.parse_response(res)
+            yield result.results
 
-        return self.merge_results(result_items)
+    def dispatch_keyset_requests(
+        self,
+        path: str,
+        page: Any,
+        limit: int,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> list[ReturnT] | None:
+        """Requests the pages following `page` one after the other, passing
+        the last id of the previous page as cursor, so that the server does
+        not have to skip over all preceding rows for each page.
+        Returns `None` if the results do not contain ids or the server
+        does not support keyset pagination."""
+
+        pagination_results: list[ReturnT] = []
+        while limit > 0 and len(page) >= limit:
+            after = self.get_last_id(page)
+            if after is None:
+                return None
+
+            req_params = params.copy() if params is not None else {}
+            req_params.update({"limit": limit, "after": after})
+            res = self.transport.request(
+                self.method,
+                path,
+                params=req_params,
+                json=json,
+                content=content,
+                headers=headers,
+            )
+            self.transport.raise_service_exception(res)
+            result = self.parse_response(res)
+            if getattr(result.pagination, "after", None) != after:
+                # servers predating keyset pagination ignore the cursor
+                return None
+
+            page = result.results
+            pagination_results.append(page)
+
+        return pagination_results
+
+    def get_last_id(self, page: Any) -> int | None:
+        if isinstance(page, pd.DataFrame):
+            if page.empty or "id" not in page.columns:
+                return None
+            return int(page["id"].iloc[-1])
+        if isinstance(page, list) and len(page) > 0:
+            last_id = getattr(page[-1], "id", None)
+            return last_id if isinstance(last_id, int) else None
+        return None
 
     def dispatch_pagination_requests(
         self,
@@ -153,6 +508,8 @@ class ProcedureClient(Generic[ServiceT, Params, ReturnT]):
         limit: int,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
     ) -> list[ReturnT]:
         requests: list[futures.Future[httpx.Response]] = []
 
@@ -166,6 +523,8 @@ class ProcedureClient(Generic[ServiceT, Params, ReturnT]):
                 path,
                 params=req_params,
                 json=json,
+                content=content,
+                headers=headers,
             )
             requests.append(future)
 
@@ -175,7 +534,7 @@ class ProcedureClient(Generic[ServiceT, Params, ReturnT]):
 
         for res in responses:
             self.transport.raise_service_exception(res)
-            result = self.handler.return_type_adapter.validate_json(res.text)
+            result = self.parse_response(res)
             pagination_results.append(result.results)
 
         return pagination_results
@@ -198,3 +557,8 @@ class ProcedureClient(Generic[ServiceT, Params, ReturnT]):
 
     def merge_lists(self, results: list[list[Any]]) -> list[Any]:
         return [i for page in results for i in page]
+
+
+def get_media_type(response: httpx.Response) -> str:
+    content_type = str(response.headers.get("content-type", ""))
+    return content_type.split(";")[0].strip()
@@ -15,6 +15,7 @@ from ixmp4.transport import DirectTransport, HttpxTransport
 from ..base import Service
 from .auth import ProcedureAuthCheck
 from .pagination import ProcedurePagination
+from .streaming import ProcedureStreaming
 
 if TYPE_CHECKING:
     from . import Procedure
@@ -44,6 +45,10 @@ class ProcedureDescriptor(Generic[ServiceT, Params, ReturnT]):
     def paginated(self) -> ProcedurePagination[ServiceT, Params, ReturnT]:
         return self.procedure.pagination
 
+    @property
+    def streamed(self) -> ProcedureStreaming[ServiceT, Params]:
+        return self.procedure.streaming
+
     def __init__(self, procedure: "Procedure[ServiceT, Params, ReturnT]"):
         self.procedure = procedure
         # update this descriptor to look like the wrapped function
@@ -1,46 +1,90 @@
 import functools
 import inspect
+import json
+import logging
 from dataclasses import dataclass
 from string import Formatter
 from typing import (
     TYPE_CHECKING,
+    Annotated,
     Any,
+    AsyncIterator,
     Callable,
+    Generator,
     Generic,
+    Iterator,
     Literal,
     ParamSpec,
     Sequence,
     TypeVar,
+    cast,
     get_args,
     get_origin,
     get_type_hints,
 )
 
+import pandas as pd
 import pydantic as pyd
 from litestar import HttpMethod, Request
+from litestar.concurrency import sync_to_thread
 from litestar.handlers import HTTPRouteHandler
 from litestar.openapi.spec import (
+    OpenAPIFormat,
     OpenAPIMediaType,
     OpenAPIResponse,
+    OpenAPIType,
     Operation,
     Reference,
     Schema,
 )
-from litestar.response import Response
+from litestar.response import Response, Stream
 from litestar.routes import HTTPRoute
+from litestar.status_codes import HTTP_304_NOT_MODIFIED
 from litestar.types import Method
+from sqlalchemy.ext.asyncio import AsyncSession
+from toolkit.db.executor import SessionExecutor
+from toolkit.exceptions.registry import ExceptionNotFound
 from typing_extensions import Unpack
 
-from ixmp4.base_exceptions import InvalidArguments, ProgrammingError
-from ixmp4.data.pagination import Pagination
+from ixmp4.base_exceptions import (
+    InvalidArguments,
+    ProgrammingError,
+    ServerError,
+    ServiceException,
+    registry,
+)
+from ixmp4.data.dataframe import (
+    ARROW_STREAM_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    get_wire_formats,
+    parse_df_arrow,
+    serialize_df_arrow,
+)
+from ixmp4.data.pagination import PaginatedResult, Pagination, Streaming
+from ixmp4.data.versions.transaction import TransactionRepository
+from ixmp4.transport import AuthorizedTransport, DirectTransport
+
+from .cache import ResultCache, get_result_key
+from .streaming import (
+    ARROW_FRAME,
+    DATAFRAME_STREAM_MEDIA_TYPE,
+    END_FRAME,
+    ERROR_FRAME,
+    JSON_FRAME,
+    dataframe_adapter,
+    encode_frame,
+)
 
 if TYPE_CHECKING:
     from ..base import Service
     from . import Procedure
 
+logger = logging.getLogger(__name__)
+
 ReturnT = TypeVar("ReturnT")
 Params = ParamSpec("Params")
 ServiceT = TypeVar("ServiceT", bound="Service")
+CallArgs = tuple[tuple[Any, ...], dict[str, Any]]
 
 
 @dataclass
@@ -51,11 +95,27 @@ class ProcedureHttpConfig:
     - ``path``: optional explicit path; if omitted a path is derived
         from the procedure name.
     - ``status_code``: response status code for successful responses.
+    - ``chunking``: if set, http clients split a single dataframe payload
+        into chunks of ``ClientSettings.default_upload_chunk_size`` rows
+        and send them ``"concurrent"``-ly or ``"sequential"``-ly.
+        Only supported for procedures taking exactly one dataframe
+        and returning ``None``.
+    - ``cache_results``: whether results of ``PATCH`` procedures are cached
+        and tagged with the latest transaction id and the database transactions
+        in progress. Must be disabled for procedures reading tables without
+        version triggers, since changes to them do not record a transaction.
+    - ``keyset_pagination``: whether paginated procedures filtering by id
+        may be paginated by the last id of the previous page. Must be
+        disabled for procedures whose results are not ordered by id,
+        since the last id of a page is no valid cursor for them.
     """
 
     methods: HttpMethod | Method | Sequence[HttpMethod | Method]
     path: str | None = None
     status_code: int = 200
+    chunking: Literal["concurrent", "sequential"] | None = None
+    cache_results: bool = True
+    keyset_pagination: bool = True
 
 
 class ProcedureRouteHandler(HTTPRouteHandler, Generic[ServiceT, Params, ReturnT]):
@@ -64,6 +124,15 @@ class ProcedureRouteHandler(HTTPRouteHandler, Generic[ServiceT, Params, ReturnT]
     Constructs request/response models from the procedure signature,
     binds service instances, handles validation errors, and performs
     serialization/deserialization for the procedure's return type.
+    Dataframe payloads and results are exchanged as Arrow IPC streams
+    if the client asks for it and as JSON otherwise.
+    Results of streamed procedures are sent in batches as they are fetched
+    if the client accepts a dataframe stream.
+    Procedures run in a worker thread unless the transport is backed by an
+    async engine, in which case they run on the event loop and only yield
+    control while waiting for the database. Payloads are still parsed in a
+    worker thread, but CPU-bound work of the procedure, e.g. validating
+    dataframes or authorization requests to the manager, blocks the loop.
     """
 
     config: ProcedureHttpConfig
@@ -91,7 +160,6 @@ class ProcedureRouteHandler(HTTPRouteHandler, Generic[ServiceT, Params, ReturnT]
             summary=procedure.func.__name__,
             description=procedure.func.__doc__,
             operation_class=self.get_openapi_operation_class(),
-            sync_to_thread=True,
         )
         self.name = ".".join(
             [service_class.__module__, service_class.__name__, procedure.func.__name__]
@@ -103,6 +171,19 @@ class ProcedureRouteHandler(HTTPRouteHandler, Generic[ServiceT, Params, ReturnT]
 
         self.path_model = self.build_path_model(self.path_fields)
         self.payload_model = self.build_payload_model(self.path_fields)
+        self.dataframe_payload_field = self.get_dataframe_payload_field()
+        # PATCH is reserved for list and tabulate procedures,
+        # which take their filters in the request body
+        self.supports_result_cache = (
+            self.http_methods == {"PATCH"} and config.cache_results
+        )
+        self.supports_keyset_pagination = (
+            self.procedure.pagination.has_pagination
+            and config.keyset_pagination
+            and "id__gt" in self.payload_model.model_fields
+        )
+        if config.chunking is not None:
+            self.validate_chunking()
 
         if self.procedure.pagination.has_pagination:
             self.return_type_adapter = pyd.TypeAdapter(
@@ -113,7 +194,7 @@ class ProcedureRouteHandler(HTTPRouteHandler, Generic[ServiceT, Params, ReturnT]
                 self.procedure.signature.return_annotation
             )
 
-        super().__call__(self.handle_request)
+        super().__call__(self.handle_async_request)
 
         self.proto_route = HTTPRoute(path=next(iter(self.paths)), route_handlers=[self])
 
@@ -154,6 +235,35 @@ class ProcedureRouteHandler(HTTPRouteHandler, Generic[ServiceT, Params, ReturnT]
             extra="ignore",
         )
 
+    def get_dataframe_payload_field(self) -> str | None:
+        """Returns the name of the payload field which can be sent as an
+        arrow stream, if the payload contains exactly one dataframe."""
+
+        if not self.supports_body:
+            return None
+
+        df_fields = [
+            name
+            for name, field in self.payload_model.model_fields.items()
+            if field.annotation is pd.DataFrame
+        ]
+        if len(df_fields) != 1:
+            return None
+        return df_fields[0]
+
+    def validate_chunking(self) -> None:
+        func_name = self.procedure.func.__name__
+        if self.dataframe_payload_field is None:
+            raise ProgrammingError(
+                f"Procedure `{func_name}` cannot be chunked because its payload "
+                "does not contain exactly one dataframe."
+            )
+        if self.procedure.signature.return_annotation is not None:
+            raise ProgrammingError(
+                f"Procedure `{func_name}` cannot be chunked because it "
+                "does not return `None`."
+            )
+
     def get_model_name(self, suffix: str) -> str:
         func_name = self.procedure.func.__name__
         return func_name.title().replace("_", "") + suffix
@@ -174,25 +284,374 @@ class ProcedureRouteHandler(HTTPRouteHandler, Generic[ServiceT, Params, ReturnT]
         return_schema.pop("$defs", None)
 
         schema = Schema(**return_schema)
-        responses["200"] = OpenAPIResponse(
-            content={"application/json": OpenAPIMediaType(schema=schema)},
-            description="",
-        )
+        content = {JSON_MEDIA_TYPE: OpenAPIMediaType(schema=schema)}
+        if self.returns_dataframe():
+            content[ARROW_STREAM_MEDIA_TYPE] = OpenAPIMediaType(
+                schema=Schema(type=OpenAPIType.STRING, format=OpenAPIFormat.BINARY)
+            )
+        if self.procedure.streaming.has_streaming:
+            content[DATAFRAME_STREAM_MEDIA_TYPE] = OpenAPIMediaType(
+                schema=Schema(type=OpenAPIType.STRING, format=OpenAPIFormat.BINARY)
+            )
+
+        responses["200"] = OpenAPIResponse(content=content, description="")
 
         return responses
 
+    async def handle_async_request(
+        self,
+        request: Request[Any, Any, Any],
+        service: Any,
+        query: dict[str, Any],
+        body: bytes,
+    ) -> Response[Any]:
+        async_session = self.get_async_session(service)
+        if async_session is None:
+            return await sync_to_thread(
+                self.handle_request, request, service, query, body
+            )
+
+        # payloads are parsed in a worker thread since they do not need
+        # the database, the synchronous procedure code runs in a greenlet
+        # which awaits the async driver whenever it talks to the database
+        call_args = await sync_to_thread(
+            self.build_request_call_args, request, query, body
+        )
+        if self.accepts_stream(request):
+            etag, frames = await async_session.run_sync(
+                lambda _: self.get_stream_frames(
+                    request, service, query, body, call_args
+                )
+            )
+            if frames is None:
+                return self.build_not_modified_response(etag)
+            return Stream(
+                self.iter_async_stream_frames(async_session, frames),
+                media_type=DATAFRAME_STREAM_MEDIA_TYPE,
+                headers=self.get_etag_headers(etag),
+            )
+
+        return await async_session.run_sync(
+            lambda _: self.handle_request(request, service, query, body, call_args)
+        )
+
+    def get_async_session(self, service: ServiceT) -> AsyncSession | None:
+        if isinstance(service.transport, DirectTransport):
+            return service.transport.async_session
+        return None
+
     def handle_request(
         self,
         request: Request[Any, Any, Any],
         service: Any,
         query: dict[str, Any],
         body: bytes,
+        call_args: CallArgs | None = None,
     ) -> Response[Any]:
+        if self.accepts_stream(request):
+            return self.handle_stream_request(request, service, query, body, call_args)
+
+        args, kwargs = call_args or self.build_request_call_args(request, query, body)
+        if self.procedure.pagination.has_pagination:
+            kwargs = self.apply_pagination_cursor(
+                self.get_pagination_params(query), kwargs
+            )
+        use_arrow = self.accepts_arrow(request)
+
+        cache_key = None
+        if self.supports_result_cache:
+            cache_key = self.get_result_cache_key(
+                service, query, args, kwargs, use_arrow
+            )
+        etag = self.get_etag(cache_key)
+
+        if self.is_not_modified(request, etag):
+            self.check_permissions(service, args, kwargs)
+            return self.build_not_modified_response(etag)
+
+        cache = self.get_result_cache(request)
+        if cache is not None and cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self.check_permissions(service, args, kwargs)
+                media_type, content = cached
+                return Response(
+                    content,
+                    media_type=media_type,
+                    headers=self.get_etag_headers(etag),
+                )
+
         bound_func = self.bind_endpoint_func(service, query)
-        args, kwargs = self.build_call_args(request.path_params, query, body)
-        result = bound_func(*args, **kwargs)
-        json_bytes = self.return_type_adapter.dump_json(result)
-        return Response(json_bytes, media_type="application/json")
+        media_type, content = self.serialize_result(
+            bound_func(*args, **kwargs), use_arrow
+        )
+        if cache is not None and cache_key is not None:
+            cache.set(cache_key, media_type, content)
+        return Response(
+            content, media_type=media_type, headers=self.get_etag_headers(etag)
+        )
+
+    def check_permissions(
+        self, service: ServiceT, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> None:
+        # permissions are checked even if the result is known
+        self.procedure.get_authorized_callable(service, lambda *args, **kwargs: None)(
+            *args, **kwargs
+        )
+
+    def get_etag(self, key: str | None) -> str | None:
+        return None if key is None else f'"{key}"'
+
+    def get_etag_headers(self, etag: str | None) -> dict[str, str]:
+        if etag is None:
+            return {}
+        # results depend on the permissions of the user,
+        # shared caches must neither store nor serve them
+        return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    def is_not_modified(
+        self, request: Request[Any, Any, Any], etag: str | None
+    ) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if etag is None or if_none_match is None:
+            return False
+
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in tags or "*" in tags
+
+    def build_not_modified_response(self, etag: str | None) -> Response[Any]:
+        return Response(
+            None, status_code=HTTP_304_NOT_MODIFIED, headers=self.get_etag_headers(etag)
+        )
+
+    def serialize_result(self, result: Any, use_arrow: bool) -> tuple[str, bytes]:
+        if use_arrow:
+            arrow_bytes = self.serialize_arrow_result(result)
+            if arrow_bytes is not None:
+                return ARROW_STREAM_MEDIA_TYPE, arrow_bytes
+
+        return JSON_MEDIA_TYPE, self.return_type_adapter.dump_json(result)
+
+    def get_result_cache(self, request: Request[Any, Any, Any]) -> ResultCache | None:
+        if not self.supports_result_cache:
+            return None
+
+        cache = getattr(request.app.state, "result_cache", None)
+        return cache if isinstance(cache, ResultCache) else None
+
+    def get_result_cache_key(
+        self,
+        service: ServiceT,
+        query: dict[str, Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        use_arrow: bool,
+        streaming: Streaming | None = None,
+    ) -> str | None:
+        """Returns the key the result of this request is cached under or
+        `None` if the result of this request cannot be cached.
+        The key doubles as the entity tag of the response."""
+
+        version = self.get_result_cache_version(service)
+        if version is None:
+            return None
+
+        transport = cast(DirectTransport, service.transport)
+        url = transport.get_database_url()
+        if isinstance(transport, AuthorizedTransport):
+            # results only contain what the user is permitted to see
+            user = transport.auth_ctx.user
+            scope = "@anonymous" if user is None else user.model_dump_json()
+        else:
+            scope = None
+
+        pagination = None
+        if self.procedure.pagination.has_pagination:
+            pagination = self.get_pagination_params(query).model_dump()
+
+        return get_result_key(
+            platform=url.render_as_string() if url is not None else None,
+            procedure=self.name,
+            args=args,
+            kwargs=kwargs,
+            pagination=pagination,
+            streaming=streaming.model_dump() if streaming is not None else None,
+            scope=scope,
+            arrow=use_arrow,
+            version=version,
+        )
+
+    def get_result_cache_version(self, service: ServiceT) -> list[int] | None:
+        # only postgresql databases record transactions,
+        # results of other databases cannot be invalidated
+        if not isinstance(service.transport, DirectTransport):
+            return None
+
+        bind = service.transport.session.bind
+        if bind is None or bind.engine.dialect.name != "postgresql":
+            return None
+
+        transactions = TransactionRepository(SessionExecutor(service.transport.session))
+        return transactions.get_commit_state()
+
+    def handle_stream_request(
+        self,
+        request: Request[Any, Any, Any],
+        service: ServiceT,
+        query: dict[str, Any],
+        body: bytes,
+        call_args: CallArgs | None = None,
+    ) -> Response[Any]:
+        etag, frames = self.get_stream_frames(request, service, query, body, call_args)
+        if frames is None:
+            return self.build_not_modified_response(etag)
+        return Stream(
+            frames,
+            media_type=DATAFRAME_STREAM_MEDIA_TYPE,
+            headers=self.get_etag_headers(etag),
+        )
+
+    def get_stream_frames(
+        self,
+        request: Request[Any, Any, Any],
+        service: ServiceT,
+        query: dict[str, Any],
+        body: bytes,
+        call_args: CallArgs | None = None,
+    ) -> tuple[str | None, Generator[bytes, None, None] | None]:
+        """Returns the entity tag of the streamed result and a generator
+        producing its frames. The generator is `None` if the client
+        already holds the current result."""
+
+        streaming = self.get_streaming_params(query)
+        args, kwargs = call_args or self.build_request_call_args(request, query, body)
+        use_arrow = self.accepts_arrow(request)
+
+        etag = None
+        if self.supports_result_cache:
+            etag = self.get_etag(
+                self.get_result_cache_key(
+                    service, query, args, kwargs, use_arrow, streaming=streaming
+                )
+            )
+        if self.is_not_modified(request, etag):
+            self.check_permissions(service, args, kwargs)
+            return etag, None
+
+        bound_func = self.procedure.get_authorized_callable(
+            service,
+            functools.partial(
+                self.procedure.streaming.streamed_func, service, streaming
+            ),
+        )
+        # authorization and argument errors are raised before streaming starts
+        batches = bound_func(*args, **kwargs)
+        return etag, self.iter_stream_frames(service, batches, use_arrow)
+
+    def iter_stream_frames(
+        self, service: ServiceT, batches: Iterator[pd.DataFrame], use_arrow: bool
+    ) -> Generator[bytes, None, None]:
+        try:
+            for df in batches:
+                yield self.encode_dataframe_frame(df, use_arrow)
+            yield encode_frame(END_FRAME)
+        except Exception as e:
+            # the status code has already been sent,
+            # errors are reported to the client in-band
+            yield self.encode_error_frame(e)
+        finally:
+            self.release_session(service)
+
+    async def iter_async_stream_frames(
+        self, async_session: AsyncSession, frames: Generator[bytes, None, None]
+    ) -> AsyncIterator[bytes]:
+        try:
+            while (
+                frame := await async_session.run_sync(lambda _: next(frames, None))
+            ) is not None:
+                yield frame
+        finally:
+            # releases the session if the client disconnected early
+            await async_session.run_sync(lambda _: frames.close())
+
+    def encode_dataframe_frame(self, df: pd.DataFrame, use_arrow: bool) -> bytes:
+        if use_arrow:
+            arrow_bytes = serialize_df_arrow(df)
+            if arrow_bytes is not None:
+                return encode_frame(ARROW_FRAME, arrow_bytes)
+        return encode_frame(JSON_FRAME, dataframe_adapter.dump_json(df))
+
+    def encode_error_frame(self, exc: Exception) -> bytes:
+        exc_dict = None
+        if isinstance(exc, ServiceException):
+            try:
+                exc_dict = registry.exception_to_response_dict(exc)
+            except ExceptionNotFound:
+                pass
+
+        if exc_dict is None:
+            logger.exception("Unexpected exception while streaming results.")
+            exc_dict = registry.exception_to_response_dict(
+                ServerError("Unexpected error while streaming results.")
+            )
+        return encode_frame(ERROR_FRAME, json.dumps(exc_dict, default=str).encode())
+
+    def release_session(self, service: ServiceT) -> None:
+        # litestar cleans up dependencies before the response body is sent,
+        # so the connection re-opened by the stream has to be released here
+        if isinstance(service.transport, DirectTransport):
+            service.transport.session.rollback()
+            service.transport.session.close()
+
+    def returns_dataframe(self) -> bool:
+        annotation = self.procedure.signature.return_annotation
+        return get_origin(annotation) is Annotated and (
+            get_args(annotation)[0] is pd.DataFrame
+        )
+
+    def accepts_arrow(self, request: Request[Any, Any, Any]) -> bool:
+        if ARROW_STREAM_MEDIA_TYPE not in get_wire_formats():
+            return False
+
+        # json comes first so clients without preference receive json
+        best_match = request.accept.best_match(
+            [JSON_MEDIA_TYPE, ARROW_STREAM_MEDIA_TYPE]
+        )
+        return best_match == ARROW_STREAM_MEDIA_TYPE
+
+    def accepts_stream(self, request: Request[Any, Any, Any]) -> bool:
+        if not self.procedure.streaming.has_streaming:
+            return False
+
+        best_match = request.accept.best_match(
+            [JSON_MEDIA_TYPE, DATAFRAME_STREAM_MEDIA_TYPE]
+        )
+        return best_match == DATAFRAME_STREAM_MEDIA_TYPE
+
+    def serialize_arrow_result(self, result: Any) -> bytes | None:
+        if isinstance(result, pd.DataFrame):
+            return serialize_df_arrow(result)
+        if isinstance(result, PaginatedResult) and isinstance(
+            result.results, pd.DataFrame
+        ):
+            return serialize_df_arrow(
+                result.results,
+                metadata={
+                    "total": result.total,
+                    "pagination": result.pagination.model_dump(mode="json"),
+                },
+            )
+        return None
+
+    def build_request_call_args(
+        self, request: Request[Any, Any, Any], query: dict[str, Any], body: bytes
+    ) -> CallArgs:
+        return self.build_call_args(
+            request.path_params,
+            query,
+            body,
+            content_type=request.headers.get("content-type"),
+        )
 
     def build_call_args(
         self,
@@ -200,11 +659,14 @@ class ProcedureRouteHandler(HTTPRouteHandler, Generic[ServiceT, Params, ReturnT]
         query: dict[str, Any],
         body: bytes,
         varargs_key: str = "__varargs__",
-    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        content_type: str | None = None,
+    ) -> CallArgs:
         try:
             path_params = self.path_model.model_validate(path)
             if self.supports_body:
-                if len(body) > 0:
+                if content_type == ARROW_STREAM_MEDIA_TYPE:
+                    payload = self.parse_arrow_payload(body)
+                elif len(body) > 0:
                     payload = self.payload_model.model_validate_json(body)
                 else:
                     payload = self.payload_model()
@@ -222,10 +684,47 @@ class ProcedureRouteHandler(HTTPRouteHandler, Generic[ServiceT, Params, ReturnT]
         )
         return bound_params.args, bound_params.kwargs
 
+    def parse_arrow_payload(self, body: bytes) -> pyd.BaseModel:
+        if self.dataframe_payload_field is None:
+            raise InvalidArguments(
+                "This endpoint does not accept arrow payloads, use json instead."
+            )
+
+        try:
+            df, _ = parse_df_arrow(body)
+        except ValueError as e:
+            raise InvalidArguments(str(e))
+
+        return self.payload_model.model_validate({self.dataframe_payload_field: df})
+
     def get_pagination_params(self, query_params: dict[str, Any]) -> Pagination:
         pagination = Pagination.model_validate(query_params, extra="ignore")
         return pagination
 
+    def apply_pagination_cursor(
+        self, pagination: Pagination, kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Restricts the results of a keyset paginated request to rows
+        with an id greater than `pagination.after`."""
+
+        if pagination.after is None:
+            return kwargs
+
+        if not self.supports_keyset_pagination:
+            raise InvalidArguments(
+                "This endpoint does not support keyset pagination, "
+                "use `offset` instead."
+            )
+
+        after = max(pagination.after, kwargs.get("id__gt", pagination.after))
+        return {**kwargs, "id__gt": after}
+
+    def get_streaming_params(self, query_params: dict[str, Any]) -> Streaming:
+        try:
+            return Streaming.model_validate(query_params, extra="ignore")
+        except pyd.ValidationError as e:
+            raise InvalidArguments(validation_error=e)
+
     def bind_endpoint_func(
         self, service: ServiceT, query_params: dict[str, Any]
     ) -> Callable[Params, Any]:
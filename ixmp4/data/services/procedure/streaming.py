@@ -0,0 +1,209 @@
+import inspect
+import struct
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    ParamSpec,
+    Protocol,
+    TypeVar,
+    cast,
+    get_args,
+    get_origin,
+)
+
+import pandas as pd
+import pydantic as pyd
+
+from ixmp4.base_exceptions import ProgrammingError
+from ixmp4.data.dataframe import SerializableDataFrame
+from ixmp4.data.pagination import Streaming
+from ixmp4.transport import DirectTransport, HttpxTransport
+
+if TYPE_CHECKING:
+    from ..base import Service
+    from . import Procedure
+
+Params = ParamSpec("Params")
+ServiceT = TypeVar("ServiceT", bound="Service")
+ContraServiceT = TypeVar("ContraServiceT", bound="Service", contravariant=True)
+
+DATAFRAME_STREAM_MEDIA_TYPE = "application/vnd.ixmp4.dataframe-stream"
+
+# every frame starts with a one byte kind and the payload length
+FRAME_HEADER = struct.Struct(">cQ")
+ARROW_FRAME = b"A"
+JSON_FRAME = b"J"
+ERROR_FRAME = b"E"
+END_FRAME = b"Z"
+
+dataframe_adapter: pyd.TypeAdapter[pd.DataFrame] = pyd.TypeAdapter(
+    SerializableDataFrame
+)
+
+
+def encode_frame(kind: bytes, payload: bytes = b"") -> bytes:
+    return FRAME_HEADER.pack(kind, len(payload)) + payload
+
+
+def iter_frames(chunks: Iterable[bytes]) -> Iterator[tuple[bytes, bytes]]:
+    """Splits a stream of raw bytes into `(kind, payload)` frames.
+    Raises `ValueError` if the stream ends in the middle of a frame."""
+
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= FRAME_HEADER.size:
+            kind, length = FRAME_HEADER.unpack_from(buffer)
+            end = FRAME_HEADER.size + length
+            if len(buffer) < end:
+                break
+            yield kind, bytes(buffer[FRAME_HEADER.size : end])
+            del buffer[:end]
+
+    if buffer:
+        raise ValueError("Dataframe stream ended with an incomplete frame.")
+
+
+class ProcedureStreamedFunc(Protocol[ContraServiceT, Params]):
+    __name__: str
+
+    def __call__(
+        self,
+        svc: ContraServiceT,
+        streaming: Streaming,
+        /,
+        *args: Params.args,
+        **kwds: Params.kwargs,
+    ) -> Iterator[pd.DataFrame]: ...
+
+
+class BoundProcedureStreamedFunc(Protocol[Params]):
+    __name__: str
+
+    def __call__(
+        self,
+        streaming: Streaming,
+        /,
+        *args: Params.args,
+        **kwds: Params.kwargs,
+    ) -> Iterator[pd.DataFrame]: ...
+
+
+class ProcedureStreaming(Generic[ServiceT, Params]):
+    """Descriptor for marking a procedure as streamable.
+
+    Use as a decorator on a service method yielding batches of the
+    dataframe the procedure returns. Http clients receive the batches
+    as they are fetched from the database instead of requesting
+    one page after the other.
+
+    To iterate over the batches instead of receiving the concatenated
+    dataframe, bind the procedure to a service instance:
+
+    .. code:: python
+
+        iter_batches = ExampleService.tabulate.streamed.bind(
+            svc, Streaming(batch_size=1000)
+        )
+        for df in iter_batches(name="example"):
+            ...
+    """
+
+    streamed_func: ProcedureStreamedFunc[ServiceT, Params]
+    procedure: "Procedure[ServiceT, Params, Any]"
+    has_streaming: bool
+
+    def __init__(self, procedure: "Procedure[ServiceT, Params, Any]"):
+        self.procedure = procedure
+        self.has_streaming = False
+
+    def __call__(
+        self,
+    ) -> Callable[
+        [ProcedureStreamedFunc[ServiceT, Params]],
+        BoundProcedureStreamedFunc[Params],
+    ]:
+        return self.decorator
+
+    def decorator(
+        self, func: ProcedureStreamedFunc[ServiceT, Params]
+    ) -> BoundProcedureStreamedFunc[Params]:
+        self.validate_return_annotation(func)
+        self.signature = self.validate_signature(func)
+        self.streamed_func = func
+        self.has_streaming = True
+
+        return cast(BoundProcedureStreamedFunc[Params], func)
+
+    def bind(
+        self, service: ServiceT, streaming: Streaming
+    ) -> Callable[Params, Iterator[pd.DataFrame]]:
+        """Returns a callable taking the arguments of the procedure and
+        returning an iterator over the result batches. Direct transports
+        read the batches from a server-side cursor, http transports
+        receive them over a single streamed response."""
+
+        if not self.has_streaming:
+            raise ProgrammingError(
+                f"Procedure `{self.procedure.func.__name__}` is not streamed."
+            )
+
+        if isinstance(service.transport, DirectTransport):
+            return self.procedure.get_direct_streamed_callable(service, streaming)
+        elif isinstance(service.transport, HttpxTransport):
+            return self.procedure.get_httpx_streamed_callable(service, streaming)
+        else:
+            raise ProgrammingError(
+                f"Transport class `{service.transport.__class__.__name__}` "
+                "is not supported."
+            )
+
+    def validate_return_annotation(self, func: Callable[..., Any]) -> None:
+        annotation = self.procedure.signature.return_annotation
+        if not (
+            get_origin(annotation) is Annotated
+            and get_args(annotation)[0] is pd.DataFrame
+        ):
+            raise ProgrammingError(
+                f"Cannot stream results of `{self.procedure.func.__name__}` "
+                f"with `{func.__name__}`, only dataframes can be streamed."
+            )
+
+    def validate_signature(self, func: Callable[..., Any]) -> inspect.Signature:
+        org_sig = inspect.signature(func)
+        valid_params = []
+        param_dict = org_sig.parameters.items()
+
+        for index, (name, param) in enumerate(param_dict):
+            if self.validate_parameter(index, name, param, func):
+                valid_params.append(param)
+
+        return inspect.Signature(
+            valid_params, return_annotation=org_sig.return_annotation
+        )
+
+    def validate_parameter(
+        self, index: int, name: str, param: inspect.Parameter, func: Callable[..., Any]
+    ) -> bool:
+        if name == "self":
+            return False  # skip self parameter as it will not be bound yet
+
+        if index == 1:
+            if param.annotation is not Streaming:
+                raise ProgrammingError(
+                    f"Unexpected positional-only argument '{name}' with annotation "
+                    f"`{param.annotation}` in function definiton for `{func.__name__}`,"
+                    f" expected argument of type `Streaming`."
+                )
+
+        if index > 1:
+            self.procedure.validate_corresponding_parameter(
+                index - 2, name, param, func
+            )
+
+        return True
@@ -5,46 +5,83 @@ from sqlalchemy.sql import ColumnCollection, ColumnElement
 
 from .model import Operation
 
+GROUP_TRANSACTIONS_SETTING = "ixmp4.group_version_transactions"
+"""Name of the PostgreSQL setting which makes the version triggers record
+all changes of one database transaction under a single transaction id
+when it is ``on``."""
+TRANSACTION_ID_SETTING = "ixmp4.version_transaction_id"
+"""Name of the transaction-local PostgreSQL setting holding the
+transaction id reused by grouped version triggers."""
+
 
 class VersionProcedure(object):
     signature_template = "%(tablename)s_version_procedure()"
     definition_template = """
     returns trigger as $$
-        declare tx_id INT;
+        declare tx_id BIGINT;
+        declare group_tx BOOLEAN;
     begin
-        begin
+        group_tx := coalesce(
+            current_setting('%(group_setting)s', true), ''
+        ) = 'on';
+        if group_tx then
+            tx_id := nullif(
+                current_setting('%(tx_id_setting)s', true), ''
+            )::BIGINT;
+        end if;
+
+        if tx_id is NULL then
             insert into %(transaction_tablename)s (issued_at)
             values (NOW()) returning id into tx_id;
-        end;
+
+            if group_tx then
+                perform set_config('%(tx_id_setting)s', tx_id::text, true);
+            end if;
+        end if;
 
         if (TG_OP='DELETE') then
             update %(version_tablename)s set %(end_transaction_id_column)s = tx_id
             where id in (select id from OLD_TABLE)
-            and %(end_transaction_id_column)s is NULL;
+            and %(end_transaction_id_column)s is NULL
+            and %(transaction_id_column)s <> tx_id;
 
-            insert into %(version_tablename)s (%(versioned_column_names)s,
+            insert into %(version_tablename)s as v (%(versioned_column_names)s,
             %(transaction_id_column)s, operation_type)
             select %(versioned_column_names)s, tx_id, %(op_delete)s
-            from OLD_TABLE;
+            from OLD_TABLE
+            %(on_conflict)s;
         elsif (TG_OP='UPDATE') then
             update %(version_tablename)s set %(end_transaction_id_column)s = tx_id
             where id in (select id from NEW_TABLE)
-            and %(end_transaction_id_column)s is NULL;
+            and %(end_transaction_id_column)s is NULL
+            and %(transaction_id_column)s <> tx_id;
 
-            insert into %(version_tablename)s (%(versioned_column_names)s,
+            insert into %(version_tablename)s as v (%(versioned_column_names)s,
             %(transaction_id_column)s, operation_type)
             select %(versioned_column_names)s, tx_id, %(op_update)s
-            from NEW_TABLE;
+            from NEW_TABLE
+            %(on_conflict)s;
         elsif (TG_OP='INSERT') then
-            insert into %(version_tablename)s (%(versioned_column_names)s,
+            insert into %(version_tablename)s as v (%(versioned_column_names)s,
             %(transaction_id_column)s, operation_type)
             select %(versioned_column_names)s, tx_id, %(op_insert)s
-            from NEW_TABLE;
+            from NEW_TABLE
+            %(on_conflict)s;
         end if;
         return null;
     end
     $$ language plpgsql;
     """
+    # Rows changed more than once within one grouped transaction
+    # keep a single version, which is created by the first change
+    # and updated by the following ones.
+    on_conflict_template = """on conflict (%(version_pk_column_names)s) do update set
+            %(update_assignments)s,
+            operation_type = case
+                when excluded.operation_type = %(op_delete)s then %(op_delete)s
+                when v.operation_type = %(op_insert)s then %(op_insert)s
+                else %(op_update)s
+            end"""
     definition_context: dict[str, Any]
     signature_context: dict[str, Any]
     definition: str
@@ -64,6 +101,12 @@ class VersionProcedure(object):
         transaction_tablename = transaction_table.name
 
         versioned_column_names = ", ".join(versioned_columns.keys())
+        version_pk_column_names = ", ".join(version_table.primary_key.columns.keys())
+        update_assignments = ",\n            ".join(
+            f"{key} = excluded.{key}"
+            for key in versioned_columns.keys()
+            if key not in version_table.primary_key.columns
+        )
 
         transaction_id_column = getattr(
             transaction_id_column, "description", transaction_id_column
@@ -81,6 +124,13 @@ class VersionProcedure(object):
             "op_delete": str(Operation.DELETE.value),
             "op_update": str(Operation.UPDATE.value),
             "op_insert": str(Operation.INSERT.value),
+            "group_setting": GROUP_TRANSACTIONS_SETTING,
+            "tx_id_setting": TRANSACTION_ID_SETTING,
+        }
+        self.definition_context["on_conflict"] = self.on_conflict_template % {
+            **self.definition_context,
+            "version_pk_column_names": version_pk_column_names,
+            "update_assignments": update_assignments,
         }
         self.signature_context = {"tablename": tablename}
         self.signature = self.signature_template % self.signature_context
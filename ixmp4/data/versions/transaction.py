@@ -43,3 +43,21 @@ class TransactionRepository(ItemRepository[Transaction]):
             result = self.create({"id": 1, "issued_at": datetime.now(tz=timezone.utc)})
             assert result.inserted_primary_key is not None
             return self.get_by_pk({"id": result.inserted_primary_key.id})
+
+    def get_commit_state(self) -> list[int]:
+        """Returns the id of the latest transaction followed by the ids of the
+        database transactions in progress. Only supported by PostgreSQL.
+
+        Transaction ids are drawn when a transaction starts but only become
+        visible once it commits, so the latest id alone does not change if a
+        transaction with an earlier id commits. Such a transaction is in
+        progress until then, so the state changes on every commit."""
+
+        in_progress = sa.func.pg_snapshot_xip(sa.func.pg_current_snapshot())
+        exc = sa.select(sa.cast(sa.cast(in_progress, sa.Text), sa.BigInteger))
+        with self.executor.select(exc) as result:
+            xids = sorted(result.scalars())
+
+        exc_max = sa.select(sa.func.coalesce(sa.func.max(Transaction.id), 0))
+        with self.executor.select(exc_max) as result:
+            return [result.scalar_one(), *xids]
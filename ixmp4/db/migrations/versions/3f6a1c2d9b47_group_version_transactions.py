@@ -0,0 +1,80 @@
+# type: ignore
+"""Let version triggers group the changes of one database transaction
+
+Revision ID: 3f6a1c2d9b47
+Revises: 87987b875e9b
+Create Date: 2026-10-17 10:12:31.402518
+
+"""
+
+import logging
+
+import sqlalchemy as sa
+from alembic import op
+
+from ixmp4.data.versions import PostgresVersionTriggers
+
+# Revision identifiers, used by Alembic.
+revision = "3f6a1c2d9b47"
+down_revision = "87987b875e9b"
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger(__name__)
+
+versioned_tablenames = [
+    "model",
+    "scenario",
+    "region",
+    "unit",
+    "run",
+    "runmetaentry",
+    "iamc_variable",
+    "iamc_measurand",
+    "iamc_timeseries",
+    "iamc_datapoint_universal",
+    "opt_idx",
+    "opt_idx_data",
+    "opt_sca",
+    "opt_tab",
+    "opt_tab_idx_association",
+    "opt_par",
+    "opt_par_idx_association",
+    "opt_equ",
+    "opt_equ_idx_association",
+    "opt_var",
+    "opt_var_idx_association",
+]
+
+
+def _sync_version_triggers() -> None:
+    conn = op.get_bind()
+    if conn is None:
+        logger.warning("Cannot sync version triggers without database connection.")
+        return
+
+    dialect_name = conn.dialect.name
+    if dialect_name != "postgresql":
+        logger.info(
+            f"Skipping version trigger sync for database dialect '{dialect_name}'."
+        )
+        return
+
+    metadata = sa.MetaData()
+    transaction_table = sa.Table("transaction", metadata, autoload_with=conn)
+    for tablename in versioned_tablenames:
+        data_table = sa.Table(tablename, metadata, autoload_with=conn)
+        version_table = sa.Table(f"{tablename}_version", metadata, autoload_with=conn)
+        PostgresVersionTriggers(
+            data_table, version_table, transaction_table
+        ).sync_entities(conn)
+
+
+def upgrade():
+    _sync_version_triggers()
+
+
+def downgrade():
+    # The grouping is only active if `ixmp4.group_version_transactions` is set,
+    # the triggers otherwise behave like the previous ones.
+    pass
@@ -0,0 +1,428 @@
+# type: ignore
+"""Store optimization item data as rows instead of one JSON document
+
+Revision ID: 5c0e8d7a41f3
+Revises: 3f6a1c2d9b47
+Create Date: 2026-10-17 14:03:52.118274
+
+"""
+
+import itertools
+import json
+import logging
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+from ixmp4.data.versions import Operation, PostgresVersionTriggers
+
+# Revision identifiers, used by Alembic.
+revision = "5c0e8d7a41f3"
+down_revision = "3f6a1c2d9b47"
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger(__name__)
+
+json_type = sa.JSON().with_variant(
+    postgresql.JSONB(astext_type=sa.Text()), "postgresql"
+)
+
+# (item table, item id column of the association and data tables)
+indexed_items = [
+    ("opt_tab", "table__id"),
+    ("opt_par", "parameter__id"),
+    ("opt_equ", "equation__id"),
+    ("opt_var", "variable__id"),
+]
+
+pytypes = {"INT": int, "FLOAT": float, "STR": str}
+
+
+def version_index_columns(item_id: str) -> list[str]:
+    return ["end_transaction_id", item_id, "operation_type", "transaction_id"]
+
+
+def _create_data_tables(tablename: str, item_id: str) -> None:
+    op.create_table(
+        f"{tablename}_data",
+        sa.Column(item_id, sa.Integer(), nullable=False),
+        sa.Column("key", sa.Text(), nullable=False),
+        sa.Column("record", json_type, nullable=False),
+        sa.Column(
+            "id",
+            sa.Integer(),
+            sa.Identity(always=False, on_null=True, start=1, increment=1),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            [item_id],
+            [f"{tablename}.id"],
+            name=op.f(f"fk_{tablename}_data_{item_id}_{tablename}"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f(f"pk_{tablename}_data")),
+        sa.UniqueConstraint(
+            item_id, "key", name=op.f(f"uq_{tablename}_data_{item_id}_key")
+        ),
+    )
+    with op.batch_alter_table(f"{tablename}_data", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f(f"ix_{tablename}_data_{item_id}"), [item_id], unique=False
+        )
+
+    op.create_table(
+        f"{tablename}_data_version",
+        sa.Column(item_id, sa.Integer(), nullable=False),
+        sa.Column("key", sa.Text(), nullable=False),
+        sa.Column("record", json_type, nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("transaction_id", sa.BigInteger(), nullable=False),
+        sa.Column("operation_type", sa.SmallInteger(), nullable=False),
+        sa.Column("end_transaction_id", sa.BigInteger(), nullable=True),
+        sa.PrimaryKeyConstraint(
+            "id", "transaction_id", name=op.f(f"pk_{tablename}_data_version")
+        ),
+    )
+    with op.batch_alter_table(f"{tablename}_data_version", schema=None) as batch_op:
+        for column in version_index_columns(item_id):
+            batch_op.create_index(
+                batch_op.f(f"ix_{tablename}_data_version_{column}"),
+                [column],
+                unique=False,
+            )
+
+
+def _drop_data_tables(tablename: str, item_id: str) -> None:
+    with op.batch_alter_table(f"{tablename}_data_version", schema=None) as batch_op:
+        for column in version_index_columns(item_id):
+            batch_op.drop_index(batch_op.f(f"ix_{tablename}_data_version_{column}"))
+
+    op.drop_table(f"{tablename}_data_version")
+
+    with op.batch_alter_table(f"{tablename}_data", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f(f"ix_{tablename}_data_{item_id}"))
+
+    op.drop_table(f"{tablename}_data")
+
+
+def _version_triggers(conn: sa.Connection, tablename: str) -> PostgresVersionTriggers:
+    metadata = sa.MetaData()
+    transaction_table = sa.Table("transaction", metadata, autoload_with=conn)
+    data_table = sa.Table(tablename, metadata, autoload_with=conn)
+    version_table = sa.Table(f"{tablename}_version", metadata, autoload_with=conn)
+    return PostgresVersionTriggers(data_table, version_table, transaction_table)
+
+
+def _index_columns(conn: sa.Connection, tablename: str, item_id: str):
+    """Returns the index column names and indexset types of each item, including
+    items that only remain in the version tables."""
+    associations = {}
+    # Live rows are read last, so they take precedence over their versions.
+    for name in [
+        f"{tablename}_idx_association_version",
+        f"{tablename}_idx_association",
+    ]:
+        association = sa.table(
+            name,
+            sa.column(item_id, sa.Integer()),
+            sa.column("indexset__id", sa.Integer()),
+            sa.column("column_name", sa.String()),
+            sa.column("id", sa.Integer()),
+        )
+        for row in conn.execute(sa.select(association)):
+            associations[row.id] = row
+
+    indexsets = {}
+    for name in ["opt_idx_version", "opt_idx"]:
+        indexset = sa.table(
+            name,
+            sa.column("id", sa.Integer()),
+            sa.column("name", sa.String()),
+            sa.column("data_type", sa.String()),
+        )
+        for row in conn.execute(sa.select(indexset)):
+            indexsets[row.id] = row
+
+    columns: dict[int, list[tuple[str, type | None]]] = {}
+    for id in sorted(associations):
+        row = associations[id]
+        indexset = indexsets[row.indexset__id]
+        columns.setdefault(row[0], []).append(
+            (row.column_name or indexset.name, pytypes.get(indexset.data_type))
+        )
+    return columns
+
+
+def _normalize(value, pytype):
+    if pytype is not None:
+        try:
+            return pytype(value)
+        except (TypeError, ValueError):
+            pass
+    return value
+
+
+def _document_to_rows(data, columns) -> dict[str, dict]:
+    """Splits a JSON data document into records by the key of their row."""
+    if not data:
+        return {}
+    names = [name for name, _ in columns]
+    length = len(next(iter(data.values())))
+    rows = {}
+    for i in range(length):
+        if columns:
+            key = [_normalize(data[name][i], pytype) for name, pytype in columns]
+        else:
+            key = [i]
+        rows[json.dumps(key)] = {k: v[i] for k, v in data.items() if k not in names}
+    return rows
+
+
+def _rows_to_document(rows, names: list[str]) -> dict[str, list]:
+    """Joins `(key, record)` pairs to a JSON data document."""
+    data: dict[str, list] = {}
+    for key, record in rows:
+        for name, value in zip(names, json.loads(key)):
+            data.setdefault(name, []).append(value)
+        for name, value in record.items():
+            data.setdefault(name, []).append(value)
+    return data
+
+
+def _item_version_table(tablename: str) -> sa.TableClause:
+    return sa.table(
+        f"{tablename}_version",
+        sa.column("id", sa.Integer()),
+        sa.column("data", json_type),
+        sa.column("transaction_id", sa.BigInteger()),
+        sa.column("end_transaction_id", sa.BigInteger()),
+        sa.column("operation_type", sa.SmallInteger()),
+    )
+
+
+def _data_version_table(tablename: str, item_id: str) -> sa.TableClause:
+    return sa.table(
+        f"{tablename}_data_version",
+        sa.column(item_id, sa.Integer()),
+        sa.column("key", sa.Text()),
+        sa.column("record", json_type),
+        sa.column("id", sa.Integer()),
+        sa.column("transaction_id", sa.BigInteger()),
+        sa.column("end_transaction_id", sa.BigInteger()),
+        sa.column("operation_type", sa.SmallInteger()),
+    )
+
+
+def _snapshots_to_versions(tablename: str, item_id: str, index_columns):
+    """Replays the data snapshots of the item versions as versions of data rows,
+    the way the version triggers record them. Returns the ids of the rows of each
+    item's latest version by key and the last id used."""
+    conn = op.get_bind()
+    item_version_table = _item_version_table(tablename)
+    data_version_table = _data_version_table(tablename, item_id)
+    exc = sa.select(item_version_table).order_by(
+        item_version_table.c.id, item_version_table.c.transaction_id
+    )
+
+    last_id = 0
+    current_ids: dict[int, dict[str, int]] = {}
+    for id, item_versions in itertools.groupby(conn.execute(exc), lambda v: v.id):
+        columns = index_columns.get(id, [])
+        open_versions: dict[str, dict] = {}
+        data_versions: list[dict] = []
+        for item_version in item_versions:
+            tx_id = item_version.transaction_id
+            rows = (
+                {}
+                if item_version.operation_type == Operation.DELETE.value
+                else _document_to_rows(item_version.data, columns)
+            )
+            for key in [key for key in open_versions if key not in rows]:
+                deleted = open_versions.pop(key)
+                deleted["end_transaction_id"] = tx_id
+                data_versions.append(
+                    {
+                        **deleted,
+                        "transaction_id": tx_id,
+                        "end_transaction_id": None,
+                        "operation_type": Operation.DELETE.value,
+                    }
+                )
+            for key, record in rows.items():
+                previous = open_versions.get(key)
+                if previous is None:
+                    last_id += 1
+                    row_id, operation = last_id, Operation.INSERT.value
+                elif previous["record"] != record:
+                    previous["end_transaction_id"] = tx_id
+                    row_id, operation = previous["id"], Operation.UPDATE.value
+                else:
+                    continue
+                open_versions[key] = {
+                    item_id: id,
+                    "key": key,
+                    "record": record,
+                    "id": row_id,
+                    "transaction_id": tx_id,
+                    "end_transaction_id": None,
+                    "operation_type": operation,
+                }
+                data_versions.append(open_versions[key])
+
+        if data_versions:
+            conn.execute(sa.insert(data_version_table), data_versions)
+        current_ids[id] = {key: version["id"] for key, version in open_versions.items()}
+    return current_ids, last_id
+
+
+def _data_to_rows(tablename: str, item_id: str) -> None:
+    conn = op.get_bind()
+    item_table = sa.table(
+        tablename, sa.column("id", sa.Integer()), sa.column("data", json_type)
+    )
+    data_table = sa.table(
+        f"{tablename}_data",
+        sa.column(item_id, sa.Integer()),
+        sa.column("key", sa.Text()),
+        sa.column("record", json_type),
+        sa.column("id", sa.Integer()),
+    )
+    index_columns = _index_columns(conn, tablename, item_id)
+    current_ids, last_id = _snapshots_to_versions(tablename, item_id, index_columns)
+
+    # Rows keep the id of their version, so they are inserted before the version
+    # triggers of the data table are created.
+    for id, data in conn.execute(sa.select(item_table.c.id, item_table.c.data)):
+        ids = current_ids.get(id, {})
+        rows = []
+        for key, record in _document_to_rows(data, index_columns.get(id, [])).items():
+            row_id = ids.get(key)
+            if row_id is None:
+                last_id += 1
+                row_id = last_id
+            rows.append({item_id: id, "key": key, "record": record, "id": row_id})
+        if rows:
+            conn.execute(sa.insert(data_table), rows)
+
+    if conn.dialect.name == "postgresql" and last_id > 0:
+        conn.execute(
+            sa.select(
+                sa.func.setval(
+                    sa.func.pg_get_serial_sequence(f"{tablename}_data", "id"), last_id
+                )
+            )
+        )
+
+
+def _versions_to_snapshots(tablename: str, item_id: str, index_columns) -> None:
+    """Writes the data valid at each item version into its snapshot."""
+    conn = op.get_bind()
+    item_version_table = _item_version_table(tablename)
+    data_version_table = _data_version_table(tablename, item_id)
+    item_versions = conn.execute(
+        sa.select(
+            item_version_table.c.id,
+            item_version_table.c.transaction_id,
+            item_version_table.c.operation_type,
+        )
+    ).all()
+
+    for id, tx_id, operation_type in item_versions:
+        # deleted items keep the data they had before
+        valid_tx_id = tx_id - 1 if operation_type == Operation.DELETE.value else tx_id
+        exc = (
+            sa.select(data_version_table.c.key, data_version_table.c.record)
+            .where(
+                data_version_table.c[item_id] == id,
+                data_version_table.c.transaction_id <= valid_tx_id,
+                data_version_table.c.operation_type != Operation.DELETE.value,
+                sa.or_(
+                    data_version_table.c.end_transaction_id > valid_tx_id,
+                    data_version_table.c.end_transaction_id == sa.null(),
+                ),
+            )
+            .order_by(data_version_table.c.id)
+        )
+        names = [name for name, _ in index_columns.get(id, [])]
+        data = _rows_to_document(conn.execute(exc), names)
+        conn.execute(
+            sa.update(item_version_table)
+            .where(
+                item_version_table.c.id == id,
+                item_version_table.c.transaction_id == tx_id,
+            )
+            .values(data=data)
+        )
+
+
+def _rows_to_data(tablename: str, item_id: str) -> None:
+    conn = op.get_bind()
+    item_table = sa.table(
+        tablename, sa.column("id", sa.Integer()), sa.column("data", json_type)
+    )
+    data_table = sa.table(
+        f"{tablename}_data",
+        sa.column(item_id, sa.Integer()),
+        sa.column("key", sa.Text()),
+        sa.column("record", json_type),
+        sa.column("id", sa.Integer()),
+    )
+    index_columns = _index_columns(conn, tablename, item_id)
+    _versions_to_snapshots(tablename, item_id, index_columns)
+
+    exc = sa.select(
+        data_table.c[item_id], data_table.c.key, data_table.c.record
+    ).order_by(data_table.c[item_id], data_table.c.id)
+    for id, rows in itertools.groupby(conn.execute(exc), lambda row: row[0]):
+        names = [name for name, _ in index_columns.get(id, [])]
+        data = _rows_to_document(((key, record) for _, key, record in rows), names)
+        conn.execute(
+            sa.update(item_table).where(item_table.c.id == id).values(data=data)
+        )
+
+
+def upgrade():
+    conn = op.get_bind()
+    is_postgres = conn.dialect.name == "postgresql"
+
+    for tablename, item_id in indexed_items:
+        _create_data_tables(tablename, item_id)
+        _data_to_rows(tablename, item_id)
+        if is_postgres:
+            _version_triggers(conn, f"{tablename}_data").create_entities(conn)
+
+        for table in [tablename, f"{tablename}_version"]:
+            # Dropping the column in place keeps sqlite from recreating the
+            # table, which would cascade to the item's associations.
+            with op.batch_alter_table(table, recreate="never") as batch_op:
+                batch_op.drop_column("data")
+
+        if is_postgres:
+            _version_triggers(conn, tablename).sync_entities(conn)
+
+
+def downgrade():
+    conn = op.get_bind()
+    is_postgres = conn.dialect.name == "postgresql"
+
+    for tablename, item_id in indexed_items:
+        for table in [tablename, f"{tablename}_version"]:
+            # The server default is kept, sqlite can only alter it by recreating
+            # the table.
+            with op.batch_alter_table(table, recreate="never") as batch_op:
+                batch_op.add_column(
+                    sa.Column("data", json_type, nullable=False, server_default="{}")
+                )
+
+        # Restoring the data must not create new item versions.
+        if is_postgres:
+            _version_triggers(conn, tablename).drop_entities(conn)
+        _rows_to_data(tablename, item_id)
+        if is_postgres:
+            _version_triggers(conn, tablename).create_entities(conn)
+
+        if is_postgres:
+            _version_triggers(conn, f"{tablename}_data").drop_entities(conn)
+        _drop_data_tables(tablename, item_id)
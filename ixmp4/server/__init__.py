@@ -31,6 +31,8 @@ from ixmp4.core.exceptions import (
     ServiceException,
     registry,
 )
+from ixmp4.data.services.procedure.cache import ResultCacheMetrics
+from ixmp4.transport import PoolMetrics, get_cached_engines_pool_metrics
 
 if TYPE_CHECKING:
     from ixmp4.transport import DirectTransport
@@ -50,6 +52,8 @@ cors_config = CORSConfig(
 class ServerStatus(pyd.BaseModel):
     utcnow: datetime
     manager_url: pyd.HttpUrl | None
+    database_pool: PoolMetrics
+    result_cache: ResultCacheMetrics | None
 
 
 class ServerContoller(Controller):
@@ -59,6 +63,12 @@ class ServerContoller(Controller):
             ServerStatus(
                 utcnow=datetime.now(tz=timezone.utc),
                 manager_url=state.settings.manager_url,
+                database_pool=get_cached_engines_pool_metrics(),
+                result_cache=(
+                    state.result_cache.get_metrics()
+                    if getattr(state, "result_cache", None) is not None
+                    else None
+                ),
             )
         )
 
@@ -1,5 +1,5 @@
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from httpx import ConnectError
 from litestar.connection import ASGIConnection
@@ -10,15 +10,41 @@ from litestar.middleware.authentication import (
 from litestar.types import ASGIApp
 from pydantic import SecretStr
 from toolkit.auth import token
-from toolkit.auth.context import AuthorizationContext
+from toolkit.auth.context import AuthorizationContext, PlatformProtocol
+from toolkit.auth.user import User
 from toolkit.manager.client import ManagerClient
 
 from ixmp4.conf.settings import ServerSettings
 from ixmp4.core.exceptions import BadRequest, ServiceUnavailable, Unauthorized
 
+if TYPE_CHECKING:
+    import polars as pl
+
 logger = logging.getLogger(__name__)
 
 
+class RequestAuthorizationContext(AuthorizationContext):
+    """Authorization context of a single request.
+
+    The permissions of a platform are evaluated by every authorization check
+    and every repository a service instantiates, so they are tabulated only
+    once per platform and kept for the lifetime of the request."""
+
+    permissions: "dict[Any, pl.DataFrame]"
+
+    def __init__(self, user: User | None, manager_client: ManagerClient):
+        super().__init__(user, manager_client)
+        self.permissions = {}
+
+    def tabulate_permissions(self, platform: PlatformProtocol) -> "pl.DataFrame":
+        try:
+            return self.permissions[platform.id]
+        except KeyError:
+            df = super().tabulate_permissions(platform)
+            self.permissions[platform.id] = df
+            return df
+
+
 class AuthenticationMiddleware(AbstractAuthenticationMiddleware):
     auth_header: str = "Authorization"
     settings: ServerSettings
@@ -84,4 +110,4 @@ class AuthenticationMiddleware(AbstractAuthenticationMiddleware):
         if manager_client is None:
             return None
 
-        return AuthorizationContext(getattr(token, "user", None), manager_client)
+        return RequestAuthorizationContext(getattr(token, "user", None), manager_client)
@@ -16,6 +16,7 @@ from litestar.datastructures import State
 from litestar.di import Provide
 from litestar.middleware import DefineMiddleware
 from sqlalchemy import orm
+from sqlalchemy.ext import asyncio as sa_asyncio
 from toolkit.auth.context import AuthorizationContext, PlatformProtocol
 from toolkit.auth.user import User
 from toolkit.client.auth import SelfSignedAuth
@@ -26,7 +27,11 @@ from ixmp4.conf.platforms import (
     PlatformConnectionInfo,
     resolve_dsn_env_tokens,
 )
-from ixmp4.conf.settings import ServerSettings
+from ixmp4.conf.settings import (
+    DatabasePoolSettings,
+    DatabaseVersioningSettings,
+    ServerSettings,
+)
 from ixmp4.core.exceptions import (
     Forbidden,
     PlatformNotFound,
@@ -62,12 +67,16 @@ from ixmp4.data.optimization.variable.service import (
 from ixmp4.data.region.service import RegionService
 from ixmp4.data.run.service import RunService
 from ixmp4.data.scenario.service import ScenarioService
+from ixmp4.data.services.procedure.cache import ResultCache
 from ixmp4.data.unit.service import UnitService
 from ixmp4.transport import (
+    AsyncSession,
     AuthorizedTransport,
     DirectTransport,
     Session,
+    cached_create_async_engine,
     cached_create_engine,
+    get_pool_kwargs,
 )
 
 if TYPE_CHECKING:
@@ -104,8 +113,25 @@ v1_services: list[type["Service"]] = [
 
 
 @asynccontextmanager
-async def yield_session(dsn: str) -> AsyncIterator[orm.Session]:
-    engine = cached_create_engine(dsn)
+async def yield_session(
+    dsn: str,
+    pool_settings: DatabasePoolSettings | None = None,
+    versioning_settings: DatabaseVersioningSettings | None = None,
+) -> AsyncIterator[orm.Session]:
+    group_version_transactions = (
+        versioning_settings is not None and versioning_settings.group_transactions
+    )
+    # sqlite databases are cheap to connect to and not pooled
+    if pool_settings is not None and dsn.startswith("postgresql"):
+        engine = cached_create_engine(
+            dsn,
+            group_version_transactions=group_version_transactions,
+            **get_pool_kwargs(pool_settings),
+        )
+    else:
+        engine = cached_create_engine(
+            dsn, group_version_transactions=group_version_transactions
+        )
     try:
         session = Session(bind=engine)
         yield session
@@ -114,28 +140,86 @@ async def yield_session(dsn: str) -> AsyncIterator[orm.Session]:
         session.close()
 
 
+@asynccontextmanager
+async def yield_async_session(
+    dsn: str,
+    pool_settings: DatabasePoolSettings | None = None,
+    versioning_settings: DatabaseVersioningSettings | None = None,
+) -> AsyncIterator[sa_asyncio.AsyncSession]:
+    dsn = DirectTransport.check_dsn(dsn)
+    group_version_transactions = (
+        versioning_settings is not None and versioning_settings.group_transactions
+    )
+    if pool_settings is not None:
+        engine = cached_create_async_engine(
+            dsn,
+            group_version_transactions=group_version_transactions,
+            **get_pool_kwargs(pool_settings),
+        )
+    else:
+        engine = cached_create_async_engine(
+            dsn, group_version_transactions=group_version_transactions
+        )
+    try:
+        session = AsyncSession(bind=engine)
+        yield session
+    finally:
+        await session.rollback()
+        await session.close()
+
+
+def build_transport(
+    session: orm.Session,
+    platform: PlatformConnectionInfo,
+    request: Request[User | None, AuthorizationContext | None, Any],
+    async_session: sa_asyncio.AsyncSession | None = None,
+) -> DirectTransport:
+    if request.auth is not None:
+        # TODO: Remove the cast once scse-toolkit's PlatformProtocol
+        # is fixed/read only.
+        return AuthorizedTransport(
+            session,
+            request.auth,
+            cast(PlatformProtocol, platform),
+            check_alembic_version=False,
+            ping_database=False,
+            async_session=async_session,
+        )
+    else:
+        return DirectTransport(
+            session,
+            check_alembic_version=False,
+            ping_database=False,
+            async_session=async_session,
+        )
+
+
 async def get_transport(
     platform: PlatformConnectionInfo,
     request: Request[User | None, AuthorizationContext | None, Any],
+    state: State,
 ) -> AsyncGenerator[DirectTransport, None]:
     dsn = resolve_dsn_env_tokens(platform.dsn)
-    async with yield_session(dsn) as session:
-        if request.auth is not None:
-            # TODO: Remove the cast once scse-toolkit's PlatformProtocol
-            # is fixed/read only.
-            yield AuthorizedTransport(
-                session,
-                request.auth,
-                cast(PlatformProtocol, platform),
-                check_alembic_version=False,
-                ping_database=False,
-            )
-        else:
-            yield DirectTransport(
-                session,
-                check_alembic_version=False,
-                ping_database=False,
+    settings: ServerSettings | None = getattr(state, "settings", None)
+    pool_settings = settings.database_pool if settings is not None else None
+    versioning_settings = settings.database_versioning if settings is not None else None
+
+    # there is no async sqlite driver among our dependencies,
+    # sqlite platforms are always accessed synchronously
+    if (
+        settings is not None
+        and settings.database_execution == "async"
+        and dsn.startswith("postgresql")
+    ):
+        async with yield_async_session(
+            dsn, pool_settings, versioning_settings
+        ) as async_session:
+            yield build_transport(
+                async_session.sync_session, platform, request, async_session
             )
+    else:
+        async with yield_session(dsn, pool_settings, versioning_settings) as session:
+            yield build_transport(session, platform, request)
 
 
 async def get_backend(transport: DirectTransport) -> AsyncGenerator[Backend, None]:
@@ -255,5 +339,12 @@ class V1HttpApi:
             app.state.manager_client = None
             app.state.manager_platforms = None
 
+        if self.settings.result_cache.enabled:
+            app.state.result_cache = ResultCache.from_settings(
+                self.settings.result_cache
+            )
+        else:
+            app.state.result_cache = None
+
         app.state.toml_platforms = self.settings.get_toml_platforms()
         app.state.settings = self.settings
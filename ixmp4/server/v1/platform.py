@@ -11,6 +11,7 @@ from ixmp4._version import __version__ as __version__
 from ixmp4.conf.platforms import (
     PlatformConnectionInfo,
 )
+from ixmp4.data.dataframe import JSON_MEDIA_TYPE, get_wire_formats
 
 
 class PlatformInfo(pyd.BaseModel):
@@ -20,6 +21,8 @@ class PlatformInfo(pyd.BaseModel):
     is_managed: bool
     manager_url: pyd.HttpUrl | None
     utcnow: datetime
+    # servers predating arrow support do not send this field
+    wire_formats: list[str] = [JSON_MEDIA_TYPE]
 
 
 class PlatformAuthStatus(pyd.BaseModel):
@@ -49,6 +52,7 @@ class PlatformController(Controller):
                 is_managed=state.settings.manager_url is not None,
                 manager_url=state.settings.manager_url,
                 utcnow=datetime.now(tz=timezone.utc),
+                wire_formats=get_wire_formats(),
             )
         )
 
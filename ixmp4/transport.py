@@ -22,28 +22,44 @@ to :class:`~ixmp4.transport.HttpxTransport`.
 """
 
 import abc
+import contextlib
 import datetime as dt
+import hashlib
+import json
 import logging
+import threading
 import time
+import weakref
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from email.utils import parsedate_to_datetime
 from functools import lru_cache
-from typing import Any
+from typing import Any, Iterator
 
 import httpx
+import pydantic as pyd
 import sqlalchemy as sa
 from litestar import Litestar
 from litestar.testing import TestClient
 from sqlalchemy import orm
+from sqlalchemy.ext import asyncio as sa_asyncio
 from toolkit.auth.context import AuthorizationContext, PlatformProtocol
 from toolkit.client.auth import Auth, ManagerAuth, SelfSignedAuth
 from toolkit.client.base import ServiceClient
 
 from ixmp4.base_exceptions import ImproperlyConfigured
 from ixmp4.conf.platforms import resolve_dsn_env_tokens
-from ixmp4.conf.settings import ClientSettings, Settings
+from ixmp4.conf.settings import (
+    ClientSettings,
+    DatabasePoolSettings,
+    DatabaseVersioningSettings,
+    Settings,
+)
 from ixmp4.core.exceptions import OperationNotSupported, ProgrammingError
 from ixmp4.core.exceptions import registry as exception_registry
+from ixmp4.data.dataframe import JSON_MEDIA_TYPE, get_wire_formats
+from ixmp4.data.versions.ddl import GROUP_TRANSACTIONS_SETTING
 from ixmp4.db import get_alembic_controller
 
 from ._version import __version__
@@ -68,27 +84,155 @@ class Transport(abc.ABC):
 logger = logging.getLogger(__name__)
 
 
+class PoolMetrics(pyd.BaseModel):
+    """Connection counts of one or more database connection pools."""
+
+    size: int = 0
+    checked_in: int = 0
+    checked_out: int = 0
+    overflow: int = 0
+
+    def __add__(self, other: "PoolMetrics") -> "PoolMetrics":
+        return PoolMetrics(
+            size=self.size + other.size,
+            checked_in=self.checked_in + other.checked_in,
+            checked_out=self.checked_out + other.checked_out,
+            overflow=self.overflow + other.overflow,
+        )
+
+
+def get_pool_kwargs(settings: DatabasePoolSettings) -> dict[str, Any]:
+    """Translate connection pool settings to
+    :func:`sqlalchemy.create_engine` keyword arguments."""
+    if settings.poolclass == "null":
+        return {"poolclass": sa.NullPool}
+    elif settings.poolclass == "static":
+        return {"poolclass": sa.StaticPool}
+    else:
+        return {
+            "poolclass": sa.QueuePool,
+            "pool_size": settings.size,
+            "max_overflow": settings.max_overflow,
+            "pool_recycle": settings.recycle,
+            "pool_pre_ping": settings.pre_ping,
+            "pool_timeout": settings.timeout,
+        }
+
+
+def get_pool_metrics(engine: sa.Engine) -> PoolMetrics:
+    """Return the connection counts of *engine*'s pool. Only queue pools
+    keep track of their connections, other pools report zero connections."""
+    pool = engine.pool
+    if not isinstance(pool, sa.QueuePool):
+        return PoolMetrics()
+
+    return PoolMetrics(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        # negative while the pool has not yet opened `size` connections
+        overflow=max(pool.overflow(), 0),
+    )
+
+
+_cached_engines: "weakref.WeakSet[sa.Engine]" = weakref.WeakSet()
+
+
+def setup_engine(engine: sa.Engine, group_version_transactions: bool = False) -> None:
+    """Configure the connections of a PostgreSQL *engine* as they are opened.
+
+    Parameters
+    ----------
+    engine:
+        The engine, the sync engine of async engines.
+    group_version_transactions:
+        Whether to enable
+        :data:`~ixmp4.data.versions.ddl.GROUP_TRANSACTIONS_SETTING`
+        for the whole connection, so that the version triggers record all
+        changes of one database transaction under a single transaction id.
+    """
+    if engine.dialect.name != "postgresql" or not group_version_transactions:
+        return
+
+    @sa.event.listens_for(engine, "connect")
+    def set_group_version_transactions(
+        dbapi_connection: Any, connection_record: Any
+    ) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute(
+            "SELECT set_config(%s, 'on', false)", (GROUP_TRANSACTIONS_SETTING,)
+        )
+        cursor.close()
+        dbapi_connection.commit()
+
+
 @lru_cache()
-def cached_create_engine(dsn: str, **kwargs: Any) -> sa.Engine:
+def cached_create_engine(
+    dsn: str, group_version_transactions: bool = False, **kwargs: Any
+) -> sa.Engine:
     """Create and cache a SQLAlchemy engine for *dsn*.
 
     The result is memoized so that repeated calls with the same DSN reuse the
-    existing engine.
+    existing engine. Connections are not pooled unless pool arguments
+    (see :func:`get_pool_kwargs`) are passed.
 
     Parameters
     ----------
     dsn:
         Database connection string (SQLAlchemy DSN format).
+    group_version_transactions:
+        Passed on to :func:`setup_engine`.
     **kwargs:
         Additional keyword arguments forwarded to :func:`sqlalchemy.create_engine`.
     """
+    kwargs = {"poolclass": sa.NullPool, **kwargs}
     # max_identifier_length=63 to avoid exceeding postgres' default maximum
-    return sa.create_engine(
-        dsn, poolclass=sa.NullPool, max_identifier_length=63, **kwargs
+    engine = sa.create_engine(dsn, max_identifier_length=63, **kwargs)
+    setup_engine(engine, group_version_transactions)
+    _cached_engines.add(engine)
+    return engine
+
+
+def get_cached_engines_pool_metrics() -> PoolMetrics:
+    """Return the summed connection counts of all engines
+    created by :func:`cached_create_engine`."""
+    return sum(
+        (get_pool_metrics(engine) for engine in list(_cached_engines)),
+        PoolMetrics(),
     )
 
 
+@lru_cache()
+def cached_create_async_engine(
+    dsn: str, group_version_transactions: bool = False, **kwargs: Any
+) -> sa_asyncio.AsyncEngine:
+    """Create and cache an async SQLAlchemy engine for *dsn*.
+
+    Behaves like :func:`cached_create_engine`, queue pools are replaced
+    by their asyncio compatible counterpart.
+
+    Parameters
+    ----------
+    dsn:
+        Database connection string using an async driver,
+        e.g. ``postgresql+psycopg://``.
+    group_version_transactions:
+        Passed on to :func:`setup_engine`.
+    **kwargs:
+        Additional keyword arguments forwarded to
+        :func:`sqlalchemy.ext.asyncio.create_async_engine`.
+    """
+    kwargs = {"poolclass": sa.NullPool, **kwargs}
+    if kwargs["poolclass"] is sa.QueuePool:
+        kwargs["poolclass"] = sa.AsyncAdaptedQueuePool
+    engine = sa_asyncio.create_async_engine(dsn, max_identifier_length=63, **kwargs)
+    setup_engine(engine.sync_engine, group_version_transactions)
+    _cached_engines.add(engine.sync_engine)
+    return engine
+
+
 Session = orm.sessionmaker(autocommit=False, autoflush=False)
+AsyncSession = sa_asyncio.async_sessionmaker(autocommit=False, autoflush=False)
 
 
 class DirectTransport(Transport):
@@ -98,15 +242,22 @@ class DirectTransport(Transport):
     ----------
     session:
         The active SQLAlchemy ORM session used for all database operations.
+    async_session:
+        The :class:`~sqlalchemy.ext.asyncio.AsyncSession` wrapping ``session``
+        if the transport is backed by an async engine, ``None`` otherwise.
+        Database operations on such a transport must be run via
+        :meth:`~sqlalchemy.ext.asyncio.AsyncSession.run_sync`.
     """
 
     session: orm.Session
+    async_session: sa_asyncio.AsyncSession | None = None
 
     def __init__(
         self,
         session: orm.Session,
         ping_database: bool = True,
         check_alembic_version: bool = True,
+        async_session: sa_asyncio.AsyncSession | None = None,
     ):
         """Initialise the transport with an existing SQLAlchemy session.
 
@@ -120,8 +271,11 @@ class DirectTransport(Transport):
         check_alembic_version:
             When ``True`` (the default), the database migration version is
             compared to the newest revision known to this ixmp4 version.
+        async_session:
+            The async session ``session`` belongs to, if any.
         """
         self.session = session
+        self.async_session = async_session
         if ping_database:
             self.session.execute(sa.text("SELECT 1"))
 
@@ -142,7 +296,14 @@ class DirectTransport(Transport):
         return dsn
 
     @classmethod
-    def from_dsn(cls, dsn: str, *args: Any, **kwargs: Any) -> "DirectTransport":
+    def from_dsn(
+        cls,
+        dsn: str,
+        *args: Any,
+        pool_settings: DatabasePoolSettings | None = None,
+        versioning_settings: DatabaseVersioningSettings | None = None,
+        **kwargs: Any,
+    ) -> "DirectTransport":
         """Create a :class:`DirectTransport` from a connection-string DSN.
 
         The DSN is first passed through
@@ -156,6 +317,14 @@ class DirectTransport(Transport):
             Database connection string.
         *args:
             Positional arguments forwarded to the constructor.
+        pool_settings:
+            Connection pool configuration for PostgreSQL databases.
+            Falls back to the default :class:`~ixmp4.conf.settings.Settings`
+            when ``None``.
+        versioning_settings:
+            Versioning configuration for PostgreSQL databases.
+            Falls back to the default :class:`~ixmp4.conf.settings.Settings`
+            when ``None``.
         **kwargs:
             Keyword arguments forwarded to the constructor.
 
@@ -175,7 +344,15 @@ class DirectTransport(Transport):
         if dsn.startswith("sqlite"):
             engine = cls.create_sqlite_engine(dsn)
         elif dsn.startswith("postgresql"):
-            engine = cls.create_postgresql_engine(dsn)
+            if pool_settings is None:
+                pool_settings = Settings().database_pool
+            if versioning_settings is None:
+                versioning_settings = Settings().database_versioning
+            engine = cls.create_postgresql_engine(
+                dsn,
+                group_version_transactions=versioning_settings.group_transactions,
+                **get_pool_kwargs(pool_settings),
+            )
         else:
             raise ProgrammingError("Unsupported database dialect for DSN: " + dsn)
         session = Session(bind=engine)
@@ -183,8 +360,13 @@ class DirectTransport(Transport):
 
     @classmethod
     @lru_cache()
-    def create_postgresql_engine(cls, dsn: str) -> sa.Engine:
-        return sa.create_engine(dsn, poolclass=sa.StaticPool, max_identifier_length=63)
+    def create_postgresql_engine(
+        cls, dsn: str, group_version_transactions: bool = False, **kwargs: Any
+    ) -> sa.Engine:
+        kwargs = {"poolclass": sa.StaticPool, **kwargs}
+        engine = sa.create_engine(dsn, max_identifier_length=63, **kwargs)
+        setup_engine(engine, group_version_transactions)
+        return engine
 
     @classmethod
     @lru_cache()
@@ -212,6 +394,37 @@ class DirectTransport(Transport):
             database = self.session.bind.engine.url.database
             return f"dialect={dialect} database={database} host={host}"
 
+    def get_pool_metrics(self) -> PoolMetrics:
+        """Return the connection counts of the bound engine's pool."""
+        if self.session.bind is None:
+            return PoolMetrics()
+        else:
+            return get_pool_metrics(self.session.bind.engine)
+
+    def get_fork_engine(self) -> sa.Engine | None:
+        """Return the bound engine if it can serve sessions in parallel, i.e.
+        it is a PostgreSQL engine which does not share a single connection."""
+        if self.async_session is not None or self.session.bind is None:
+            return None
+        engine = self.session.bind.engine
+        if engine.dialect.name != "postgresql" or isinstance(
+            engine.pool, sa.StaticPool
+        ):
+            return None
+        return engine
+
+    def fork(self) -> "DirectTransport | None":
+        """Return a transport with a new session on the same engine for use in
+        another thread, or ``None`` if the engine cannot serve sessions in
+        parallel (see :meth:`get_fork_engine`).
+        Close the forked session, not the transport, when done."""
+        engine = self.get_fork_engine()
+        if engine is None:
+            return None
+        return DirectTransport(
+            Session(bind=engine), ping_database=False, check_alembic_version=False
+        )
+
     def close(self) -> None:
         """Roll back any open transaction, close the session, and dispose the engine."""
         self.session.rollback()
@@ -331,6 +544,7 @@ class AuthorizedTransport(DirectTransport):
         platform: PlatformProtocol,
         ping_database: bool = True,
         check_alembic_version: bool = True,
+        async_session: sa_asyncio.AsyncSession | None = None,
     ):
         """Initialise the transport.
 
@@ -346,17 +560,36 @@ class AuthorizedTransport(DirectTransport):
             Forwarded to :meth:`DirectTransport.__init__`.
         check_alembic_version:
             Forwarded to :meth:`DirectTransport.__init__`.
+        async_session:
+            Forwarded to :meth:`DirectTransport.__init__`.
         """
         super().__init__(
             session,
             ping_database=ping_database,
             check_alembic_version=check_alembic_version,
+            async_session=async_session,
         )
         self.auth_ctx = auth_ctx
         self.platform = platform
         # turn off extra checks so they are not run twice
         self.unauthorized_transport = DirectTransport(
-            session, ping_database=False, check_alembic_version=False
+            session,
+            ping_database=False,
+            check_alembic_version=False,
+            async_session=async_session,
+        )
+
+    def fork(self) -> "AuthorizedTransport | None":
+        """Like :meth:`DirectTransport.fork`, keeping the authorisation context."""
+        engine = self.get_fork_engine()
+        if engine is None:
+            return None
+        return AuthorizedTransport(
+            Session(bind=engine),
+            self.auth_ctx,
+            self.platform,
+            ping_database=False,
+            check_alembic_version=False,
         )
 
     def __str__(self) -> str:
@@ -366,6 +599,111 @@ class AuthorizedTransport(DirectTransport):
         )
 
 
+@dataclass
+class CachedResponse(object):
+    """Body and headers of a response the server tagged with ``etag``."""
+
+    etag: str
+    headers: list[tuple[str, str]]
+    content: bytes
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        response = httpx.Response(
+            200,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.content),
+            request=request,
+        )
+        response.read()
+        return response
+
+
+class ResponseCache(object):
+    """Keeps the most recently used responses carrying an entity tag,
+    at most ``max_size`` bytes in total. Used by :class:`HttpxTransport`
+    to send conditional requests and reuse the body of unchanged results."""
+
+    entries: "OrderedDict[str, CachedResponse]"
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_key(self, method: str, path: str, kwargs: dict[str, Any]) -> str:
+        """Returns a key identifying the request described by the arguments
+        of :meth:`HttpxTransport.request`."""
+        digest = hashlib.sha256()
+        parts = [
+            method.upper(),
+            path,
+            kwargs.get("params"),
+            kwargs.get("json"),
+            kwargs.get("headers"),
+        ]
+        digest.update(json.dumps(parts, sort_keys=True, default=str).encode())
+        content = kwargs.get("content")
+        if isinstance(content, bytes):
+            digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        if len(entry.content) > self.max_size:
+            return
+
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous.content)
+
+            self.entries[key] = entry
+            self.size += len(entry.content)
+            while self.size > self.max_size:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted.content)
+
+
+class RecordingByteStream(httpx.SyncByteStream):
+    """Passes through the raw body of a streamed response and keeps a copy
+    of it, unless it exceeds ``max_size`` bytes."""
+
+    def __init__(self, stream: httpx.SyncByteStream, max_size: int):
+        self.stream = stream
+        self.max_size = max_size
+        self.chunks: list[bytes] | None = []
+        self.size = 0
+        self.complete = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.stream:
+            if self.chunks is not None:
+                self.size += len(chunk)
+                if self.size > self.max_size:
+                    self.chunks = None
+                else:
+                    self.chunks.append(chunk)
+            yield chunk
+        self.complete = True
+
+    def close(self) -> None:
+        self.stream.close()
+
+    def get_content(self) -> bytes | None:
+        """Returns the recorded body or ``None`` if it was not read
+        completely or is too large."""
+        if not self.complete or self.chunks is None:
+            return None
+        return b"".join(self.chunks)
+
+
 class HttpxTransport(Transport, ServiceClient):
     """Transport that communicates with a remote ixmp4 server over HTTP.
 
@@ -386,6 +724,15 @@ class HttpxTransport(Transport, ServiceClient):
         Multiplier for the exponential back-off calculation.  Default: 0.5.
     backoff_exp_base:
         Base of the exponent used in back-off.  Default: 2.
+    wire_formats:
+        Media types the client accepts dataframes in, ordered by preference.
+    server_wire_formats:
+        Media types the server accepts dataframes in, as reported by
+        :meth:`check_root`.  Only JSON is assumed until then.
+    response_cache:
+        Responses tagged by the server, revalidated with ``If-None-Match``
+        when the same request is repeated.  ``None`` if
+        ``settings.response_cache_size`` is ``0``.
     """
 
     http_client: httpx.Client | TestClient[Litestar]
@@ -393,6 +740,9 @@ class HttpxTransport(Transport, ServiceClient):
     executor: ThreadPoolExecutor
     exception_registry = exception_registry
     direct: DirectTransport | None = None
+    wire_formats: list[str] = [JSON_MEDIA_TYPE]
+    server_wire_formats: list[str] = [JSON_MEDIA_TYPE]
+    response_cache: ResponseCache | None = None
 
     backoff_maximum = 16.0
     backoff_factor = 0.5
@@ -424,6 +774,12 @@ class HttpxTransport(Transport, ServiceClient):
         self.executor = ThreadPoolExecutor(max_workers=settings.concurrency)
         self.http_client = client
 
+        if settings.response_cache_size > 0:
+            self.response_cache = ResponseCache(settings.response_cache_size)
+
+        if settings.wire_format == "arrow":
+            self.wire_formats = get_wire_formats()
+
         if check_root:
             self.check_root()
 
@@ -434,6 +790,7 @@ class HttpxTransport(Transport, ServiceClient):
         the client and server ixmp4 versions match, and validates that the
         manager URL configured on the server matches the one used by the client
         (when :class:`~toolkit.client.auth.ManagerAuth` is in use).
+        Also records the dataframe wire formats supported by the server.
 
         Raises
         ------
@@ -445,6 +802,7 @@ class HttpxTransport(Transport, ServiceClient):
         res = self.request("GET", "/")
         self.raise_service_exception(res)
         root = PlatformInfo(**res.json())
+        self.server_wire_formats = root.wire_formats
 
         if __version__ != root.version:
             logger.warning(
@@ -555,6 +913,8 @@ class HttpxTransport(Transport, ServiceClient):
             raise_server_exceptions=raise_server_exceptions,
         )
         transport = cls(client, settings, check_root=False)
+        # the in-process app runs this very installation
+        transport.server_wire_formats = get_wire_formats()
         transport.direct = direct
         return transport
 
@@ -584,16 +944,27 @@ class HttpxTransport(Transport, ServiceClient):
             Additional keyword arguments forwarded to
             :meth:`httpx.Client.request`.
 
+        Responses carrying an ``ETag`` are kept in :attr:`response_cache`.
+        Repeated requests ask the server to only send the result if it
+        changed, ``HTTP 304`` responses are replaced by the kept response.
+
         Returns
         -------
         httpx.Response
             The first non-429 response, or the last response if the retry
             budget is exhausted.
         """
+        cache_key, cached = self.prepare_conditional_request(method, path, kwargs)
         max_retries = self.settings.retries
         for attempt in range(max_retries + 1):
             response = self.http_client.request(method, path, **kwargs)
             if response.status_code != 429 or attempt >= max_retries:
+                if response.status_code == 304 and cached is not None:
+                    return cached.to_response(response.request)
+
+                etag = self.get_cacheable_etag(response, cache_key)
+                if etag is not None and cache_key is not None:
+                    self.store_response(cache_key, etag, response, response.content)
                 return response
 
             delay = self.get_retry_delay_seconds(response, attempt)
@@ -605,6 +976,121 @@ class HttpxTransport(Transport, ServiceClient):
 
         raise AssertionError("Unreachable retry loop termination")
 
+    @contextlib.contextmanager
+    def stream(self, method: str, path: str, **kwargs: Any) -> Iterator[httpx.Response]:
+        """Issue an HTTP request without reading the response body up front.
+
+        Behaves like :meth:`request`, including retries on ``HTTP 429``,
+        but yields the response as soon as its headers arrive so the body
+        can be consumed incrementally. The response is closed when the
+        context manager exits.
+
+        Parameters
+        ----------
+        method:
+            HTTP method string (e.g. ``"GET"``, ``"POST"``).
+        path:
+            Path relative to the client's base URL.
+        **kwargs:
+            Additional keyword arguments forwarded to
+            :meth:`httpx.Client.stream`.
+        """
+        cache_key, cached = self.prepare_conditional_request(method, path, kwargs)
+        max_retries = self.settings.retries
+        for attempt in range(max_retries + 1):
+            with self.http_client.stream(method, path, **kwargs) as response:
+                if response.status_code != 429 or attempt >= max_retries:
+                    if response.status_code == 304 and cached is not None:
+                        yield cached.to_response(response.request)
+                        return
+
+                    etag = self.get_cacheable_etag(response, cache_key)
+                    if (
+                        etag is None
+                        or cache_key is None
+                        or self.response_cache is None
+                        or not isinstance(response.stream, httpx.SyncByteStream)
+                    ):
+                        yield response
+                        return
+
+                    recorder = RecordingByteStream(
+                        response.stream, self.response_cache.max_size
+                    )
+                    response.stream = recorder
+                    # not reached if the consumer fails or stops early
+                    yield response
+                    content = recorder.get_content()
+                    if content is not None:
+                        self.store_response(
+                            cache_key, etag, response, content, decoded=False
+                        )
+                    return
+
+                delay = self.get_retry_delay_seconds(response, attempt)
+            logger.warning(
+                f"Rate limited (429) for {method} {path}. "
+                f"Retrying in {delay:.2f}s ({attempt + 1}/{max_retries})."
+            )
+            time.sleep(delay)
+
+        raise AssertionError("Unreachable retry loop termination")
+
+    def prepare_conditional_request(
+        self, method: str, path: str, kwargs: dict[str, Any]
+    ) -> tuple[str | None, CachedResponse | None]:
+        """Looks up the cached response of the request and adds an
+        ``If-None-Match`` header to *kwargs* if there is one.
+
+        Returns
+        -------
+        tuple
+            The cache key of the request and the cached response, both
+            ``None`` if the response cache is disabled.
+        """
+        if self.response_cache is None:
+            return None, None
+
+        cache_key = self.response_cache.get_key(method, path, kwargs)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "If-None-Match": cached.etag,
+            }
+        return cache_key, cached
+
+    def get_cacheable_etag(
+        self, response: httpx.Response, cache_key: str | None
+    ) -> str | None:
+        if cache_key is None or response.status_code != 200:
+            return None
+        etag: str | None = response.headers.get("etag")
+        return etag
+
+    def store_response(
+        self,
+        cache_key: str,
+        etag: str,
+        response: httpx.Response,
+        content: bytes,
+        decoded: bool = True,
+    ) -> None:
+        """Keeps the body of *response* for later conditional requests.
+        *content* is the raw body if *decoded* is ``False``."""
+        if self.response_cache is None:
+            return
+
+        excluded = {"content-length"}
+        if decoded:
+            excluded |= {"content-encoding", "transfer-encoding"}
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in excluded
+        ]
+        self.response_cache.set(cache_key, CachedResponse(etag, headers, content))
+
     def get_retry_delay_seconds(self, response: httpx.Response, attempt: int) -> float:
         """Calculate the retry delay for a rate-limited response.
 
@@ -79,7 +79,7 @@ def assert_paginated_list(
 ) -> None:
     assert response_json["total"] == expected_count
     assert len(response_json["results"]) == expected_count
-    assert set(response_json["pagination"]) == {"limit", "offset"}
+    assert set(response_json["pagination"]) == {"limit", "offset", "after"}
 
 
 def assert_frame_payload(
@@ -1,5 +1,13 @@
 import contextlib
-from typing import Awaitable, Callable, Generator, Literal, Sequence, cast
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Literal,
+    Sequence,
+    cast,
+)
 
 import pytest
 import sqlalchemy as sa
@@ -11,6 +19,7 @@ from ixmp4.core.platform import Platform
 from ixmp4.data.backend import Backend
 from ixmp4.db.models import get_metadata
 from ixmp4.server import Ixmp4Server
+from ixmp4.server.v1 import yield_async_session
 from ixmp4.transport import (
     AuthorizedTransport,
     DirectTransport,
@@ -61,8 +70,78 @@ def build_ixmp4_server(settings: Settings) -> tuple[Ixmp4Server, _TransportRef]:
     return server, ref
 
 
-backend_choices = ("sqlite", "postgres", "rest-sqlite", "rest-postgres")
-BackendTypeStr = Literal["sqlite", "postgres", "rest-sqlite", "rest-postgres"]
+class _AsyncSessionRef:
+    """Mutable holder of the database and user of an async test server.
+    Like :class:`_TransportRef`, but every request opens its own session
+    on an async engine, as ``IXMP4_SERVER__DATABASE_EXECUTION=async``
+    does for PostgreSQL platforms.
+    """
+
+    dsn: str | None = None
+    auth_ctx: AuthorizationContext | None = None
+    platform_info: PlatformProtocol | None = None
+
+    def make_getter(self) -> "Callable[[], AsyncGenerator[DirectTransport, None]]":
+        ref = self
+
+        async def _get_transport() -> AsyncGenerator[DirectTransport, None]:
+            if ref.dsn is None:
+                raise RuntimeError(
+                    "_AsyncSessionRef has no dsn set; "
+                    "ensure a test transport is active."
+                )
+
+            async with yield_async_session(ref.dsn) as async_session:
+                if ref.auth_ctx is None:
+                    yield DirectTransport(
+                        async_session.sync_session,
+                        ping_database=False,
+                        check_alembic_version=False,
+                        async_session=async_session,
+                    )
+                else:
+                    assert ref.platform_info is not None
+                    yield AuthorizedTransport(
+                        async_session.sync_session,
+                        ref.auth_ctx,
+                        ref.platform_info,
+                        ping_database=False,
+                        check_alembic_version=False,
+                        async_session=async_session,
+                    )
+
+        return _get_transport
+
+
+def build_async_ixmp4_server(
+    settings: Settings,
+) -> tuple[Ixmp4Server, _AsyncSessionRef]:
+    """Build a single shared :class:`Ixmp4Server` running procedures on the
+    event loop together with its :class:`_AsyncSessionRef`.
+    """
+    ref = _AsyncSessionRef()
+    server = Ixmp4Server(
+        settings.server.model_copy(update={"database_execution": "async"}),
+        # litestar resolves async generators like the default `get_transport`
+        override_transport=cast(
+            Callable[[], Awaitable[DirectTransport]], ref.make_getter()
+        ),
+        debug=True,
+    )
+    server.simulate_startup()
+    return server, ref
+
+
+backend_choices = (
+    "sqlite",
+    "postgres",
+    "rest-sqlite",
+    "rest-postgres",
+    "rest-postgres-async",
+)
+BackendTypeStr = Literal[
+    "sqlite", "postgres", "rest-sqlite", "rest-postgres", "rest-postgres-async"
+]
 ScopeStr = Literal["session", "package", "module", "class", "function"]
 
 
@@ -224,6 +303,37 @@ def httpx_postgresql_transport(
             transport_ref.current = None
 
 
+@contextlib.contextmanager
+def httpx_async_postgresql_transport(
+    dsn: str,
+    *,
+    settings: Settings,
+    auth_ctx: AuthorizationContext | None,
+    platform_info: PlatformProtocol | None,
+    server: Ixmp4Server,
+    session_ref: _AsyncSessionRef,
+    create_tables: bool = True,
+) -> Generator[HttpxTransport, None, None]:
+    with postgresql_transport(
+        dsn,
+        settings=settings,
+        auth_ctx=auth_ctx,
+        platform_info=platform_info,
+        create_tables=create_tables,
+    ) as direct:
+        session_ref.dsn = dsn
+        session_ref.auth_ctx = auth_ctx
+        session_ref.platform_info = platform_info
+        try:
+            httpx_pgsql = HttpxTransport.from_asgi(server.asgi_app, settings.client)
+            httpx_pgsql.direct = direct
+            yield httpx_pgsql
+        finally:
+            session_ref.dsn = None
+            session_ref.auth_ctx = None
+            session_ref.platform_info = None
+
+
 def transport(
     request: pytest.FixtureRequest,
     create_tables: bool = True,
@@ -259,6 +369,17 @@ def transport(
             transport_ref=transport_ref,
             create_tables=create_tables,
         )
+    elif type == "rest-postgres-async":
+        server, session_ref = request.getfixturevalue("rest_postgres_async_server")
+        return httpx_async_postgresql_transport(
+            postgres_dsn,
+            settings=settings,
+            auth_ctx=auth_ctx,
+            platform_info=platform_info,
+            server=server,
+            session_ref=session_ref,
+            create_tables=create_tables,
+        )
     elif type == "sqlite":
         return sqlite_transport(
             settings=settings,
@@ -10,10 +10,20 @@ import sqlalchemy as sa
 from pytest_benchmark.fixture import BenchmarkFixture
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
+from toolkit.auth.context import AuthorizationContext
+from toolkit.auth.user import User
+from toolkit.db.executor import SessionExecutor
+from toolkit.manager.mock import MockManagerClient
+from toolkit.manager.models import Ixmp4Instance
 
 import ixmp4
+from ixmp4.core.iamc.data import IamcDataFacade
 from ixmp4.data.backend import Backend
-from ixmp4.transport import Transport
+from ixmp4.data.iamc.datapoint.repositories import (
+    PandasRepository as DataPointPandasRepository,
+)
+from ixmp4.server.middleware import RequestAuthorizationContext
+from ixmp4.transport import AuthorizedTransport, DirectTransport, Transport
 from tests import auth, backends
 from tests.base import TransportTest
 from tests.fixtures import get_csv_data
@@ -61,15 +71,10 @@ class BenchmarkDataMixin:
     def add_datapoints(
         self, platform: ixmp4.Platform, datapoints: pd.DataFrame
     ) -> None:
-        for run_tuple, rows in datapoints.groupby(
-            ["model", "scenario", "version"], group_keys=False
-        ):
-            model, scenario, version = run_tuple
-            run = platform.runs.get(
-                str(model), str(scenario), int(cast(np.int64, version))
-            )
-            with run.transact("Benchmark: Add DataPoints Full"):
-                run.iamc.add(rows.drop(columns=["model", "scenario", "version"]))
+        failures = platform.iamc.add(
+            datapoints, message="Benchmark: Add DataPoints Full"
+        )
+        assert failures == {}
 
     def remove_datapoints(
         self, platform: ixmp4.Platform, datapoints: pd.DataFrame
@@ -673,3 +678,368 @@ class TestRestAuthBenchmarks(
 
         result = benchmark.pedantic(run, args=(platform,), warmup_rounds=5, rounds=5)  # type: ignore[no-untyped-call]
         assert len(result) == 2446
+
+
+class TestDataPointUpsertBenchmarks(BenchmarkDataMixin, TransportTest):
+    """Compares the generic data frame upsert of the datapoint repository
+    with :meth:`PandasRepository.bulk_upsert`, which stages the rows with
+    ``COPY`` on PostgreSQL. Half of the rows are inserted and half updated
+    in each round. Both paths are identical on SQLite."""
+
+    platform = staticmethod(backends.get_platform_fixture(scope="class"))
+    key = ["time_series__id", "type", "step_year"]
+    n_variables = 200
+    n_years = 500
+
+    @pytest.fixture(scope="class")
+    def repository(self, platform: ixmp4.Platform) -> DataPointPandasRepository:
+        direct = self.get_unauthorized_direct_or_skip(platform.backend.transport)
+        platform.regions.create("World", "default")
+        platform.units.create("Unit")
+        run = platform.runs.create("Model", "Scenario")
+
+        variables = [f"Variable {i}" for i in range(self.n_variables)]
+        years = np.arange(1500, 1500 + self.n_years)
+        df = pd.DataFrame(
+            {
+                "region": "World",
+                "variable": np.repeat(variables, self.n_years),
+                "unit": "Unit",
+                "step_year": np.tile(years, self.n_variables),
+                "value": np.random.rand(self.n_variables * self.n_years),
+            }
+        )
+        with run.transact("Benchmark: Add DataPoints"):
+            run.iamc.add(df, type="ANNUAL")
+        return DataPointPandasRepository(SessionExecutor(direct.session))
+
+    @pytest.fixture(scope="class")
+    def existing_datapoints(
+        self, repository: DataPointPandasRepository
+    ) -> pd.DataFrame:
+        return repository.tabulate(columns=[*self.key, "value"])
+
+    @pytest.mark.benchmark(group="bulk_upsert_datapoints")
+    @pytest.mark.parametrize("method", ["upsert", "bulk_upsert"])
+    def test_bulk_upsert_datapoints_benchmark(
+        self,
+        profiled: ProfiledContextManager,
+        benchmark: BenchmarkFixture,
+        repository: DataPointPandasRepository,
+        existing_datapoints: pd.DataFrame,
+        method: str,
+    ) -> None:
+        upsert = getattr(repository, method)
+
+        def setup() -> tuple[tuple[pd.DataFrame], dict[str, Any]]:
+            repository.delete(existing_datapoints.iloc[::2], key=self.key)
+            df = existing_datapoints.assign(
+                value=np.random.rand(len(existing_datapoints))
+            )
+            return (df,), {}
+
+        def run(df: pd.DataFrame) -> None:
+            with profiled():
+                upsert(df, key=self.key)
+
+        benchmark.pedantic(run, setup=setup, rounds=3)  # type: ignore[no-untyped-call]
+        assert repository.count() == len(existing_datapoints)
+
+
+class TestRequestSetupBenchmarks:
+    """Benchmarks the per-request setup of the server, i.e. building an
+    authorized transport and backend for a request and calling the auth
+    check and instantiating the service of the requested procedure."""
+
+    @pytest.fixture(scope="class")
+    def engine(self) -> sa.Engine:
+        return DirectTransport.create_sqlite_engine("sqlite:///:memory:")
+
+    @pytest.mark.benchmark(group="request_setup")
+    @pytest.mark.parametrize(
+        "auth_ctx_class",
+        [AuthorizationContext, RequestAuthorizationContext],
+        ids=["plain", "memoized"],
+    )
+    def test_request_setup_benchmark(
+        self,
+        profiled: ProfiledContextManager,
+        benchmark: BenchmarkFixture,
+        engine: sa.Engine,
+        user_carina: User | None,
+        mock_manager_client: MockManagerClient,
+        platform_public: Ixmp4Instance,
+        auth_ctx_class: type[AuthorizationContext],
+    ) -> None:
+        def run() -> Backend:
+            with profiled():
+                auth_ctx = auth_ctx_class(user_carina, mock_manager_client)
+                transport = AuthorizedTransport(
+                    Session(bind=engine),
+                    auth_ctx,
+                    platform_public,
+                    ping_database=False,
+                    check_alembic_version=False,
+                )
+                backend = Backend(transport)
+                auth_ctx.has_view_permission(platform_public)
+                backend.iamc.datapoints
+                transport.session.close()
+                return backend
+
+        backend = benchmark.pedantic(run, rounds=100)  # type: ignore[no-untyped-call]
+        assert "runs" not in vars(backend)
+
+
+class TestConversionBenchmarks:
+    """Benchmarks the conversion between the standard IAMC format and
+    datapoint data frames for large frames mixing annual and datetime data."""
+
+    n_rows = 1_000_000
+
+    @pytest.fixture(scope="class")
+    def mixed_datapoints(self) -> pd.DataFrame:
+        is_annual = np.arange(self.n_rows) % 2 == 0
+        return pd.DataFrame(
+            {
+                "region": "Region",
+                "variable": "Variable",
+                "unit": "Unit",
+                "type": np.where(is_annual, "ANNUAL", "DATETIME"),
+                "step_year": pd.Series(
+                    2000 + np.arange(self.n_rows) % 100, dtype="Int64"
+                ).where(is_annual),
+                "step_datetime": pd.Series(
+                    pd.Timestamp("2000-01-01")
+                    + pd.to_timedelta(np.arange(self.n_rows) % 100, unit="h")
+                ).where(~is_annual),
+                "value": np.random.rand(self.n_rows),
+            }
+        )
+
+    @pytest.fixture(scope="class")
+    def mixed_input(self, mixed_datapoints: pd.DataFrame) -> pd.DataFrame:
+        return IamcDataFacade._convert_to_std_format(
+            mixed_datapoints.copy(), join_runs=False, join_run_id=False
+        )
+
+    @pytest.mark.benchmark(group="convert_to_std_format")
+    def test_convert_to_std_format_benchmark(
+        self,
+        profiled: ProfiledContextManager,
+        benchmark: BenchmarkFixture,
+        mixed_datapoints: pd.DataFrame,
+    ) -> None:
+        def setup() -> tuple[tuple[pd.DataFrame], dict[str, Any]]:
+            return (mixed_datapoints.copy(),), {}
+
+        def run(df: pd.DataFrame) -> pd.DataFrame:
+            with profiled():
+                return IamcDataFacade._convert_to_std_format(
+                    df, join_runs=False, join_run_id=False
+                )
+
+        result = benchmark.pedantic(run, setup=setup)  # type: ignore[no-untyped-call]
+        assert len(result) == self.n_rows
+
+    @pytest.mark.benchmark(group="split_time_col")
+    def test_split_time_col_benchmark(
+        self,
+        profiled: ProfiledContextManager,
+        benchmark: BenchmarkFixture,
+        mixed_input: pd.DataFrame,
+    ) -> None:
+        def setup() -> tuple[tuple[pd.DataFrame], dict[str, Any]]:
+            return (mixed_input.copy(),), {}
+
+        def run(df: pd.DataFrame) -> pd.DataFrame:
+            with profiled():
+                return IamcDataFacade._split_time_col(df)
+
+        result = benchmark.pedantic(run, setup=setup)  # type: ignore[no-untyped-call]
+        assert result["year"].notna().sum() == self.n_rows // 2
+
+
+class TestIndexSetBenchmarks:
+    """Benchmarks writing and reading the data of a large IndexSet."""
+
+    n_elements = 100_000
+
+    @pytest.fixture(scope="class")
+    def run(self, platform: ixmp4.Platform) -> ixmp4.Run:
+        return platform.runs.create("Model", "Scenario")
+
+    @pytest.mark.benchmark(group="indexset_add_data")
+    def test_indexset_add_data_benchmark(
+        self,
+        run: ixmp4.Run,
+        profiled: ProfiledContextManager,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        data = [f"node_{i}" for i in range(self.n_elements)]
+
+        def run_add_data() -> None:
+            with profiled():
+                with run.transact("Benchmark: Add IndexSet data"):
+                    indexset = run.optimization.indexsets.create("IndexSet")
+                    indexset.add_data(data)
+
+        benchmark.pedantic(run_add_data)  # type: ignore[no-untyped-call]
+
+    @pytest.mark.benchmark(group="indexset_get_data")
+    def test_indexset_get_data_benchmark(
+        self,
+        run: ixmp4.Run,
+        profiled: ProfiledContextManager,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        def run_get_data() -> list[int] | list[float] | list[str]:
+            with profiled():
+                return run.optimization.indexsets.get_by_name("IndexSet").data
+
+        data = benchmark.pedantic(run_get_data, rounds=3)  # type: ignore[no-untyped-call]
+        assert len(data) == self.n_elements
+
+
+class TestParameterBenchmarks:
+    """Benchmarks writing, appending to and reading the data of a large
+    Parameter."""
+
+    nodes = [f"node_{i}" for i in range(500)]
+    years = list(range(2000, 2100))
+
+    @pytest.fixture(scope="class")
+    def run(self, platform: ixmp4.Platform) -> ixmp4.Run:
+        platform.units.create("Unit")
+        run = platform.runs.create("Model", "Scenario")
+        with run.transact("Benchmark: Create IndexSets"):
+            # one more node for the appended row
+            run.optimization.indexsets.create("node").add_data(
+                [*self.nodes, "node_new"]
+            )
+            run.optimization.indexsets.create("year").add_data(self.years)
+        return run
+
+    @pytest.mark.benchmark(group="parameter_add_data")
+    def test_parameter_add_data_benchmark(
+        self,
+        run: ixmp4.Run,
+        profiled: ProfiledContextManager,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        data: pd.DataFrame = pd.MultiIndex.from_product(
+            [self.nodes, self.years], names=["node", "year"]
+        ).to_frame(index=False)
+        data = data.assign(values=1.0, units="Unit")
+
+        def run_add_data() -> None:
+            with profiled():
+                with run.transact("Benchmark: Add Parameter data"):
+                    parameter = run.optimization.parameters.create(
+                        "Parameter", constrained_to_indexsets=["node", "year"]
+                    )
+                    parameter.add_data(data)
+
+        benchmark.pedantic(run_add_data)  # type: ignore[no-untyped-call]
+
+    @pytest.mark.benchmark(group="parameter_append_data")
+    def test_parameter_append_data_benchmark(
+        self,
+        run: ixmp4.Run,
+        profiled: ProfiledContextManager,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        parameter = run.optimization.parameters.get_by_name("Parameter")
+        data = {
+            "node": ["node_new"],
+            "year": [2000],
+            "values": [2.0],
+            "units": ["Unit"],
+        }
+
+        def run_append_data() -> None:
+            with profiled():
+                with run.transact("Benchmark: Append Parameter data"):
+                    parameter.add_data(data)
+
+        benchmark.pedantic(run_append_data)  # type: ignore[no-untyped-call]
+
+    @pytest.mark.benchmark(group="parameter_get_data")
+    def test_parameter_get_data_benchmark(
+        self,
+        run: ixmp4.Run,
+        profiled: ProfiledContextManager,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        def run_get_data() -> dict[str, list[float] | list[int] | list[str]]:
+            with profiled():
+                return run.optimization.parameters.get_by_name("Parameter").data
+
+        data = benchmark.pedantic(run_get_data, rounds=3)  # type: ignore[no-untyped-call]
+        assert len(data["values"]) == len(self.nodes) * len(self.years) + 1
+
+
+class TestIndexSetCascadeBenchmarks:
+    """Benchmarks removing an element of an IndexSet that the items of a model
+    are constrained to, which removes their dependent data, too."""
+
+    nodes = [f"node_{i}" for i in range(50)]
+    technologies = [f"technology_{i}" for i in range(20)]
+    years = list(range(2020, 2070, 5))
+    items_per_type = 3
+
+    @pytest.fixture(scope="class")
+    def run(self, platform: ixmp4.Platform) -> ixmp4.Run:
+        platform.units.create("Unit")
+        run = platform.runs.create("Model", "Scenario")
+        indexsets: dict[str, list[str] | list[int]] = {
+            "node": self.nodes,
+            "technology": self.technologies,
+            "year": self.years,
+        }
+        index: pd.DataFrame = pd.MultiIndex.from_product(
+            list(indexsets.values()), names=list(indexsets.keys())
+        ).to_frame(index=False)
+        solution = index.assign(levels=1.0, marginals=0.0)
+
+        with run.transact("Benchmark: Create model"):
+            for name, data in indexsets.items():
+                run.optimization.indexsets.create(name).add_data(data)
+
+            names = list(indexsets.keys())
+            optimization = run.optimization
+            for i in range(self.items_per_type):
+                optimization.tables.create(
+                    f"Table {i}", constrained_to_indexsets=names
+                ).add_data(index)
+                optimization.parameters.create(
+                    f"Parameter {i}", constrained_to_indexsets=names
+                ).add_data(index.assign(values=1.0, units="Unit"))
+                optimization.variables.create(
+                    f"Variable {i}", constrained_to_indexsets=names
+                ).add_data(solution)
+                optimization.equations.create(
+                    f"Equation {i}", constrained_to_indexsets=names
+                ).add_data(solution)
+        return run
+
+    @pytest.mark.benchmark(group="indexset_remove_dependent_data")
+    def test_indexset_remove_dependent_data_benchmark(
+        self,
+        run: ixmp4.Run,
+        profiled: ProfiledContextManager,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        def run_remove_data() -> None:
+            with profiled():
+                with run.transact("Benchmark: Remove node"):
+                    node = run.optimization.indexsets.get_by_name("node")
+                    node.remove_data("node_0")
+
+        benchmark.pedantic(run_remove_data)  # type: ignore[no-untyped-call]
+
+        parameter = run.optimization.parameters.get_by_name("Parameter 0")
+        assert "node_0" not in parameter.data["node"]
+        assert len(parameter.data["node"]) == (
+            (len(self.nodes) - 1) * len(self.technologies) * len(self.years)
+        )
@@ -102,6 +102,33 @@ class TestSettings:
             creds_manager_client = settings.get_manager_client()
         assert isinstance(creds_manager_client.auth, SelfSignedAuth)
 
+    def test_database_pool_settings(
+        self, empty_env: None, temporary_directory: Path, tmp_working_directory: Path
+    ) -> None:
+        settings = Settings(storage_directory=temporary_directory)
+        assert settings.database_pool.poolclass == "static"
+        assert settings.server.database_pool.poolclass == "queue"
+        assert settings.database_versioning.group_transactions is False
+        assert settings.server.database_versioning.group_transactions is False
+
+        with mock.patch.dict(
+            os.environ,
+            {
+                "IXMP4_DATABASE_POOL__POOLCLASS": "queue",
+                "IXMP4_SERVER__DATABASE_POOL__SIZE": "20",
+                "IXMP4_SERVER__DATABASE_POOL__PRE_PING": "false",
+                "IXMP4_SERVER__DATABASE_VERSIONING__GROUP_TRANSACTIONS": "true",
+            },
+        ):
+            settings = Settings(storage_directory=temporary_directory)
+
+        assert settings.database_pool.poolclass == "queue"
+        assert settings.server.database_pool.poolclass == "queue"
+        assert settings.server.database_pool.size == 20
+        assert settings.server.database_pool.pre_ping is False
+        assert settings.database_versioning.group_transactions is False
+        assert settings.server.database_versioning.group_transactions is True
+
     def test_interactive(
         self, empty_env: None, temporary_directory: Path, tmp_working_directory: Path
     ) -> None:
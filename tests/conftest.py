@@ -8,7 +8,9 @@ import pytest
 from ixmp4.conf.settings import Settings
 from ixmp4.server import Ixmp4Server
 from tests.backends import (
+    _AsyncSessionRef,
     _TransportRef,
+    build_async_ixmp4_server,
     build_ixmp4_server,
 )
 from tests.backends import (
@@ -39,7 +41,7 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(
         "--backend",
         action="store",
-        default="sqlite,rest-sqlite,postgres,rest-postgres",
+        default="sqlite,rest-sqlite,postgres,rest-postgres,rest-postgres-async",
     )
     parser.addoption(
         "--postgres-dsn",
@@ -79,6 +81,17 @@ def rest_postgres_server(
     yield server, ref
 
 
+@pytest.fixture(scope="session")
+def rest_postgres_async_server(
+    settings: Settings,
+) -> Iterator[tuple[Ixmp4Server, _AsyncSessionRef]]:
+    """Single shared Ixmp4Server executing procedures against an async
+    PostgreSQL engine, see :func:`tests.backends.build_async_ixmp4_server`.
+    """
+    server, ref = build_async_ixmp4_server(settings)
+    yield server, ref
+
+
 @pytest.fixture(scope="session", autouse=True)
 def debug_logging(settings: Settings) -> None:
     settings.configure_logging("debug")
@@ -1,3 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Generator
+
 import numpy as np
 import pandas as pd
 import pandas.testing as pdt
@@ -10,6 +14,7 @@ import ixmp4
 from ixmp4.data.iamc.datapoint.type import Type
 from ixmp4.data.iamc.measurand.db import Measurand
 from ixmp4.data.versions.transaction import TransactionRepository
+from ixmp4.transport import HttpxTransport
 from tests import backends
 from tests.base import DataFrameTest
 from tests.custom_exception import CustomException
@@ -46,6 +51,18 @@ class IamcTest(DataFrameTest, PlatformTest):
             platform.regions.create("Region 2", "default"),
         ]
 
+    def to_batch_format(self, df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+        """Converts the result of `tabulate` to the columns of `iter_tabulate`."""
+        if "time" in df.columns:
+            time = df["time"].astype("object")
+            is_datetime = time.map(lambda t: isinstance(t, datetime))
+            df = df.assign(
+                year=time.where(~is_datetime), datetime=time.where(is_datetime)
+            )
+        return df.reindex(columns=columns).astype(
+            {"year": "Int64", "subannual": "object", "datetime": "datetime64[ns]"}
+        )
+
 
 class IamcDataTest(IamcTest):
     @pytest.fixture(scope="class")
@@ -84,6 +101,48 @@ class IamcDataTest(IamcTest):
         ret_platform = platform.iamc.tabulate(run={"default_only": False})
         pdt.assert_frame_equal(test_data_platform, ret_platform, check_like=True)
 
+    def test_iamc_data_iter_tabulate_after_add(
+        self,
+        platform: ixmp4.Platform,
+        run: ixmp4.Run,
+    ) -> None:
+        columns = [
+            "region",
+            "variable",
+            "unit",
+            "year",
+            "subannual",
+            "datetime",
+            "value",
+        ]
+        batches = list(run.iamc.iter_tabulate(batch_size=3))
+        assert all(len(batch) <= 3 for batch in batches)
+        # all batches have the same schema, whatever their datapoint types
+        assert all(batch.columns.tolist() == columns for batch in batches)
+        assert len({tuple(batch.dtypes) for batch in batches}) == 1
+        pdt.assert_frame_equal(
+            self.canonical_sort(self.to_batch_format(run.iamc.tabulate(), columns)),
+            self.canonical_sort(pd.concat(batches, ignore_index=True)),
+        )
+
+        platform_columns = ["model", "scenario", "version", *columns]
+        platform_batches = list(
+            platform.iamc.iter_tabulate(batch_size=3, run={"default_only": False})
+        )
+        assert all(len(batch) <= 3 for batch in platform_batches)
+        assert all(
+            batch.columns.tolist() == platform_columns for batch in platform_batches
+        )
+        pdt.assert_frame_equal(
+            self.canonical_sort(
+                self.to_batch_format(
+                    platform.iamc.tabulate(run={"default_only": False}),
+                    platform_columns,
+                )
+            ),
+            self.canonical_sort(pd.concat(platform_batches, ignore_index=True)),
+        )
+
     def test_iamc_data_facade_name_filter_shorthands(
         self,
         run: ixmp4.Run,
@@ -160,6 +219,7 @@ class IamcDataTest(IamcTest):
             self.canonical_sort(test_data_upsert),
             self.canonical_sort(ret),
             check_like=True,
+            check_dtype=False,
         )
 
         test_data_platform = test_data_upsert.copy()
@@ -263,6 +323,7 @@ class IamcDataRollbackTest(IamcTest):
             self.canonical_sort(test_data_add),
             self.canonical_sort(ret),
             check_like=True,
+            check_dtype=False,
         )
 
     def test_iamc_data_non_versioning_after_removal_failure(
@@ -277,6 +338,7 @@ class IamcDataRollbackTest(IamcTest):
             self.canonical_sort(test_data_remaining),
             self.canonical_sort(ret),
             check_like=True,
+            check_dtype=False,
         )
 
     def test_iamc_data_upsert_failure(
@@ -302,6 +364,7 @@ class IamcDataRollbackTest(IamcTest):
             self.canonical_sort(test_data_add),
             self.canonical_sort(ret),
             check_like=True,
+            check_dtype=False,
         )
 
     def test_iamc_data_non_versioning_after_upsert_failure(
@@ -315,6 +378,7 @@ class IamcDataRollbackTest(IamcTest):
             self.canonical_sort(test_data_upsert),
             self.canonical_sort(ret),
             check_like=True,
+            check_dtype=False,
         )
 
     def test_iamc_data_new_timeseries_failure(
@@ -340,6 +404,7 @@ class IamcDataRollbackTest(IamcTest):
             self.canonical_sort(test_data_add),
             self.canonical_sort(ret),
             check_like=True,
+            check_dtype=False,
         )
         pdt.assert_frame_equal(
             self.canonical_sort(self.expected_timeseries_df(test_data_add)),
@@ -362,6 +427,7 @@ class IamcDataRollbackTest(IamcTest):
             self.canonical_sort(expected),
             self.canonical_sort(ret),
             check_like=True,
+            check_dtype=False,
         )
         pdt.assert_frame_equal(
             self.canonical_sort(self.expected_timeseries_df(expected)),
@@ -392,6 +458,7 @@ class IamcDataRollbackTest(IamcTest):
             self.canonical_sort(test_data_add),
             self.canonical_sort(ret),
             check_like=True,
+            check_dtype=False,
         )
         pdt.assert_frame_equal(
             self.canonical_sort(self.expected_timeseries_df(test_data_add)),
@@ -410,6 +477,7 @@ class IamcDataRollbackTest(IamcTest):
             self.canonical_sort(test_data_upsert_after_full_timeseries_removal),
             self.canonical_sort(ret),
             check_like=True,
+            check_dtype=False,
         )
         pdt.assert_frame_equal(
             self.canonical_sort(
@@ -442,6 +510,7 @@ class IamcDataRollbackTest(IamcTest):
             self.canonical_sort(test_data_add),
             self.canonical_sort(ret),
             check_like=True,
+            check_dtype=False,
         )
 
     def test_iamc_data_revert_with_deleted_region_raises_not_found(
@@ -595,6 +664,31 @@ class TestIamcDataAnnualRollback(IamcDataAnnual, IamcDataRollbackTest):
     pass
 
 
+class TestIamcDataAnnualChunked(IamcDataAnnual, IamcDataTest):
+    @pytest.fixture(scope="class", autouse=True)
+    def small_upload_chunks(
+        self, platform: ixmp4.Platform
+    ) -> Generator[None, None, None]:
+        transport = platform.backend.transport
+        if not isinstance(transport, HttpxTransport):
+            self.skip_transport(transport, "does not upload in chunks")
+
+        # the test server shares one session between requests,
+        # so chunks must not actually be sent in parallel
+        chunk_size = transport.settings.default_upload_chunk_size
+        executor = transport.executor
+        transport.settings.default_upload_chunk_size = 3
+        transport.executor = ThreadPoolExecutor(max_workers=1)
+        yield
+        transport.executor.shutdown()
+        transport.executor = executor
+        transport.settings.default_upload_chunk_size = chunk_size
+
+    @pytest.fixture(scope="class")
+    def test_data_type(self) -> Type | None:
+        return None
+
+
 class TestIamcDataRunLock(IamcDataAnnual, IamcTest):
     def test_iamc_data_requires_lock(
         self,
@@ -650,6 +744,7 @@ class TestIamcDataStringType(IamcDataAnnual, IamcTest):
             self.canonical_sort(test_data_remaining),
             self.canonical_sort(ret),
             check_like=True,
+            check_dtype=False,
         )
 
     def test_invalid_string_type_raises(
@@ -722,6 +817,16 @@ class IamcDataInputTest(IamcTest):
             check_like=True,
         )
 
+        # batches of mixed types have the same schema as the others
+        batches = list(run.iamc.iter_tabulate(batch_size=2))
+        columns = batches[0].columns.tolist()
+        assert all(batch.columns.tolist() == columns for batch in batches)
+        assert len({tuple(batch.dtypes) for batch in batches}) == 1
+        pdt.assert_frame_equal(
+            self._canonical_sort_mixed_safe(self.to_batch_format(ret, columns)),
+            self._canonical_sort_mixed_safe(pd.concat(batches, ignore_index=True)),
+        )
+
         with run.transact("remove iamc input data"):
             run.iamc.remove(input_data.drop(columns=["value"]))
 
@@ -883,3 +988,168 @@ class TestObjectStringsIamcInputData(TestAnnualIamcInputData):
         input_df["unit"] = input_df["unit"].astype("object")
         input_df["variable"] = input_df["variable"].astype("object")
         return input_df
+
+
+class TestIamcDataDimensionIdCache(IamcTest):
+    @pytest.fixture(scope="class")
+    def test_data(
+        self, regions: list[ixmp4.Region], units: list[ixmp4.Unit]
+    ) -> pd.DataFrame:
+        return pd.DataFrame(
+            [
+                ["Region 1", "Variable 1", "Unit 1", 2020, 0.1],
+                ["Region 2", "Variable 1", "Unit 1", 2020, 0.2],
+                ["Region 1", "Variable 2", "Unit 2", 2020, 0.3],
+            ],
+            columns=["region", "variable", "unit", "year", "value"],
+        )
+
+    def test_iamc_data_add_caches_ids(
+        self, platform: ixmp4.Platform, run: ixmp4.Run, test_data: pd.DataFrame
+    ) -> None:
+        cache = platform.backend.iamc.dimension_ids
+        with run.transact("Add data"):
+            run.iamc.add(test_data)
+        # variables and measurands are created by the server
+        assert len(cache.regions) == 2
+        assert len(cache.measurands) == 0
+
+        with run.transact("Add data again"):
+            run.iamc.add(test_data.assign(value=1.0))
+        assert len(cache.measurands) == 2
+        assert len(cache.variables) == 2
+        assert len(cache.units) == 2
+
+        ret = run.iamc.tabulate()
+        pdt.assert_frame_equal(
+            self.canonical_sort(test_data.assign(value=1.0)),
+            self.canonical_sort(ret),
+            check_like=True,
+            check_dtype=False,
+        )
+
+    def test_iamc_data_add_stale_ids(
+        self, platform: ixmp4.Platform, run: ixmp4.Run, test_data: pd.DataFrame
+    ) -> None:
+        cache = platform.backend.iamc.dimension_ids
+        cache.regions.set("Region 1", 1_000)
+        cache.measurands.set(("Variable 1", "Unit 1"), 1_000)
+
+        with run.transact("Add data with stale ids"):
+            run.iamc.add(test_data.assign(value=2.0))
+        # stale ids are forgotten and the data is added by name
+        assert len(cache.regions) == 0
+        assert len(cache.measurands) == 0
+
+        ret = run.iamc.tabulate()
+        assert ret["value"].to_list() == [2.0, 2.0, 2.0]
+
+    def test_iamc_data_add_unknown_region(
+        self, platform: ixmp4.Platform, run: ixmp4.Run, test_data: pd.DataFrame
+    ) -> None:
+        with pytest.raises(ixmp4.Region.NotFound, match="Region 3"):
+            with run.transact("Add data with unknown region"):
+                run.iamc.add(test_data.assign(region="Region 3"))
+
+    def test_region_delete_invalidates_cache(
+        self, platform: ixmp4.Platform, run: ixmp4.Run, test_data: pd.DataFrame
+    ) -> None:
+        cache = platform.backend.iamc.dimension_ids
+        platform.regions.create("Region 3", "default")
+        with run.transact("Add data"):
+            run.iamc.add(test_data)
+        assert len(cache.regions) > 0
+
+        platform.regions.delete("Region 3")
+        assert len(cache.regions) == 0
+
+
+class TestPlatformIamcDataAdd(IamcTest):
+    @pytest.fixture(scope="class")
+    def test_data(
+        self, regions: list[ixmp4.Region], units: list[ixmp4.Unit]
+    ) -> pd.DataFrame:
+        return pd.DataFrame(
+            [
+                ["Model", "Scenario 1", "Region 1", "Variable 1", "Unit 1", 2020, 0.1],
+                ["Model", "Scenario 1", "Region 2", "Variable 2", "Unit 2", 2020, 0.2],
+                ["Model", "Scenario 2", "Region 1", "Variable 1", "Unit 1", 2020, 0.3],
+                ["Model", "Scenario 3", "Region 2", "Variable 2", "Unit 2", 2020, 0.4],
+                ["Model", "Scenario 3", "Region 2", "Variable 3", "Unit 1", 2020, 0.5],
+            ],
+            columns=[
+                "model",
+                "scenario",
+                "region",
+                "variable",
+                "unit",
+                "year",
+                "value",
+            ],
+        )
+
+    def test_platform_iamc_data_add(
+        self, platform: ixmp4.Platform, test_data: pd.DataFrame
+    ) -> None:
+        failures = platform.iamc.add(test_data, message="Add data", max_workers=2)
+        assert failures == {}
+
+        ret = platform.iamc.tabulate(run={"default_only": False})
+        pdt.assert_frame_equal(
+            self.canonical_sort(test_data),
+            self.canonical_sort(ret.drop(columns=["version"])),
+            check_like=True,
+            check_dtype=False,
+        )
+        for scenario in ["Scenario 1", "Scenario 2", "Scenario 3"]:
+            run = platform.runs.get("Model", scenario, version=1)
+            assert not run.owns_lock
+            checkpoints = run.checkpoints.tabulate()
+            assert checkpoints["message"].to_list() == ["Add data"]
+
+    def test_platform_iamc_data_add_version(
+        self, platform: ixmp4.Platform, test_data: pd.DataFrame
+    ) -> None:
+        test_data = test_data.assign(version=1, value=1.0)
+        test_data.loc[test_data["scenario"] == "Scenario 2", "version"] = 2
+        test_data.loc[test_data["scenario"] == "Scenario 3", "region"] = "Region 3"
+
+        failures = platform.iamc.add(test_data, max_workers=2)
+        assert set(failures.keys()) == {
+            ("Model", "Scenario 2", 2),
+            ("Model", "Scenario 3", 1),
+        }
+        assert isinstance(failures[("Model", "Scenario 2", 2)], ixmp4.Run.NotFound)
+        assert isinstance(failures[("Model", "Scenario 3", 1)], ixmp4.Region.NotFound)
+
+        ret = platform.iamc.tabulate(run={"default_only": False})
+        assert ret.groupby("scenario")["value"].sum().to_dict() == pytest.approx(
+            {"Scenario 1": 2.0, "Scenario 2": 0.3, "Scenario 3": 0.9}
+        )
+
+    def test_platform_iamc_data_add_missing_columns(
+        self, platform: ixmp4.Platform, test_data: pd.DataFrame
+    ) -> None:
+        with pytest.raises(ixmp4.core.exceptions.InvalidDataFrame, match="model"):
+            platform.iamc.add(test_data.drop(columns=["model"]))
+
+    def test_platform_iamc_data_add_missing_run_keys(
+        self, platform: ixmp4.Platform, test_data: pd.DataFrame
+    ) -> None:
+        runs = platform.runs.tabulate(default_only=False)
+        test_data = test_data.assign(version=1)
+        test_data.loc[0, "scenario"] = None
+        test_data.loc[1, "version"] = np.nan
+
+        with pytest.raises(ixmp4.core.exceptions.InvalidDataFrame, match="version"):
+            platform.iamc.add(test_data.assign(scenario="New Scenario"))
+        with pytest.raises(
+            ixmp4.core.exceptions.InvalidDataFrame, match="scenario, version"
+        ):
+            platform.iamc.add(test_data)
+        pdt.assert_frame_equal(runs, platform.runs.tabulate(default_only=False))
+
+    def test_platform_iamc_data_uses_platform_settings(
+        self, platform: ixmp4.Platform
+    ) -> None:
+        assert platform.iamc.settings is platform.settings.client
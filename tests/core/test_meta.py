@@ -288,3 +288,42 @@ class TestMetaRollback(MetaTest):
         assert run.meta == {"mstr": "foo", "mfloat": 3.14}
         assert run.meta["mstr"] == "foo"
         assert run.meta["mfloat"] == 3.14
+
+
+class TestMetaBuffer(MetaTest):
+    def test_meta_buffered_until_transact_exits(
+        self, platform: ixmp4.Platform, run: ixmp4.Run
+    ) -> None:
+        with run.transact("Add meta data"):
+            for i in range(20):
+                run.meta[f"mint{i}"] = i
+            run.meta["mstr"] = "foo"
+            run.meta["mstr"] = None
+            del run.meta["mint0"]
+
+            assert run.meta.pending["mint1"] == 1
+            assert run.meta["mint19"] == 19
+            assert "mstr" not in run.meta
+            assert "mint0" not in run.meta
+            assert platform.meta.tabulate(run__id=run.id).empty
+
+        expected = {f"mint{i}": i for i in range(1, 20)}
+        assert dict(run.meta) == expected
+        run2 = platform.runs.get("Model", "Scenario")
+        assert dict(run2.meta) == expected
+
+    def test_meta_flush(self, platform: ixmp4.Platform, run: ixmp4.Run) -> None:
+        with run.transact("Update meta data"):
+            del run.meta["mint1"]
+            run.meta["mint2"] = "bar"
+            run.meta.flush()
+
+            assert run.meta.pending == {}
+            ret = platform.meta.tabulate(run__id=run.id, key__in=["mint1", "mint2"])
+            assert ret["value"].to_list() == ["bar"]
+
+        assert "mint1" not in run.meta
+        assert run.meta["mint2"] == "bar"
+
+        with pytest.raises(ixmp4.Run.LockRequired):
+            run.meta.flush()
@@ -612,11 +612,10 @@ class TestParameterRollback(OptimizationParameterTest):
         self, non_versioning_platform: ixmp4.Platform, run: ixmp4.Run
     ) -> None:
         parameter = run.optimization.parameters.get_by_name("Parameter")
-        # NOTE: order is not preserved
         assert parameter.data == {
-            "units": ["Unit 1", "Unit 2", "Unit 2", "Unit 1", "Unit 2"],
-            "values": [1.2, -2.2, -3, 1.5, -9.59],
-            "IndexSet": ["do", "fa", "mi", "re", "so"],
+            "units": ["Unit 1", "Unit 1", "Unit 2", "Unit 2", "Unit 2"],
+            "values": [1.2, 1.5, -3, -2.2, -9.59],
+            "IndexSet": ["do", "re", "mi", "fa", "so"],
         }
 
     def test_parameter_remove_data_failure(self, run: ixmp4.Run) -> None:
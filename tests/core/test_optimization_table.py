@@ -512,7 +512,7 @@ class TestTableRollback(OptimizationTableTest):
     ) -> None:
         table = run.optimization.tables.get_by_name("Table")
         assert table.data == {
-            "IndexSet": ["do", "fa", "mi", "re", "so"],
+            "IndexSet": ["do", "re", "mi", "fa", "so"],
         }
 
     def test_table_remove_data_failure(self, run: ixmp4.Run) -> None:
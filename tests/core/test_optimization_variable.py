@@ -587,8 +587,8 @@ class TestVariableRollback(OptimizationVariableTest):
         variable = run.optimization.variables.get_by_name("Variable")
         assert variable.data == {
             "marginals": [-2, 1, 1, 1, 1],
-            "levels": [2, 4, 3, 1, 5],
-            "IndexSet": ["do", "fa", "mi", "re", "so"],
+            "levels": [2, 1, 3, 4, 5],
+            "IndexSet": ["do", "re", "mi", "fa", "so"],
         }
 
     def test_variable_remove_data_failure(self, run: ixmp4.Run) -> None:
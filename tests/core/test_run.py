@@ -267,6 +267,9 @@ class TestRunClone:
         assert cloned_run.scenario.name == run.scenario.name
         assert dict(cloned_run.meta) == test_data_meta
 
+        checkpoints = cloned_run.checkpoints.tabulate()
+        assert checkpoints["message"].to_list() == ["Clone run " + str(run)]
+
         cloned_df = cloned_run.iamc.tabulate()
         pdt.assert_frame_equal(cloned_df, test_data_iamc, check_like=True)
 
@@ -290,3 +293,59 @@ class TestRunClone:
 
         variable1 = cloned_run.optimization.variables.get_by_name("Variable 1")
         assert variable1.data == test_data_variable1
+
+    def test_clone_run_without_solution(
+        self,
+        run: ixmp4.Run,
+        test_data_iamc: pd.DataFrame,
+        test_data_parameter1: dict[str, list[Any]],
+    ) -> None:
+        cloned_run = run.clone(
+            model="Other Model", scenario="Other Scenario", keep_solution=False
+        )
+
+        assert cloned_run.model.name == "Other Model"
+        assert cloned_run.scenario.name == "Other Scenario"
+        assert cloned_run.version == 1
+
+        cloned_df = cloned_run.iamc.tabulate()
+        pdt.assert_frame_equal(cloned_df, test_data_iamc, check_like=True)
+
+        parameter1 = cloned_run.optimization.parameters.get_by_name("Parameter 1")
+        assert parameter1.data == test_data_parameter1
+        assert parameter1.indexset_names == ["IndexSet 1", "IndexSet 2"]
+
+        equation1 = cloned_run.optimization.equations.get_by_name("Equation 1")
+        assert equation1.data == {}
+        assert equation1.indexset_names == ["IndexSet 1", "IndexSet 2"]
+
+        variable1 = cloned_run.optimization.variables.get_by_name("Variable 1")
+        assert variable1.data == {}
+        assert variable1.indexset_names == ["IndexSet 1", "IndexSet 2"]
+
+        # the source run is left untouched
+        assert run.optimization.variables.get_by_name("Variable 1").data != {}
+
+    def test_remove_solution(
+        self,
+        run: ixmp4.Run,
+        test_data_parameter1: dict[str, list[Any]],
+    ) -> None:
+        cloned_run = run.clone(model="Solution Model")
+        assert run.optimization.has_solution()
+
+        with pytest.raises(ixmp4.Run.LockRequired):
+            run.optimization.remove_solution()
+
+        with run.transact("Remove solution"):
+            run.optimization.remove_solution()
+
+        assert not run.optimization.has_solution()
+        assert run.optimization.equations.get_by_name("Equation 1").data == {}
+        assert run.optimization.variables.get_by_name("Variable 1").data == {}
+
+        parameter1 = run.optimization.parameters.get_by_name("Parameter 1")
+        assert parameter1.data == test_data_parameter1
+
+        # other runs keep their solution
+        assert cloned_run.optimization.has_solution()
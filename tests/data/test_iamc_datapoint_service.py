@@ -9,16 +9,21 @@ from ixmp4.data.iamc.datapoint.service import DataPointService
 from ixmp4.data.iamc.datapoint.type import Type
 from ixmp4.data.iamc.reverter import DataPointReverterRepository
 from ixmp4.data.iamc.timeseries.service import TimeSeriesService
+from ixmp4.data.pagination import Streaming
+from ixmp4.data.region.exceptions import RegionNotFound
 from ixmp4.data.region.service import RegionService
 from ixmp4.data.run.dto import Run
 from ixmp4.data.run.service import RunService
+from ixmp4.data.unit.exceptions import UnitNotFound
 from ixmp4.data.unit.service import UnitService
 from ixmp4.data.versions.model import Operation
 from ixmp4.transport import Transport
 from tests import auth, backends
 from tests.data.base import ServiceTest
 
-transport = backends.get_transport_fixture(scope="class")
+transport = backends.get_transport_fixture(
+    backends=[*backends.default_backends, "rest-postgres-async"], scope="class"
+)
 
 
 class DataPointServiceTest(ServiceTest[DataPointService]):
@@ -248,6 +253,20 @@ class DataPointBulkOperationsTest(DataPointServiceTest):
         ret_df = service.tabulate(join_run_id=True)
         assert "run__id" in ret_df.columns
 
+    def test_datapoint_tabulate_streamed(
+        self,
+        transport: Transport,
+        expected_df: pd.DataFrame,
+    ) -> None:
+        direct = self.get_direct_or_skip(transport)
+        service = DataPointService(direct)
+
+        batches = list(service.streamed_tabulate(Streaming(batch_size=5)))
+        assert all(len(batch) <= 5 for batch in batches)
+
+        ret_df = pd.concat(batches, ignore_index=True)
+        pdt.assert_frame_equal(expected_df, ret_df, check_like=True)
+
     def test_datapoint_bulk_update(
         self,
         service: DataPointService,
@@ -282,12 +301,13 @@ class DataPointBulkOperationsTest(DataPointServiceTest):
         assert ret_df.empty
 
     @pytest.fixture(scope="class")
-    def tx_after_insert(self, test_df: pd.DataFrame) -> int:
-        return 16 + len(test_df)
+    def tx_after_insert(self) -> int:
+        # datapoints are inserted and updated with a single statement each
+        return 17
 
     @pytest.fixture(scope="class")
-    def tx_after_update(self, tx_after_insert: int, test_df: pd.DataFrame) -> int:
-        return tx_after_insert + len(test_df)
+    def tx_after_update(self, tx_after_insert: int) -> int:
+        return tx_after_insert + 1
 
     @pytest.fixture(scope="class")
     def tx_after_delete(self, tx_after_update: int) -> int:
@@ -616,6 +636,101 @@ class TestDataPointBulkOperationsInvalidData(DataPointServiceTest):
             service.bulk_delete(df_no_step_year)
 
 
+class TestDataPointIngest(DataPointServiceTest):
+    @pytest.fixture(scope="class")
+    def test_ingest_df(
+        self, run: Run, regions: RegionService, units: UnitService
+    ) -> pd.DataFrame:
+        self.create_related(regions, units)
+        return pd.DataFrame(
+            [
+                [run.id, "Region 1", "Variable 1", "Unit 1", 2000, 1.1],
+                [run.id, "Region 1", "Variable 1", "Unit 1", 2010, 1.3],
+                [run.id, "Region 1", "Variable 2", "Unit 2", 2000, 2.1],
+                [run.id, "Region 2", "Variable 1", "Unit 1", 2000, 3.1],
+            ],
+            columns=["run__id", "region", "variable", "unit", "step_year", "value"],
+        )
+
+    def test_datapoint_ingest(
+        self,
+        service: DataPointService,
+        timeseries: TimeSeriesService,
+        test_ingest_df: pd.DataFrame,
+    ) -> None:
+        service.ingest(test_ingest_df)
+        columns = ["region", "variable", "unit", "step_year", "value"]
+        ret_df = service.tabulate(join_parameters=True)[columns]
+        exp_df = test_ingest_df[columns].astype({"step_year": "Int64"})
+        pdt.assert_frame_equal(
+            exp_df.sort_values(columns, ignore_index=True),
+            ret_df.sort_values(columns, ignore_index=True),
+        )
+        assert len(timeseries.tabulate()) == 3
+
+        update_df = test_ingest_df.copy()
+        update_df["value"] = -1.0
+        service.ingest(update_df)
+        ret_df = service.tabulate()
+        assert len(ret_df) == 4
+        assert (ret_df["value"] == -1.0).all()
+        assert len(timeseries.tabulate()) == 3
+
+    def test_datapoint_ingest_invalid(
+        self, service: DataPointService, test_ingest_df: pd.DataFrame
+    ) -> None:
+        with pytest.raises(RegionNotFound):
+            service.ingest(test_ingest_df.assign(region="Region 3"))
+
+        with pytest.raises(UnitNotFound):
+            service.ingest(test_ingest_df.assign(unit="Unit 3"))
+
+        with pytest.raises(InvalidDataFrame):
+            service.ingest(test_ingest_df.assign(value=float("inf")))
+
+        with pytest.raises(InconsistentIamcType):
+            service.ingest(test_ingest_df.drop(columns=["step_year"]))
+
+    def test_datapoint_bulk_remove(
+        self,
+        service: DataPointService,
+        timeseries: TimeSeriesService,
+        test_ingest_df: pd.DataFrame,
+    ) -> None:
+        remove_df = test_ingest_df.drop(columns=["value"])
+        # rows of missing timeseries are skipped and nothing is created
+        missing_df = remove_df.assign(variable="Variable 3")
+        service.bulk_remove(pd.concat([remove_df.head(2), missing_df]))
+
+        ret_df = service.tabulate(join_parameters=True)
+        assert ret_df["variable"].tolist() == ["Variable 2", "Variable 1"]
+        assert ret_df["region"].tolist() == ["Region 1", "Region 2"]
+        ret_df = timeseries.tabulate(join_parameters=True)
+        assert len(ret_df) == 2
+        assert "Variable 3" not in ret_df["variable"].tolist()
+
+        service.bulk_remove(remove_df)
+        assert service.tabulate().empty
+        assert timeseries.tabulate().empty
+
+    def test_datapoint_bulk_delete_scoped_orphans(
+        self,
+        service: DataPointService,
+        timeseries: TimeSeriesService,
+        test_ingest_df: pd.DataFrame,
+    ) -> None:
+        # timeseries without datapoints are only removed if they are referenced
+        ts_columns = ["run__id", "region", "variable", "unit"]
+        timeseries.bulk_upsert(test_ingest_df[ts_columns].tail(1))
+        service.ingest(test_ingest_df.head(1))
+        assert len(timeseries.tabulate()) == 2
+
+        delete_df = service.tabulate()[["time_series__id", "type", "step_year"]]
+        service.bulk_delete(delete_df)
+        ret_df = timeseries.tabulate(join_parameters=True)
+        assert ret_df["region"].tolist() == ["Region 2"]
+
+
 class DataPointAuthTest(DataPointServiceTest):
     @pytest.fixture(scope="class")
     def runs(self, transport: Transport) -> RunService:
@@ -736,6 +851,20 @@ class TestDataPointAuthAlicePrivate(
         with pytest.raises(Forbidden):
             service.tabulate()
 
+    def test_datapoint_ingest(
+        self, service: DataPointService, test_ts_df: pd.DataFrame, run: Run
+    ) -> None:
+        ingest_df = test_ts_df.assign(run__id=run.id, step_year=2000, value=1.0)
+        with pytest.raises(Forbidden):
+            service.ingest(ingest_df)
+
+    def test_datapoint_bulk_remove(
+        self, service: DataPointService, test_ts_df: pd.DataFrame, run: Run
+    ) -> None:
+        remove_df = test_ts_df.assign(run__id=run.id, step_year=2000)
+        with pytest.raises(Forbidden):
+            service.bulk_remove(remove_df)
+
     def test_datapoint_bulk_delete(
         self,
         service: DataPointService,
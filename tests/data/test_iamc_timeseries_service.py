@@ -6,6 +6,7 @@ import pytest
 from toolkit.db.executor import SessionExecutor
 
 from ixmp4.base_exceptions import Forbidden, InvalidDataFrame
+from ixmp4.data.iamc.measurand.exceptions import MeasurandNotFound
 from ixmp4.data.iamc.timeseries.service import TimeSeriesService
 from ixmp4.data.iamc.variable.repositories import (
     ItemRepository as VariableRepository,
@@ -506,6 +507,73 @@ class TestTimeSeriesTabulateByDf(TimeSeriesServiceTest):
             service.tabulate_by_df(test_df_invalid)
 
 
+class TestTimeSeriesTabulateDimensionIds(TimeSeriesServiceTest):
+    def test_timeseries_tabulate_dimension_ids(
+        self,
+        service: TimeSeriesService,
+        run: Run,
+        regions: RegionService,
+        units: UnitService,
+    ) -> None:
+        self.create_related(regions, units)
+        service.bulk_upsert(
+            pd.DataFrame(
+                [[run.id, "Region 1", "Variable 1", "Unit 1"]],
+                columns=["run__id", "region", "variable", "unit"],
+            )
+        )
+
+        ret_df = service.tabulate_dimension_ids(
+            pd.DataFrame(
+                [
+                    ["Region 1", "Variable 1", "Unit 1"],
+                    ["Region 1", "Variable 1", "Unit 1"],
+                    ["Region 2", "Variable 1", "Unit 2"],
+                    ["Region 3", "Variable 2", "Unit 3"],
+                ],
+                columns=["region", "variable", "unit"],
+            )
+        )
+        expected = pd.DataFrame(
+            [
+                ["Region 1", "Variable 1", "Unit 1", 1, 1, 1, 1],
+                ["Region 2", "Variable 1", "Unit 2", 2, 2, 1, None],
+                ["Region 3", "Variable 2", "Unit 3", None, None, None, None],
+            ],
+            columns=[
+                "region",
+                "variable",
+                "unit",
+                "region__id",
+                "unit__id",
+                "variable__id",
+                "measurand__id",
+            ],
+        )
+        pdt.assert_frame_equal(
+            expected.astype(ret_df.dtypes.to_dict()), ret_df, check_like=True
+        )
+
+    def test_timeseries_bulk_upsert_ids_not_found(
+        self, service: TimeSeriesService, run: Run
+    ) -> None:
+        with pytest.raises(RegionNotFound, match="3"):
+            service.bulk_upsert(
+                pd.DataFrame(
+                    [[run.id, 3, 1]],
+                    columns=["run__id", "region__id", "measurand__id"],
+                )
+            )
+
+        with pytest.raises(MeasurandNotFound, match="2"):
+            service.bulk_upsert(
+                pd.DataFrame(
+                    [[run.id, 1, 2]],
+                    columns=["run__id", "region__id", "measurand__id"],
+                )
+            )
+
+
 class TimeSeriesAuthTest(TimeSeriesServiceTest):
     @pytest.fixture(scope="class")
     def runs(self, transport: Transport) -> RunService:
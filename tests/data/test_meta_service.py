@@ -1,4 +1,5 @@
 import datetime
+from typing import Any
 
 import pandas as pd
 import pandas.testing as pdt
@@ -9,8 +10,10 @@ from ixmp4.data.meta.dto import MetaValueType, RunMetaEntry
 from ixmp4.data.meta.exceptions import RunMetaEntryNotFound
 from ixmp4.data.meta.service import RunMetaEntryService
 from ixmp4.data.meta.type import Type
+from ixmp4.data.pagination import Pagination
 from ixmp4.data.run.dto import Run
 from ixmp4.data.run.service import RunService
+from ixmp4.data.services.procedure.endpoint import ProcedureRouteHandler
 from ixmp4.transport import Transport
 from tests import auth, backends
 from tests.data.base import ServiceTest
@@ -188,6 +191,42 @@ class TestRunMetaEntryTabulate(RunMetaEntryServiceTest):
         pdt.assert_frame_equal(metas, test_entries_df, check_like=True)
 
 
+class TestRunMetaEntryTabulatePages(RunMetaEntryServiceTest):
+    @pytest.fixture
+    def small_pages(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        get_pagination_params = ProcedureRouteHandler.get_pagination_params
+
+        def get_small_pagination_params(
+            handler: ProcedureRouteHandler[Any, Any, Any],
+            query_params: dict[str, Any],
+        ) -> Pagination:
+            return get_pagination_params(handler, {"limit": 3, **query_params})
+
+        monkeypatch.setattr(
+            ProcedureRouteHandler,
+            "get_pagination_params",
+            get_small_pagination_params,
+        )
+
+    def test_meta_tabulate_pages(
+        self,
+        service: RunMetaEntryService,
+        runs: RunService,
+        small_pages: None,
+    ) -> None:
+        run_ids = [runs.create("Model", f"Scenario {i}").id for i in range(3)]
+        for run__id in run_ids:
+            runs.set_as_default_version(run__id)
+        # ids are interleaved across runs, rows are ordered by run and key
+        for key in ["a", "b", "c"]:
+            for run__id in run_ids:
+                service.create(run__id, key, 1)
+
+        metas = service.tabulate().sort_values(["run__id", "key"])
+        assert metas["run__id"].tolist() == [id for id in run_ids for _ in range(3)]
+        assert metas["key"].tolist() == ["a", "b", "c"] * 3
+
+
 class TestRunMetaEntryBulkOperations(RunMetaEntryServiceTest):
     def test_meta_bulk_insert(
         self,
@@ -384,6 +384,22 @@ class TestIndexSetComplexData(IndexSetServiceTest):
             },
         )
 
+        table = tables.create(
+            run.id,
+            "Table 2",
+            constrained_to_indexsets=["IndexSet 1", "IndexSet 1"],
+            column_names=["From", "To"],
+        )
+        assert table.id == 2
+
+        tables.add_data(
+            table.id,
+            {
+                "From": ["do", "fa", "re"],
+                "To": ["re", "do", "so"],
+            },
+        )
+
     def test_link_variables(
         self,
         run: Run,
@@ -436,6 +452,11 @@ class TestIndexSetComplexData(IndexSetServiceTest):
             "IndexSet 1": ["ti", "do"],
             "IndexSet 2": [1, 3],
         }
+        table = tables.get_by_id(2)
+        assert table.data == {
+            "From": ["do", "re"],
+            "To": ["re", "so"],
+        }
 
         variable = variables.get_by_id(1)
         assert variable.data == {
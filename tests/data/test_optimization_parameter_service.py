@@ -1,4 +1,5 @@
 import datetime
+import json
 from typing import Any, cast
 
 import pandas as pd
@@ -86,7 +87,6 @@ class TestParameterCreate(ParameterServiceTest):
                     1,
                     run.id,
                     "Parameter",
-                    {},
                     fake_time.replace(tzinfo=None),
                     "@unknown",
                     5,
@@ -98,7 +98,6 @@ class TestParameterCreate(ParameterServiceTest):
                 "id",
                 "run__id",
                 "name",
-                "data",
                 "created_at",
                 "created_by",
                 "transaction_id",
@@ -165,21 +164,19 @@ class TestParameterDeleteById(ParameterServiceTest):
                     1,
                     run.id,
                     "Parameter",
-                    {},
                     fake_time.replace(tzinfo=None),
                     "@unknown",
                     5,
-                    8,
+                    9,
                     0,
                 ],
                 [
                     1,
                     run.id,
                     "Parameter",
-                    {},
                     fake_time.replace(tzinfo=None),
                     "@unknown",
-                    8,
+                    9,
                     None,
                     2,
                 ],
@@ -188,7 +185,6 @@ class TestParameterDeleteById(ParameterServiceTest):
                 "id",
                 "run__id",
                 "name",
-                "data",
                 "created_at",
                 "created_by",
                 "transaction_id",
@@ -296,21 +292,23 @@ class ParameterDataTest(ParameterServiceTest):
 
     def test_parameter_data_versioning(
         self,
-        versioning_service: IndexSetService,
+        versioning_service: ParameterService,
         run: Run,
         test_data_indexsets: list[IndexSet],
         test_data: dict[str, list[Any]] | pd.DataFrame,
-        remaining_test_data: dict[str, list[Any]] | pd.DataFrame,
+        partial_test_data: dict[str, list[Any]] | pd.DataFrame,
         fake_time: datetime.datetime,
     ) -> None:
         if isinstance(test_data, pd.DataFrame):
             test_data = cast(dict[str, list[Any]], test_data.to_dict(orient="list"))
 
-        if isinstance(remaining_test_data, pd.DataFrame):
-            remaining_test_data = cast(
-                dict[str, list[Any]], remaining_test_data.to_dict(orient="list")
+        if isinstance(partial_test_data, pd.DataFrame):
+            partial_test_data = cast(
+                dict[str, list[Any]], partial_test_data.to_dict(orient="list")
             )
 
+        index_columns = list(partial_test_data.keys())
+
         # compute transaction ids
         is_tx = (
             7 + len(test_data_indexsets) + sum(len(i.data) for i in test_data_indexsets)
@@ -320,41 +318,11 @@ class ParameterDataTest(ParameterServiceTest):
         rm_data_partial_tx = add_data_tx + 1
         rm_data_full_tx = rm_data_partial_tx + 1
 
+        # data changes are versioned per row, the parameter itself only once
         expected_versions = pd.DataFrame(
-            [
-                [
-                    {},
-                    create_tx,
-                    add_data_tx,
-                    0,
-                ],
-                [
-                    test_data,
-                    add_data_tx,
-                    rm_data_partial_tx,
-                    1,
-                ],
-                [
-                    remaining_test_data,
-                    rm_data_partial_tx,
-                    rm_data_full_tx,
-                    1,
-                ],
-                [
-                    {},
-                    rm_data_full_tx,
-                    None,
-                    1,
-                ],
-            ],
-            columns=[
-                "data",
-                "transaction_id",
-                "end_transaction_id",
-                "operation_type",
-            ],
+            [[create_tx, None, 0]],
+            columns=["transaction_id", "end_transaction_id", "operation_type"],
         )
-
         expected_versions["id"] = 1
         expected_versions["run__id"] = run.id
         expected_versions["name"] = "Parameter"
@@ -365,6 +333,38 @@ class ParameterDataTest(ParameterServiceTest):
         vdf = self.canonicalize_datetimes(vdf)
         pdt.assert_frame_equal(expected_versions, vdf, check_like=True)
 
+        removed_keys = [
+            json.dumps(list(key))
+            for key in zip(*[partial_test_data[c] for c in index_columns])
+        ]
+        record_columns = [c for c in test_data if c not in index_columns]
+        expected_data_versions = []
+        for i, key in enumerate(zip(*[test_data[c] for c in index_columns])):
+            json_key = json.dumps(list(key))
+            record = {c: test_data[c][i] for c in record_columns}
+            rm_tx = rm_data_partial_tx if json_key in removed_keys else rm_data_full_tx
+            expected_data_versions += [
+                [i + 1, json_key, record, add_data_tx, rm_tx, 0],
+                [i + 1, json_key, record, rm_tx, None, 2],
+            ]
+
+        expected_data_versions_df = pd.DataFrame(
+            expected_data_versions,
+            columns=[
+                "id",
+                "key",
+                "record",
+                "transaction_id",
+                "end_transaction_id",
+                "operation_type",
+            ],
+        )
+        expected_data_versions_df["parameter__id"] = 1
+
+        dvdf = versioning_service.data_versions.tabulate()
+        dvdf = dvdf.sort_values(["id", "transaction_id"], ignore_index=True)
+        pdt.assert_frame_equal(expected_data_versions_df, dvdf, check_like=True)
+
 
 class TestParameterData(ParameterDataTest):
     @pytest.fixture(scope="class")
@@ -512,6 +512,53 @@ class TestParameterDataDataFrame(ParameterDataTest):
         }
 
 
+class TestParameterUpdateData(ParameterServiceTest):
+    def test_parameter_update_data(
+        self,
+        service: ParameterService,
+        run: Run,
+        indexset: IndexSet,
+        indexsets: IndexSetService,
+        units: UnitService,
+    ) -> None:
+        indexsets.add_data(indexset.id, ["do", "re", "mi"])
+        units.create("Unit")
+        parameter = service.create(
+            run.id, "Parameter", constrained_to_indexsets=["IndexSet"]
+        )
+        service.add_data(
+            parameter.id,
+            {"IndexSet": ["do", "re"], "values": [1.0, 2.0], "units": ["Unit"] * 2},
+        )
+        service.add_data(
+            parameter.id,
+            {"IndexSet": ["re", "mi"], "values": [3.0, 4.0], "units": ["Unit"] * 2},
+        )
+
+        parameter = service.get_by_id(parameter.id)
+        assert parameter.data == {
+            "IndexSet": ["do", "re", "mi"],
+            "values": [1.0, 3.0, 4.0],
+            "units": ["Unit"] * 3,
+        }
+
+    def test_parameter_update_data_versioning(
+        self, versioning_service: ParameterService
+    ) -> None:
+        dvdf = versioning_service.data_versions.tabulate()
+        dvdf = dvdf.sort_values(["transaction_id", "id"], ignore_index=True)
+
+        # each statement of the second add_data writes all of its rows at once
+        add_tx, update_tx, insert_tx = dvdf["transaction_id"].unique()
+        assert dvdf["transaction_id"].to_list() == [
+            add_tx,
+            add_tx,
+            update_tx,
+            insert_tx,
+        ]
+        assert dvdf["id"].to_list() == [1, 2, 2, 3]
+
+
 class TestParameterInvalidData(ParameterServiceTest):
     def test_parameters_create(
         self,
@@ -641,6 +688,28 @@ class TestParameterInvalidData(ParameterServiceTest):
                 },
             )
 
+    def test_parameter_validate(
+        self, service: ParameterService, indexsets: IndexSetService, run: Run
+    ) -> None:
+        service.add_data(
+            1,
+            {
+                "values": [1.2, 1.5],
+                "units": ["Unit 1", "Unit 2"],
+                "IndexSet 1": ["do", "re"],
+                "IndexSet 2": [3, 1],
+            },
+        )
+        service.validate(1)
+
+        # Removing IndexSet data without dependent data leaves invalid rows
+        indexset = indexsets.get(run.id, "IndexSet 1")
+        indexsets.remove_data(indexset.id, "do", remove_dependent_data=False)
+        with pytest.raises(
+            ParameterDataInvalid, match="not allowed as per the IndexSets"
+        ):
+            service.validate(1)
+
 
 class TestParameterList(ParameterServiceTest):
     def test_parameter_list(
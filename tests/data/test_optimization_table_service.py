@@ -1,4 +1,5 @@
 import datetime
+import json
 from typing import Any, cast
 
 import pandas as pd
@@ -83,7 +84,6 @@ class TestTableCreate(TableServiceTest):
                     1,
                     run.id,
                     "Table",
-                    {},
                     fake_time.replace(tzinfo=None),
                     "@unknown",
                     5,
@@ -95,7 +95,6 @@ class TestTableCreate(TableServiceTest):
                 "id",
                 "run__id",
                 "name",
-                "data",
                 "created_at",
                 "created_by",
                 "transaction_id",
@@ -165,21 +164,19 @@ class TestTableDeleteById(TableServiceTest):
                     1,
                     run.id,
                     "Table",
-                    {},
                     fake_time.replace(tzinfo=None),
                     "@unknown",
                     5,
-                    8,
+                    9,
                     0,
                 ],
                 [
                     1,
                     run.id,
                     "Table",
-                    {},
                     fake_time.replace(tzinfo=None),
                     "@unknown",
-                    8,
+                    9,
                     None,
                     2,
                 ],
@@ -188,7 +185,6 @@ class TestTableDeleteById(TableServiceTest):
                 "id",
                 "run__id",
                 "name",
-                "data",
                 "created_at",
                 "created_by",
                 "transaction_id",
@@ -297,21 +293,23 @@ class TableDataTest(TableServiceTest):
 
     def test_table_data_versioning(
         self,
-        versioning_service: IndexSetService,
+        versioning_service: TableService,
         run: Run,
         test_data_indexsets: list[IndexSet],
         test_data: dict[str, list[Any]] | pd.DataFrame,
-        remaining_test_data: dict[str, list[Any]] | pd.DataFrame,
+        partial_test_data: dict[str, list[Any]] | pd.DataFrame,
         fake_time: datetime.datetime,
     ) -> None:
         if isinstance(test_data, pd.DataFrame):
             test_data = cast(dict[str, list[Any]], test_data.to_dict(orient="list"))
 
-        if isinstance(remaining_test_data, pd.DataFrame):
-            remaining_test_data = cast(
-                dict[str, list[Any]], remaining_test_data.to_dict(orient="list")
+        if isinstance(partial_test_data, pd.DataFrame):
+            partial_test_data = cast(
+                dict[str, list[Any]], partial_test_data.to_dict(orient="list")
             )
 
+        index_columns = list(partial_test_data.keys())
+
         # compute transaction ids
         is_tx = (
             5 + len(test_data_indexsets) + sum(len(i.data) for i in test_data_indexsets)
@@ -321,41 +319,11 @@ class TableDataTest(TableServiceTest):
         rm_data_partial_tx = add_data_tx + 1
         rm_data_full_tx = rm_data_partial_tx + 1
 
+        # data changes are versioned per row, the table itself only once
         expected_versions = pd.DataFrame(
-            [
-                [
-                    {},
-                    create_tx,
-                    add_data_tx,
-                    0,
-                ],
-                [
-                    test_data,
-                    add_data_tx,
-                    rm_data_partial_tx,
-                    1,
-                ],
-                [
-                    remaining_test_data,
-                    rm_data_partial_tx,
-                    rm_data_full_tx,
-                    1,
-                ],
-                [
-                    {},
-                    rm_data_full_tx,
-                    None,
-                    1,
-                ],
-            ],
-            columns=[
-                "data",
-                "transaction_id",
-                "end_transaction_id",
-                "operation_type",
-            ],
+            [[create_tx, None, 0]],
+            columns=["transaction_id", "end_transaction_id", "operation_type"],
         )
-
         expected_versions["id"] = 1
         expected_versions["run__id"] = run.id
         expected_versions["name"] = "Table"
@@ -366,6 +334,38 @@ class TableDataTest(TableServiceTest):
         vdf = self.canonicalize_datetimes(vdf)
         pdt.assert_frame_equal(expected_versions, vdf, check_like=True)
 
+        removed_keys = [
+            json.dumps(list(key))
+            for key in zip(*[partial_test_data[c] for c in index_columns])
+        ]
+        record_columns = [c for c in test_data if c not in index_columns]
+        expected_data_versions = []
+        for i, key in enumerate(zip(*[test_data[c] for c in index_columns])):
+            json_key = json.dumps(list(key))
+            record = {c: test_data[c][i] for c in record_columns}
+            rm_tx = rm_data_partial_tx if json_key in removed_keys else rm_data_full_tx
+            expected_data_versions += [
+                [i + 1, json_key, record, add_data_tx, rm_tx, 0],
+                [i + 1, json_key, record, rm_tx, None, 2],
+            ]
+
+        expected_data_versions_df = pd.DataFrame(
+            expected_data_versions,
+            columns=[
+                "id",
+                "key",
+                "record",
+                "transaction_id",
+                "end_transaction_id",
+                "operation_type",
+            ],
+        )
+        expected_data_versions_df["table__id"] = 1
+
+        dvdf = versioning_service.data_versions.tabulate()
+        dvdf = dvdf.sort_values(["id", "transaction_id"], ignore_index=True)
+        pdt.assert_frame_equal(expected_data_versions_df, dvdf, check_like=True)
+
 
 class TestTableData(TableDataTest):
     @pytest.fixture(scope="class")
@@ -546,6 +546,24 @@ class TestTableInvalidData(TableServiceTest):
                 },
             )
 
+    def test_table_validate(
+        self, service: TableService, indexsets: IndexSetService, run: Run
+    ) -> None:
+        service.add_data(
+            1,
+            {
+                "IndexSet 1": ["do", "re"],
+                "IndexSet 2": [3, 1],
+            },
+        )
+        service.validate(1)
+
+        # Removing IndexSet data without dependent data leaves invalid rows
+        indexset = indexsets.get(run.id, "IndexSet 1")
+        indexsets.remove_data(indexset.id, "do", remove_dependent_data=False)
+        with pytest.raises(TableDataInvalid, match="not allowed as per the IndexSets"):
+            service.validate(1)
+
 
 class TestTableList(TableServiceTest):
     def test_table_list(
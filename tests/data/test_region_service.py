@@ -3,10 +3,14 @@ import datetime
 import pandas as pd
 import pandas.testing as pdt
 import pytest
+import sqlalchemy as sa
 
 from ixmp4.base_exceptions import Forbidden
+from ixmp4.data.region.db import Region
 from ixmp4.data.region.exceptions import RegionNotFound, RegionNotUnique
 from ixmp4.data.region.service import RegionService
+from ixmp4.data.versions.ddl import GROUP_TRANSACTIONS_SETTING
+from ixmp4.transport import Transport
 from tests import auth, backends
 from tests.data.base import ServiceTest
 
@@ -196,6 +200,74 @@ class TestRegionGetOrCreate(RegionServiceTest):
         pdt.assert_frame_equal(expected_versions, vdf, check_like=True)
 
 
+class TestRegionGroupVersionTransactions(RegionServiceTest):
+    def test_region_grouped_versioning(
+        self,
+        transport: Transport,
+        versioning_service: RegionService,
+        fake_time: datetime.datetime,
+    ) -> None:
+        session = self.get_direct_or_skip(transport).session
+        set_grouping = sa.text("SELECT set_config(:name, :value, false)")
+        session.execute(
+            set_grouping, {"name": GROUP_TRANSACTIONS_SETTING, "value": "on"}
+        )
+        session.commit()
+
+        try:
+            creation_info = {
+                "created_at": fake_time.replace(tzinfo=None),
+                "created_by": "@unknown",
+            }
+            session.execute(
+                sa.insert(Region).values(
+                    name="Region", hierarchy="Hierarchy", **creation_info
+                )
+            )
+            session.execute(
+                sa.update(Region)
+                .where(Region.name == "Region")
+                .values(hierarchy="Other Hierarchy")
+            )
+            session.execute(
+                sa.insert(Region).values(
+                    name="Other", hierarchy="Hierarchy", **creation_info
+                )
+            )
+            session.execute(sa.delete(Region).where(Region.name == "Other"))
+            session.commit()
+
+            versioning_service.delete_by_id(1)
+        finally:
+            session.execute(
+                set_grouping, {"name": GROUP_TRANSACTIONS_SETTING, "value": "off"}
+            )
+            session.commit()
+
+        expected_versions = pd.DataFrame(
+            [
+                [1, "Region", "Other Hierarchy", 1, 2, 0],
+                [1, "Region", "Other Hierarchy", 2, None, 2],
+                [2, "Other", "Hierarchy", 1, None, 2],
+            ],
+            columns=[
+                "id",
+                "name",
+                "hierarchy",
+                "transaction_id",
+                "end_transaction_id",
+                "operation_type",
+            ],
+        )
+        vdf = versioning_service.versions.tabulate()
+        pdt.assert_frame_equal(
+            expected_versions,
+            vdf[expected_versions.columns],
+            check_like=True,
+            check_dtype=False,
+        )
+
+
 class TestRegionList(RegionServiceTest):
     def test_region_list(
         self, service: RegionService, fake_time: datetime.datetime
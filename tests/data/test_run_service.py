@@ -3,14 +3,24 @@ import datetime
 import pandas as pd
 import pandas.testing as pdt
 import pytest
+import sqlalchemy as sa
+from sqlalchemy import orm
 
 from ixmp4.base_exceptions import Forbidden
+from ixmp4.data.checkpoint.service import CheckpointService
+from ixmp4.data.meta.service import RunMetaEntryService
+from ixmp4.data.optimization.indexset.service import IndexSetService
+from ixmp4.data.optimization.table.service import TableService
+from ixmp4.data.region.db import Region
 from ixmp4.data.run.exceptions import NoDefaultRunVersion, RunNotFound
 from ixmp4.data.run.service import RunService
+from ixmp4.transport import Transport
 from tests import auth, backends
 from tests.data.base import ServiceTest
 
-transport = backends.get_transport_fixture(scope="class")
+transport = backends.get_transport_fixture(
+    backends=[*backends.default_backends, "rest-postgres-async"], scope="class"
+)
 
 
 class RunServiceTest(ServiceTest[RunService]):
@@ -338,6 +348,91 @@ class TestRunTabulate(RunServiceTest):
         pdt.assert_frame_equal(expected_runs, runs, check_like=True)
 
 
+class TestRunClone(RunServiceTest):
+    def test_run_clone(self, service: RunService, transport: Transport) -> None:
+        meta = RunMetaEntryService(transport)
+        indexsets = IndexSetService(transport)
+        tables = TableService(transport)
+
+        run = service.create("Model", "Scenario")
+        meta.create(run.id, "Key", "Value")
+        indexset = indexsets.create(run.id, "IndexSet")
+        indexsets.add_data(indexset.id, ["foo", "bar"])
+        table = tables.create(
+            run.id, "Table", ["IndexSet", "IndexSet"], column_names=["a", "b"]
+        )
+        tables.add_data(table.id, {"a": ["foo", "bar"], "b": ["bar", "foo"]})
+
+        cloned_run = service.clone(run.id, scenario_name="Cloned Scenario")
+        assert cloned_run.id == 2
+        assert cloned_run.model.name == "Model"
+        assert cloned_run.scenario.name == "Cloned Scenario"
+
+        assert meta.get(cloned_run.id, "Key").value == "Value"
+        cloned_indexset = indexsets.get(cloned_run.id, "IndexSet")
+        assert cloned_indexset.id != indexset.id
+        assert cloned_indexset.data == ["foo", "bar"]
+        cloned_table = tables.get(cloned_run.id, "Table")
+        assert cloned_table.indexset_names == ["IndexSet", "IndexSet"]
+        assert cloned_table.column_names == ["a", "b"]
+        assert cloned_table.data == {"a": ["foo", "bar"], "b": ["bar", "foo"]}
+
+    def test_run_clone_not_found(self, service: RunService) -> None:
+        with pytest.raises(RunNotFound):
+            service.clone(3)
+
+    def test_run_clone_checkpoint(
+        self, versioning_service: RunService, transport: Transport
+    ) -> None:
+        checkpoints = CheckpointService(transport)
+        cloned_run = versioning_service.clone(1, scenario_name="Other Scenario")
+
+        checkpoint = checkpoints.list(run__id=cloned_run.id)[0]
+        assert checkpoint.message == (
+            "Clone run <Run model='Model' scenario='Scenario' version=1 id=1>"
+        )
+        # the checkpoint references the transaction which copied the data
+        assert checkpoint.transaction__id == versioning_service.transactions.latest().id
+
+
+class TestRunTransactions(RunServiceTest):
+    def test_commit_state(self, versioning_service: RunService) -> None:
+        before = versioning_service.transactions.get_commit_state()
+        versioning_service.create("Model", "Scenario")
+        after = versioning_service.transactions.get_commit_state()
+
+        assert after != before
+        assert after[0] == versioning_service.transactions.latest().id
+
+    def test_commit_state_of_earlier_transaction(
+        self, versioning_service: RunService, transport: Transport
+    ) -> None:
+        url = self.get_direct_or_skip(transport).get_database_url()
+        assert url is not None
+        engine = sa.create_engine(url, poolclass=sa.NullPool)
+
+        with orm.Session(engine) as other_session:
+            # draws a transaction id, but does not commit yet
+            other_session.execute(
+                sa.insert(Region).values(
+                    name="Region",
+                    hierarchy="Hierarchy",
+                    created_at=datetime.datetime.now(),
+                    created_by="@unknown",
+                )
+            )
+            versioning_service.create("Model", "Other Scenario")
+            before = versioning_service.transactions.get_commit_state()
+            other_session.commit()
+
+        after = versioning_service.transactions.get_commit_state()
+        engine.dispose()
+
+        # the latest transaction id is still the same
+        assert after[0] == before[0]
+        assert after != before
+
+
 class TestRunAuthSarahPrivate(auth.SarahTest, auth.PrivatePlatformTest, RunServiceTest):
     def test_run_create(self, service: RunService) -> None:
         run = service.create("Model", "Scenario")
@@ -433,6 +528,10 @@ class TestRunAuthAlicePrivate(auth.AliceTest, auth.PrivatePlatformTest, RunServi
             service.unlock(1)
         unauthorized_service.unlock(1)
 
+    def test_run_clone(self, service: RunService) -> None:
+        with pytest.raises(RunNotFound):
+            service.clone(1)
+
     def test_run_revert(self, versioning_service: RunService) -> None:
         with pytest.raises(RunNotFound):
             versioning_service.revert(1, 12)
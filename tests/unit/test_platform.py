@@ -12,6 +12,8 @@ from ixmp4.base_exceptions import ImproperlyConfigured, PlatformNotFound
 from ixmp4.conf.platforms import PlatformConnectionInfo
 from ixmp4.conf.settings import Settings
 from ixmp4.core.platform import Platform
+from ixmp4.data.backend import Backend
+from ixmp4.data.region.service import RegionService
 from ixmp4.transport import Transport
 
 
@@ -56,7 +58,9 @@ def patch_platform_dependencies(monkeypatch: pytest.MonkeyPatch) -> type:
         monkeypatch.setattr(
             platform_module,
             attr,
-            lambda backend, attr=attr: SimpleNamespace(name=attr, backend=backend),
+            lambda backend, attr=attr, **kwargs: SimpleNamespace(
+                name=attr, backend=backend, **kwargs
+            ),
         )
 
     return FakeBackend
@@ -368,3 +372,20 @@ def test_platform_overrides_settings(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert platform.settings is ovr_settings
     assert platform.settings.manager_url == ovr_settings.manager_url
+
+
+def test_backend_instantiates_services_on_first_access() -> None:
+    transport = DummyTransport()
+    backend = Backend(transport)
+
+    assert "regions" not in vars(backend)
+    assert "datapoints" not in vars(backend.iamc)
+    assert "scalars" not in vars(backend.optimization)
+
+    regions = backend.regions
+    assert isinstance(regions, RegionService)
+    assert regions.transport is transport
+    assert backend.regions is regions
+    assert "runs" not in vars(backend)
+
+    assert backend.iamc.dimension_ids.timeseries is backend.iamc.timeseries
@@ -1,11 +1,16 @@
 import asyncio
 from types import SimpleNamespace
 
+import polars as pl
 import pytest
 from httpx import ConnectError
+from toolkit.auth.user import User
 
 from ixmp4.core.exceptions import ServiceUnavailable
-from ixmp4.server.middleware import AuthenticationMiddleware
+from ixmp4.server.middleware import (
+    AuthenticationMiddleware,
+    RequestAuthorizationContext,
+)
 
 
 class TestAuthenticationMiddleware:
@@ -30,3 +35,41 @@ class TestAuthenticationMiddleware:
                 await middleware.authenticate_request(connection)  # type: ignore[arg-type]
 
         asyncio.run(_run())
+
+    def test_get_auth_context_memoizes_permissions(self) -> None:
+        calls: list[dict[str, object]] = []
+
+        def cached_tabulate(**kwargs: object) -> pl.DataFrame:
+            calls.append(kwargs)
+            return pl.DataFrame({"model": ["Model*"], "access_type": ["VIEW"]})
+
+        manager_client = SimpleNamespace(
+            url="https://manager.test",
+            model_permissions=SimpleNamespace(cached_tabulate=cached_tabulate),
+        )
+        user = User(
+            id=1,
+            username="user",
+            email="user@example.test",
+            groups=[],
+            is_superuser=False,
+            is_staff=False,
+            is_verified=True,
+        )
+        platform = SimpleNamespace(id=1, accessibility="PRIVATE")
+        other_platform = SimpleNamespace(id=2, accessibility="PRIVATE")
+
+        middleware = AuthenticationMiddleware(app=None, secret_hs256=None)  # type: ignore[arg-type]
+        auth_ctx = middleware.get_auth_context(
+            SimpleNamespace(user=user),  # type: ignore[arg-type]
+            manager_client,  # type: ignore[arg-type]
+        )
+        assert isinstance(auth_ctx, RequestAuthorizationContext)
+
+        perms = auth_ctx.tabulate_permissions(platform)
+        assert perms["like"].to_list() == ["Model%"]
+        assert auth_ctx.tabulate_permissions(platform) is perms
+        assert len(calls) == 1
+
+        auth_ctx.tabulate_permissions(other_platform)
+        assert len(calls) == 2